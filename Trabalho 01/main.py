@@ -6,10 +6,10 @@ import random as rd
 import tracemalloc
 
 import matplotlib.pyplot as plt
-import psutil as p
 from avltree import AVLTree
 from constants import METRICS
 from hashtableextended import HashTable
+from timing import measure
 from unbaltree import UnBalTree
 from utils import generate_data, get_dict, sequential_search, gen_hashtable_samples
 
@@ -26,7 +26,9 @@ args = parser.parse_args()
 def compute_and_log_metrics(metrics, name, iteration, size):
     """
     Recebe um dicionário de métricas e o salva em um arquivo CSV.
-    O cabeçalho é escrito automaticamente apenas se o arquivo não existir.
+    O cabeçalho é escrito automaticamente apenas se o arquivo não existir. Se o arquivo existente
+    tiver outro cabeçalho (colunas de uma versão anterior do experimento), ele é movido para
+    ./outputs/archive/ e um novo arquivo é iniciado, para não misturar linhas com colunas diferentes.
     """
 
     # Define um nome de arquivo único por algoritmo
@@ -46,6 +48,13 @@ def compute_and_log_metrics(metrics, name, iteration, size):
 
     # Verifica se o arquivo já existe para decidir se escreve o cabeçalho
     file_exists = os.path.exists(filename)
+    if file_exists:
+        with open(filename, newline="", encoding="utf-8") as csvfile:
+            existing_header = next(csv.reader(csvfile), [])
+        if existing_header != list(header):
+            archive_filename = archive_output(filename)
+            print(f"Cabeçalho de '{filename}' mudou; arquivo anterior movido para '{archive_filename}'")
+            file_exists = False
     # Abre o arquivo em modo 'append' (a) e escreve a nova linha
     # newline='' é importante para evitar linhas em branco no CSV
     with open(filename, "a", newline="", encoding="utf-8") as csvfile:
@@ -59,35 +68,77 @@ def compute_and_log_metrics(metrics, name, iteration, size):
         writer.writerow(row_data)
 
 
+def archive_output(filename):
+    """
+    Move um arquivo de saída para ./outputs/archive/, numerando-o para não sobrescrever arquivos
+    arquivados antes (ex.: avl_tree-1.csv). A pasta fica fora da leitura de utils.get_dict.
+    :return: caminho do arquivo arquivado
+    """
+    archive_dir = "./outputs/archive/"
+    os.makedirs(archive_dir, exist_ok=True)
+    base, ext = os.path.splitext(os.path.basename(filename))
+    version = 1
+    while os.path.exists(os.path.join(archive_dir, f"{base}-{version}{ext}")):
+        version += 1
+    archive_filename = os.path.join(archive_dir, f"{base}-{version}{ext}")
+    os.replace(filename, archive_filename)
+    return archive_filename
+
+
+def add_timing_metrics(metrics, phase, stats):
+    """
+    Adiciona ao dicionário de métricas as estatísticas de tempo de uma fase ("Insertion" ou "Search").
+    A coluna principal ("<fase> CPU Time (s)") passa a ser a mediana das amostras do timing.measure.
+    """
+    metrics[f"{phase} CPU Time (s)"] = stats["median"]
+    metrics[f"{phase} CPU Time p95 (s)"] = stats["p95"]
+    metrics[f"{phase} CPU Time CI95 Low (s)"] = stats["ci_low"]
+    metrics[f"{phase} CPU Time CI95 High (s)"] = stats["ci_high"]
+    metrics[f"{phase} Timing Samples"] = stats["samples"]
+
+
+def measure_insertion(build):
+    """
+    Mede a fase de inserção, construindo a estrutura com build().
+    O pico de memória vem de uma construção com o tracemalloc ativo; como o tracemalloc deixa o
+    código bem mais lento, o tempo de CPU é medido à parte, em novas construções (timing.measure).
+    Custo extra: a estrutura é construída pelo menos duas vezes. Construções que passam de
+    time_budget (0,25 s, o caso dos tamanhos grandes) são medidas com uma única chamada, então a
+    fase custa uma construção rastreada (várias vezes mais lenta) mais uma normal; construções
+    curtas são repetidas até somar cerca de time_budget. A estrutura devolvida é a da construção
+    rastreada, que é a mesma das demais (build é determinístico).
+    :return: (resultado do build com tracemalloc, pico de memória em bytes, estatísticas de tempo)
+    """
+    tracemalloc.start()
+    built = build()
+    _, peak_mem = tracemalloc.get_traced_memory()
+    tracemalloc.stop()  # Paramos o tracemalloc aqui, pois a estrutura já está criada.
+
+    insert_stats = measure(build)
+    return built, peak_mem, insert_stats
+
+
 def linear_array_test(data):
     """
     Executa os testes com Array Linear
     """
     print(f"Inserting {len(data)} into Linear Array")
     metrics = {}  # dicionário para coleta das métricas
-    # Objeto Process que representa o nosso script atual
-    process = p.Process(os.getpid())
 
     # FASE 1: INSERÇÃO
-    tracemalloc.start()
-    # Mede o tempo de CPU inicial
-    cpu_before_insert = process.cpu_times()
+    def build():
+        total_insert_steps = 0
+        linear_array = []
+        for item in data:
+            linear_array[len(linear_array):] = item
+            total_insert_steps += 1
+        return linear_array, total_insert_steps
 
-    total_insert_steps = 0
-    linear_array = []
-    for item in data:
-        linear_array[len(linear_array):] = item
-        total_insert_steps += 1
-
-    cpu_after_insert = process.cpu_times()
-    _, peak_mem = tracemalloc.get_traced_memory()
-    tracemalloc.stop()  # Paramos o tracemalloc aqui, pois a estrutura já está criada.
+    (_, total_insert_steps), peak_mem, insert_stats = measure_insertion(build)
 
     # Coleta de métricas da Fase 1
     metrics["Memory Usage (Peak Bytes)"] = peak_mem
-    metrics["Insertion CPU Time (s)"] = (
-        cpu_after_insert.user - cpu_before_insert.user
-    ) + (cpu_after_insert.system - cpu_before_insert.system)
+    add_timing_metrics(metrics, "Insertion", insert_stats)
     metrics["Total Insertion Steps"] = total_insert_steps
 
     # BUSCA POR AMOSTRAGEM
@@ -97,25 +148,17 @@ def linear_array_test(data):
     #sample_size = max(1, int(len(data) * sample_percent))
     sample_size = 512
     search_sample = rd.sample(data, sample_size)
-    total_search_steps = 0
-
-    # Busca Sequencial
-    tracemalloc.start()
-    cpu_before_search = process.cpu_times()
+    search_steps = []
 
-    for item_to_search in search_sample:
-        id_to_search = item_to_search[0]
-        _, seq_search_steps = sequential_search(data, id_to_search)
-        total_search_steps += seq_search_steps
+    # Busca Sequencial. Cada chamada de search_all percorre a amostra inteira e guarda os passos
+    # de cada busca, que são sempre os mesmos entre as repetições do timing.measure.
+    def search_all():
+        search_steps[:] = [sequential_search(data, item_to_search[0])[1] for item_to_search in search_sample]
 
-    cpu_after_search = process.cpu_times()
-    _, peak_mem = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
+    search_stats = measure(search_all)
 
-    metrics["Average Search Steps"] = total_search_steps / sample_size
-    metrics["Search CPU Time (s)"] = (
-        cpu_after_search.user - cpu_before_search.user
-    ) + (cpu_after_search.system - cpu_before_search.system)
+    metrics["Average Search Steps"] = sum(search_steps) / sample_size
+    add_timing_metrics(metrics, "Search", search_stats)
 
     return metrics
 
@@ -126,69 +169,47 @@ def test_avltree_lifecycle(data):
     """
     print(f"Inserting {len(data)} into AVL Tree")
     metrics = {}  # dicionário para coleta das métricas
-    # Objeto Process que representa o nosso script atual
-    process = p.Process(os.getpid())
 
     # FASE 1: INSERÇÃO
-    tracemalloc.start()
-    # Mede o tempo de CPU inicial
-    cpu_before_insert = process.cpu_times()
+    def build():
+        total_insert_steps = 0
+        tree = AVLTree(key=lambda registro: registro[0])
+        for item in data:
+            insert_metrics = tree.insert(item)
+            total_insert_steps += insert_metrics["Insert Steps"]
+        return tree, total_insert_steps
 
-    total_insert_steps = 0
-    tree = AVLTree(key=lambda registro: registro[0])
-    for item in data:
-        insert_metrics = tree.insert(item)
-        total_insert_steps += insert_metrics["Insert Steps"]
-
-    cpu_after_insert = process.cpu_times()
-    _, peak_mem = tracemalloc.get_traced_memory()
-    tracemalloc.stop()  # Paramos o tracemalloc aqui, pois a estrutura já está criada.
+    (tree, total_insert_steps), peak_mem, insert_stats = measure_insertion(build)
 
     # Coleta de métricas da Fase 1
     metrics["Memory Usage (Peak Bytes)"] = peak_mem
-    metrics["Insertion CPU Time (s)"] = (
-        cpu_after_insert.user - cpu_before_insert.user
-    ) + (cpu_after_insert.system - cpu_before_insert.system)
+    add_timing_metrics(metrics, "Insertion", insert_stats)
     if tree.root:
         metrics["Rotation Events"] = tree.rotation_count
         metrics["Tree Height"] = tree.root.height
         metrics["Total Insertion Steps"] = total_insert_steps
 
     # FASE 2: BUSCA POR AMOSTRAGEM
-
-    total_depth_for_one_run = 0
-    max_depth_for_one_run = 0
     # Definimos o tamanho da amostra como 1% do total de dados.
     # Usamos max(1, ...) para garantir que, mesmo para N muito pequeno, testamos pelo menos 1 elemento.
     #sample_percent = 0.01
     #sample_size = max(1, int(len(data) * sample_percent))
     sample_size = 512
     search_sample = rd.sample(data, sample_size)
+    search_steps = []
 
-    # Define o número de repetições para amplificar a carga de trabalho, anteriormente registraram-se várias medições com
-    # valor zero sem essas repetições
-    search_repetitions = 20
-
-    cpu_before_search = process.cpu_times()
+    # O timing.measure repete a busca da amostra inteira o quanto for preciso para uma medição
+    # confiável (antes eram 20 repetições fixas, para evitar as medições com valor zero).
+    # As profundidades são as mesmas em todas as repetições.
+    def search_all():
+        search_steps[:] = [tree.search(item_to_search[0])[1]["Search Steps"] for item_to_search in search_sample]
 
-    for i in range(search_repetitions):
-        for item_to_search in search_sample:
-            key_to_search = item_to_search[0]
-            _, search_metrics = tree.search(key_to_search)
-            # As métricas de profundidade só precisam ser calculadas na primeira repetição
-            if i == 0:
-                total_depth_for_one_run += search_metrics["Search Steps"]
-                max_depth_for_one_run = max(max_depth_for_one_run, search_metrics["Search Steps"])
-
-    cpu_after_search = process.cpu_times()
+    search_stats = measure(search_all)
 
     # Coleta de métricas da Fase 2
-    total_cpu_time = (cpu_after_search.user - cpu_before_search.user) + (
-                cpu_after_search.system - cpu_before_search.system)
-    # Normaliza o tempo de CPU pelo número de repetições para obter um número médio, evitando os zeros que ocorriam anteriormente
-    metrics["Search CPU Time (s)"] = total_cpu_time / search_repetitions
-    metrics["Average Search Steps"] = total_depth_for_one_run / len(search_sample)
-    metrics["Max Search Steps"] = max_depth_for_one_run
+    add_timing_metrics(metrics, "Search", search_stats)
+    metrics["Average Search Steps"] = sum(search_steps) / len(search_sample)
+    metrics["Max Search Steps"] = max(search_steps)
 
     return metrics
 
@@ -198,65 +219,44 @@ def test_unbaltree_lifecycle(data):
     """
     print(f"Inserting {len(data)} into Unbalanced Tree")
     metrics = {}  # dicionário para coleta das métricas
-    # Objeto Process que representa o nosso script atual
-    process = p.Process(os.getpid())
 
     # FASE 1: INSERÇÃO
-    tracemalloc.start()
-    # Mede o tempo de CPU inicial
-    cpu_before_insert = process.cpu_times()
+    def build():
+        total_insert_steps = 0
+        tree = UnBalTree(key=lambda registro: registro[0])
+        for item in data:
+            insert_metrics = tree.insert(item)
+            total_insert_steps += insert_metrics["Insert Steps"]
+        return tree, total_insert_steps
 
-    total_insert_steps = 0
-    tree = UnBalTree(key=lambda registro: registro[0])
-    for item in data:
-        insert_metrics = tree.insert(item)
-        total_insert_steps += insert_metrics["Insert Steps"]
-
-    cpu_after_insert = process.cpu_times()
-    _, peak_mem = tracemalloc.get_traced_memory()
-    tracemalloc.stop()  # Paramos o tracemalloc aqui, pois a estrutura já está criada.
+    (tree, total_insert_steps), peak_mem, insert_stats = measure_insertion(build)
 
     # Coleta de métricas da Fase 1
     metrics["Memory Usage (Peak Bytes)"] = peak_mem
-    metrics["Insertion CPU Time (s)"] = (
-        cpu_after_insert.user - cpu_before_insert.user
-    ) + (cpu_after_insert.system - cpu_before_insert.system)
+    add_timing_metrics(metrics, "Insertion", insert_stats)
     if tree.root:
         metrics["Tree Height"] = tree.root.height
         metrics["Total Insertion Steps"] = total_insert_steps
 
     # FASE 2: BUSCA POR AMOSTRAGEM
-    total_depth_for_one_run = 0
-    max_depth_for_one_run = 0
     # Definimos o tamanho da amostra como 1% do total de dados.
     # Usamos max(1, ...) para garantir que, mesmo para N muito pequeno, testamos pelo menos 1 elemento.
     #sample_percent = 0.01
     #sample_size = max(1, int(len(data) * sample_percent))
     sample_size = 512
     search_sample = rd.sample(data, sample_size)
-    # Define o número de repetições para amplificar a carga de trabalho, anteriormente registraram-se várias medições com
-    # valor zero sem essas repetições
-    search_repetitions = 20
+    search_steps = []
 
-    cpu_before_search = process.cpu_times()
+    # Mesma estratégia da árvore AVL: repetições calibradas pelo timing.measure
+    def search_all():
+        search_steps[:] = [tree.search(item_to_search[0])[1]["Search Steps"] for item_to_search in search_sample]
 
-    for i in range(search_repetitions):
-        for item_to_search in search_sample:
-            key_to_search = item_to_search[0]
-            _, search_metrics = tree.search(key_to_search)
-            if i == 0:
-                total_depth_for_one_run += search_metrics["Search Steps"]
-                max_depth_for_one_run = max(max_depth_for_one_run, search_metrics["Search Steps"])
-
-    cpu_after_search = process.cpu_times()
+    search_stats = measure(search_all)
 
     # Coleta de métricas da Fase 2
-    total_cpu_time = (cpu_after_search.user - cpu_before_search.user) + (
-                cpu_after_search.system - cpu_before_search.system)
-    # Normaliza o tempo de CPU pelo número de repetições para obter um número médio, evitando os zeros que ocorriam anteriormente
-    metrics["Search CPU Time (s)"] = total_cpu_time / search_repetitions
-    metrics["Average Search Steps"] = total_depth_for_one_run / len(search_sample)
-    metrics["Max Search Steps"] = max_depth_for_one_run
+    add_timing_metrics(metrics, "Search", search_stats)
+    metrics["Average Search Steps"] = sum(search_steps) / len(search_sample)
+    metrics["Max Search Steps"] = max(search_steps)
 
     return metrics
 
@@ -266,58 +266,44 @@ def hash_test(data, m, hash_function):
     """
     print(f"Inserting {len(data)} into {hash_function} Hash Table ({m})")
     metrics = {}  # dicionário para coleta das métricas
-    # Objeto Process que representa o nosso script atual
-    process = p.Process(os.getpid())
 
     # FASE 1: INSERÇÃO
-    tracemalloc.start()
-    # Mede o tempo de CPU inicial
-    cpu_before_insert = process.cpu_times()
+    def build():
+        hash_table = HashTable(m, hash_function)
+        total_insert_steps = 0
+        for item in data:
+            insert_metrics = hash_table.insert(item[0], item[1:])
+            total_insert_steps += insert_metrics['Insert Steps']
+        return hash_table, total_insert_steps
 
-    hash_table = HashTable(m, hash_function)
-    total_insert_steps = 0
-    for item in data:
-        insert_metrics = hash_table.insert(item[0], item[1:])
-        total_insert_steps += insert_metrics['Insert Steps']
-
-    cpu_after_insert = process.cpu_times()
-    _, peak_mem = tracemalloc.get_traced_memory()
-    tracemalloc.stop()  # Paramos o tracemalloc aqui, pois a estrutura já está criada.
+    (hash_table, total_insert_steps), peak_mem, insert_stats = measure_insertion(build)
 
     # Coleta de métricas da Fase 1
     metrics["M parameter"] = m
     metrics["Hash Function"] = hash_function
     metrics["Memory Usage (Peak Bytes)"] = peak_mem
-    metrics["Insertion CPU Time (s)"] = (
-        cpu_after_insert.user - cpu_before_insert.user
-    ) + (cpu_after_insert.system - cpu_before_insert.system)
+    add_timing_metrics(metrics, "Insertion", insert_stats)
     metrics["Total Insertion Steps"] = total_insert_steps
 
     structural_metrics = hash_table.get_structural_metrics()
     metrics.update(structural_metrics)
 
     # FASE 2: BUSCA POR AMOSTRAGEM
-    cpu_before_search = process.cpu_times()
-
-    total_search_steps = 0
     sample_size = 512
     if len(data) < sample_size:
         search_sample = data
     else:
         search_sample = rd.sample(data, sample_size)
+    search_steps = []
 
-    for item_to_search in search_sample:
-        key_to_search = item_to_search[0]
-        _, search_metrics = hash_table.search(key_to_search)
-        total_search_steps += search_metrics["Search Steps"]
+    def search_all():
+        search_steps[:] = [hash_table.search(item_to_search[0])[1]["Search Steps"] for item_to_search in search_sample]
 
-    cpu_after_search = process.cpu_times()
+    search_stats = measure(search_all)
 
     # Coleta de métricas da Fase 2
-    metrics["Search CPU Time (s)"] = (
-        cpu_after_search.user - cpu_before_search.user
-    ) + (cpu_after_search.system - cpu_before_search.system)
-    metrics["Average Search Steps"] = total_search_steps / sample_size
+    add_timing_metrics(metrics, "Search", search_stats)
+    metrics["Average Search Steps"] = sum(search_steps) / sample_size
 
     # Salvar dados de distribuição dos buckets para geração de um histograma
     bucket_lengths = [len(bucket) for bucket in hash_table.table]
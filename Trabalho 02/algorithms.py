@@ -1,19 +1,44 @@
 import time
 import heapq  # Biblioteca para implementar a fila de prioridade (min-heap)
 from collections import deque  # Biblioteca para implementar a fila (queue) de forma eficiente
-from geopy.distance import geodesic
-import psutil  # Importado para medição de tempo de CPU
-import tracemalloc # Importado para profiling de memória
+from distance import distance, one_to_many, EARTH_MIN_RADIUS_KM
+from priority_queue import make_priority_queue
+from instrumentation import profiled  # Medição de tempo/memória opcional (ver instrumentation.py)
 
 
 # --- Função Heurística ---
-def heuristic(node_coord, goal_coord):
+# Modo padrão de cálculo da heurística (ver distance.DISTANCE_MODES). O modo "haversine" é
+# vetorizado e muito mais rápido que a geodésica exata do geopy.
+HEURISTIC_MODE = "haversine"
+
+# Limite padrão de expansões do SMA*, por nó do grafo (ver sma_star)
+SMA_STAR_EXPANSIONS_PER_NODE = 10
+
+
+def heuristic(node_coord, goal_coord, mode: str = HEURISTIC_MODE):
     """
     Calcula a 'heurística', que é uma estimativa de custo do nó atual até o nó final.
     Neste caso, usamos a distância em linha reta (geodésica), que é uma boa estimativa
     para um mapa. Ela nunca superestima a distância real da estrada.
+    Nos modos esféricos usamos o menor raio de curvatura da Terra, para que a aproximação
+    continue sem superestimar a distância geodésica (heurística admissível).
     """
-    return geodesic(node_coord, goal_coord).km
+    return distance(node_coord, goal_coord, mode, radius=EARTH_MIN_RADIUS_KM)
+
+
+def neighbor_heuristics(graph, neighbors, goal_coord, mode: str = HEURISTIC_MODE, h_table: dict = None) -> list:
+    """
+    Calcula, em uma única chamada vetorizada, a heurística de todos os vizinhos de um nó.
+    :param neighbors: lista de pares (id_vizinho, peso), como retornado por graph.get_neighbors.
+    :param h_table: tabela pré-calculada {id_no: heurística} (ver HeuristicCache); se informada,
+                    os valores são apenas consultados.
+    """
+    if not neighbors:
+        return []
+    if h_table is not None:
+        return [h_table[neighbor_id] for neighbor_id, _ in neighbors]
+    coords = [graph.get_node(neighbor_id).coord for neighbor_id, _ in neighbors]
+    return one_to_many(goal_coord, coords, mode, radius=EARTH_MIN_RADIUS_KM).tolist()
 
 
 # --- Função Auxiliar para Reconstruir o Caminho ---
@@ -25,38 +50,49 @@ def reconstruct_path(came_from, current_id):
     """
     # Começamos pelo final
     path = [current_id]
-    # Enquanto o nó atual estiver no nosso mapa 'came_from', significa que ele tem um "pai"
-    while current_id in came_from:
+    # Enquanto o nó atual tiver um "pai" no nosso mapa 'came_from' (o início pode aparecer com pai None)
+    while came_from.get(current_id) is not None:
         # O nó atual passa a ser o seu "pai", voltando um passo no caminho
         current_id = came_from[current_id]
-        # Inserimos o "pai" no início da lista, para manter a ordem correta
-        path.insert(0, current_id)
+        # Acrescentamos o "pai" no final (O(1)); inserir no início a cada passo seria O(n²)
+        path.append(current_id)
+    # O caminho foi montado do fim para o início, então invertemos uma única vez
+    path.reverse()
     return path
 
 
 # --- Algoritmos de Busca ---
+# Todos os algoritmos aceitam tanto o Graph quanto a sua versão congelada (FrozenGraph, em CSR),
+# pois dependem apenas de get_node, get_neighbors e get_edge_weight.
+# Os algoritmos não medem nada por conta própria: o decorador @profiled acrescenta tempo e
+# memória ao resultado conforme o modo ativo em instrumentation.py (por padrão, nenhuma medição).
 
-def dijkstra(graph, start_id, goal_id):
+@profiled
+def dijkstra(graph, start_id, goal_id, queue: str = "lazy", d: int = 4, workspace=None):
     """
     Algoritmo de Dijkstra: Encontra o caminho mais barato (menor custo) do início ao fim.
     Ele é "guloso" em relação ao custo JÁ percorrido. Sempre explora o nó com o menor
     custo acumulado desde o início.
+    :param queue: tipo de fila de prioridade ("lazy", "binary", "dary" ou "radix"; ver priority_queue.py).
+    :param d: número de filhos por nó do heap, quando queue="dary".
+    :param workspace: SearchWorkspace opcional (workspace.py), para reaproveitar as estruturas entre consultas.
     """
-    # --- Início do Profiling ---
-    process = psutil.Process()
-    tracemalloc.start()
-    cpu_time_start = process.cpu_times()
-
     # 1. Inicialização
-    # Fila de prioridade (min-heap). Armazena (prioridade, id_do_no). A prioridade baixa sai primeiro.
-    # A prioridade para Dijkstra é o custo total desde o início (g_score).
-    pq = [(0, start_id)]
-
     # Dicionário para rastrear o caminho, guardando {id_filho: id_pai}
-    came_from = {}
+    # e dicionário para guardar o menor custo encontrado ATÉ AGORA para chegar em cada nó.
+    if workspace is not None:
+        workspace.begin()
+        came_from, cost_so_far, closed = workspace.parents, workspace.distances, workspace.closed
+    else:
+        came_from, cost_so_far, closed = {}, {}, None
+    cost_so_far[start_id] = 0
 
-    # Dicionário para guardar o menor custo encontrado ATÉ AGORA para chegar em cada nó.
-    cost_so_far = {start_id: 0}
+    # Fila de prioridade (min-heap). Armazena (prioridade, id_do_no). A prioridade baixa sai primeiro.
+    # A prioridade para Dijkstra é o custo total desde o início (g_score).
+    # Cada nó sai da fila uma única vez: as filas indexadas atualizam a prioridade (decrease-key)
+    # e a fila preguiçosa descarta as entradas de nós já expandidos.
+    pq = make_priority_queue(queue, d, closed)
+    pq.push(start_id, 0)
 
     # Métricas
     nodes_expanded = 0
@@ -71,7 +107,7 @@ def dijkstra(graph, start_id, goal_id):
         max_frontier_size = max(max_frontier_size, len(pq))
 
         # Pega o nó da fronteira que tem o MENOR custo (menor prioridade). Esta é a essência do Dijkstra.
-        cost, current_id = heapq.heappop(pq)
+        cost, current_id = pq.pop()
 
         nodes_expanded += 1
 
@@ -83,10 +119,10 @@ def dijkstra(graph, start_id, goal_id):
 
         # 3. Explorar Vizinhos
         # Para cada vizinho conectado ao nó atual...
-        for neighbor_id in graph.get_neighbors(current_id):
+        for neighbor_id, weight in graph.get_neighbors(current_id):
             edges_evaluated += 1  # Conta a avaliação de uma aresta
             # Calcula o custo para chegar neste vizinho através do nó ATUAL.
-            new_cost = cost_so_far[current_id] + graph.get_edge_weight(current_id, neighbor_id)
+            new_cost = cost_so_far[current_id] + weight
 
             # A CONDIÇÃO MAIS IMPORTANTE:
             # Se nunca visitamos esse vizinho OU encontramos um caminho MAIS BARATO para ele...
@@ -95,47 +131,78 @@ def dijkstra(graph, start_id, goal_id):
                 cost_so_far[neighbor_id] = new_cost
                 priority = new_cost
                 # E o adicionamos na fronteira para ser explorado no futuro.
-                heapq.heappush(pq, (priority, neighbor_id))
+                pq.push(neighbor_id, priority)
                 # E guardamos que chegamos a este vizinho a partir do nó atual.
                 came_from[neighbor_id] = current_id
 
-    # --- Fim do Profiling e Coleta de Métricas ---
-    cpu_time_end = process.cpu_times()
-    mem_peak = tracemalloc.get_traced_memory()[1] # Pega o valor de pico
-    tracemalloc.stop()
-
-    # Cálculo das métricas de performance
-    cpu_time = (cpu_time_end.user - cpu_time_start.user) + (cpu_time_end.system - cpu_time_start.system)
-    memory_peak_kb = round(mem_peak / 1024, 2)
-
     if path_found:
         return {
             "name": "Dijkstra", "path": path_found, "cost": round(cost_so_far[goal_id], 2),
             "nodes_expanded": nodes_expanded, "edges_evaluated": edges_evaluated,
-            "max_frontier_size": max_frontier_size,
-            "cpu_time": cpu_time, "memory_peak_kb": memory_peak_kb
+            "max_frontier_size": max_frontier_size
         }
     return None  # Se o loop terminar e não encontrarmos o objetivo, não há caminho.
 
 
-def greedy_search(graph, start_id, goal_id):
+def shortest_path_tree(graph, source_id, targets=None):
+    """
+    Árvore de caminhos mínimos: Dijkstra completo (sem um objetivo único) a partir de source_id.
+    Retorna (distancias, predecessores): {id_no: custo} e {id_no: id_pai} para todos os nós
+    alcançáveis. O caminho até qualquer nó sai de reconstruct_path(predecessores, id_no).
+    :param targets: se informado, a busca para assim que todos esses nós tiverem custo definitivo.
+    """
+    pq = [(0, source_id)]
+    distances = {source_id: 0}
+    predecessors = {}
+    settled = set()
+    remaining = set(targets) if targets is not None else None
+
+    while pq:
+        cost, current_id = heapq.heappop(pq)
+        if current_id in settled:
+            continue  # Entrada antiga (o nó já foi fixado com um custo menor)
+        settled.add(current_id)
+
+        if remaining is not None:
+            remaining.discard(current_id)
+            if not remaining:
+                break
+
+        for neighbor_id, weight in graph.get_neighbors(current_id):
+            new_cost = cost + weight
+            if new_cost < distances.get(neighbor_id, float('inf')):
+                distances[neighbor_id] = new_cost
+                predecessors[neighbor_id] = current_id
+                heapq.heappush(pq, (new_cost, neighbor_id))
+
+    return distances, predecessors
+
+
+@profiled
+def greedy_search(graph, start_id, goal_id, heuristic_mode: str = HEURISTIC_MODE, heuristic_cache=None,
+                  workspace=None):
     """
     Busca Gulosa (ou Ambiciosa): Tenta chegar o mais rápido possível no objetivo.
     Ele é "guloso" em relação ao futuro. Sempre escolhe o nó que PARECE estar mais
     perto do final, ignorando o custo que já teve para chegar até ali. É rápido, mas não garante o melhor caminho.
     """
-    # --- Início do Profiling ---
-    process = psutil.Process()
-    tracemalloc.start()
-    cpu_time_start = process.cpu_times()
     goal_node = graph.get_node(goal_id)
 
     # 1. Inicialização
     # A prioridade aqui é SÓ a heurística (distância em linha reta até o fim).
-    h_start = heuristic(graph.get_node(start_id).coord, goal_node.coord)
+    # Com um HeuristicCache, a heurística de todos os nós até o objetivo já vem pré-calculada.
+    h_table = heuristic_cache.table(goal_id) if heuristic_cache is not None else None
+    if h_table is not None:
+        h_start = h_table[start_id]
+    else:
+        h_start = heuristic(graph.get_node(start_id).coord, goal_node.coord, heuristic_mode)
     pq = [(h_start, start_id)]
-    came_from = {}
-    visited = {start_id}  # Usamos um 'visited' simples pois não precisamos re-visitar nós.
+    if workspace is not None:
+        workspace.begin()
+        came_from, visited = workspace.parents, workspace.closed
+    else:
+        came_from, visited = {}, set()
+    visited.add(start_id)  # Usamos um 'visited' simples pois não precisamos re-visitar nós.
 
     nodes_expanded = 0
     edges_evaluated = 0
@@ -155,60 +222,64 @@ def greedy_search(graph, start_id, goal_id):
             break
 
         # 3. Explorar Vizinhos
-        for neighbor_id in graph.get_neighbors(current_id):
-            edges_evaluated += 1  # Conta a avaliação de uma aresta
-            if neighbor_id not in visited:
-                visited.add(neighbor_id)
-                came_from[neighbor_id] = current_id
-                neighbor_node = graph.get_node(neighbor_id)
-                # A prioridade é a distância do VIZINHO até o FIM.
-                h = heuristic(neighbor_node.coord, goal_node.coord)
-                heapq.heappush(pq, (h, neighbor_id))
-
-    cpu_time_end = process.cpu_times()
-    mem_peak = tracemalloc.get_traced_memory()[1]
-    tracemalloc.stop()
-
-    cpu_time = (cpu_time_end.user - cpu_time_start.user) + (cpu_time_end.system - cpu_time_start.system)
-    memory_peak_kb = round(mem_peak / 1024, 2)
+        # A heurística de todos os vizinhos é calculada de uma vez (vetorizada).
+        all_neighbors = list(graph.get_neighbors(current_id))
+        edges_evaluated += len(all_neighbors)  # Conta a avaliação das arestas
+        neighbors = [pair for pair in all_neighbors if pair[0] not in visited]
+        h_values = neighbor_heuristics(graph, neighbors, goal_node.coord, heuristic_mode, h_table)
+        for (neighbor_id, _), h in zip(neighbors, h_values):
+            visited.add(neighbor_id)
+            came_from[neighbor_id] = current_id
+            # A prioridade é a distância do VIZINHO até o FIM.
+            heapq.heappush(pq, (h, neighbor_id))
 
     if path_found:
         cost = sum(graph.get_edge_weight(path_found[i], path_found[i + 1]) for i in range(len(path_found) - 1))
         return {
             "name": "Greedy Search", "path": path_found, "cost": round(cost, 2),
             "nodes_expanded": nodes_expanded, "edges_evaluated": edges_evaluated,
-            "max_frontier_size": max_frontier_size,
-            "cpu_time": cpu_time, "memory_peak_kb": memory_peak_kb
+            "max_frontier_size": max_frontier_size
         }
     return None
 
 
-def a_star(graph, start_id, goal_id):
+@profiled
+def a_star(graph, start_id, goal_id, heuristic_mode: str = HEURISTIC_MODE, heuristic_cache=None,
+           queue: str = "lazy", d: int = 4, workspace=None):
     """
     A* (A-Estrela): Abordagem com o melhor dos dois mundos. Combina a segurança do Dijkstra com a
     velocidade do Greedy. Ele avalia os nós usando uma soma:
     f_score = g_score + h_score
     g_score = custo real desde o início (o que o Dijkstra usa)
     h_score = custo estimado até o fim (o que o Greedy usa)
+    :param queue: tipo de fila de prioridade ("lazy", "binary", "dary" ou "radix"; ver priority_queue.py).
+    :param d: número de filhos por nó do heap, quando queue="dary".
+    :param workspace: SearchWorkspace opcional (workspace.py), para reaproveitar as estruturas entre consultas.
     """
-    # --- Início do Profiling ---
-    process = psutil.Process()
-    tracemalloc.start()
-    cpu_time_start = process.cpu_times()
-
     # --- Lógica do Algoritmo ---
     goal_node = graph.get_node(goal_id)
 
     # 1. Inicialização
     # A prioridade é o f_score (g_score + h_score).
-    h_start = heuristic(graph.get_node(start_id).coord, goal_node.coord)
-    pq = [(h_start, start_id)]
-    came_from = {}
-
-    # g_score é o mesmo que o 'cost_so_far' do Dijkstra.
-    g_score = {node.id: float('inf') for node in graph.nodes}
+    # Com um HeuristicCache, a heurística de todos os nós até o objetivo já vem pré-calculada.
+    h_table = heuristic_cache.table(goal_id) if heuristic_cache is not None else None
+    if h_table is not None:
+        h_start = h_table[start_id]
+    else:
+        h_start = heuristic(graph.get_node(start_id).coord, goal_node.coord, heuristic_mode)
+    # g_score é o mesmo que o 'cost_so_far' do Dijkstra. Nós ausentes valem infinito, então
+    # não é preciso inicializar um valor para cada nó do grafo (o que custaria O(V) por consulta).
+    if workspace is not None:
+        workspace.begin()
+        came_from, g_score, closed = workspace.parents, workspace.distances, workspace.closed
+    else:
+        came_from, g_score, closed = {}, {}, None
     g_score[start_id] = 0
 
+    # Como no Dijkstra, cada nó sai da fila uma única vez (a heurística é consistente).
+    pq = make_priority_queue(queue, d, closed)
+    pq.push(start_id, h_start)
+
     nodes_expanded = 0
     edges_evaluated = 0
     max_frontier_size = 1
@@ -219,7 +290,7 @@ def a_star(graph, start_id, goal_id):
         max_frontier_size = max(max_frontier_size, len(pq))
 
         # Pega o nó com o menor f_score (a melhor combinação de custo+heurística)
-        _, current_id = heapq.heappop(pq)
+        _, current_id = pq.pop()
         nodes_expanded += 1
 
         if current_id == goal_id:
@@ -227,10 +298,13 @@ def a_star(graph, start_id, goal_id):
             break
 
         # 3. Explorar Vizinhos
-        for neighbor_id in graph.get_neighbors(current_id):
+        # A heurística de todos os vizinhos é calculada de uma vez (vetorizada).
+        neighbors = list(graph.get_neighbors(current_id))
+        h_values = neighbor_heuristics(graph, neighbors, goal_node.coord, heuristic_mode, h_table)
+        for (neighbor_id, weight), h in zip(neighbors, h_values):
             edges_evaluated += 1  # Conta a avaliação de uma aresta
             # O cálculo do g_score (custo para chegar no vizinho) é igual ao do Dijkstra.
-            tentative_g_score = g_score[current_id] + graph.get_edge_weight(current_id, neighbor_id)
+            tentative_g_score = g_score[current_id] + weight
 
             if tentative_g_score < g_score.get(neighbor_id, float('inf')):
                 # Se encontramos um caminho melhor, atualizamos tudo.
@@ -238,44 +312,567 @@ def a_star(graph, start_id, goal_id):
                 g_score[neighbor_id] = tentative_g_score
 
                 # A "mágica" do A* acontece aqui:
-                neighbor_node = graph.get_node(neighbor_id)
-                h = heuristic(neighbor_node.coord, goal_node.coord)
                 f_score = tentative_g_score + h  # A prioridade combina o custo real com a estimativa.
 
-                heapq.heappush(pq, (f_score, neighbor_id))
+                pq.push(neighbor_id, f_score)
 
-    # --- Fim do Profiling e Coleta de Métricas ---
-    cpu_time_end = process.cpu_times()
-    mem_peak = tracemalloc.get_traced_memory()[1]
-    tracemalloc.stop()
+    if path_found:
+        return {
+            "name": "A* Search", "path": path_found, "cost": round(g_score[goal_id], 2),
+            "nodes_expanded": nodes_expanded, "edges_evaluated": edges_evaluated,
+            "max_frontier_size": max_frontier_size
+        }
+    return None
+
+
+@profiled
+def a_star_landmarks(graph, start_id, goal_id, landmarks, workspace=None):
+    """
+    A* com heurística ALT: usa um LandmarkIndex (landmarks.py) pré-calculado para o grafo.
+    A heurística é o maior entre os limites inferiores dados pelos marcos e a distância em
+    linha reta, então o custo encontrado é o mesmo do A* tradicional, expandindo menos nós.
+    """
+    result = a_star(graph, start_id, goal_id, heuristic_cache=landmarks, workspace=workspace)
+    if result:
+        result["name"] = "A* ALT"
+    return result
+
+
+# --- Buscas com Memória Limitada ---
+# O A* guarda todos os nós gerados (fronteira + 'came_from'), o que cresce com a malha. As duas
+# buscas abaixo encontram o mesmo caminho ótimo com um teto de memória, pagando com CPU: nós
+# descartados são gerados de novo sempre que voltam a ser necessários.
+
+@profiled
+def ida_star(graph, start_id, goal_id, heuristic_mode: str = HEURISTIC_MODE, heuristic_cache=None,
+             bound_growth: float = 0.05, table_size: int = 4096):
+    """
+    IDA* (A* por aprofundamento iterativo): uma busca em profundidade que só segue caminhos com
+    f_score = g_score + h_score até um limite. Se o objetivo não for encontrado, o limite aumenta
+    e a busca recomeça do início.
+    Não há fronteira: a memória é a do caminho atual mais uma tabela de transposição de tamanho
+    fixo, mas os nós rasos são expandidos de novo a cada iteração.
+    O 'max_frontier_size' do resultado é a maior profundidade da pilha.
+    Não aceita 'workspace' (workspace.py): os vetores do workspace têm um espaço por nó do grafo,
+    e a memória do IDA* deve ficar limitada à profundidade mais a tabela de transposição.
+    :param bound_growth: aumento mínimo (fração) do limite entre iterações. Com pesos reais, subir o
+                         limite só até o menor f_score excedente faria quase uma iteração por caminho;
+                         como a iteração que encontra o objetivo continua procurando caminhos mais
+                         baratos dentro do limite, o custo continua ótimo. Com 0, é o IDA* clássico.
+    :param table_size: máximo de nós na tabela de transposição, que guarda o menor custo com que cada
+                       nó já foi alcançado. Numa malha com ciclos, a busca em profundidade chega ao
+                       mesmo nó por inúmeros caminhos; os mais caros são podados. A memória
+                       continua limitada (profundidade + table_size); com 0, a tabela não é usada.
+    """
+    goal_coord = graph.get_node(goal_id).coord
+    h_table = heuristic_cache.table(goal_id) if heuristic_cache is not None else None
+    if h_table is not None:
+        h_start = h_table[start_id]
+    else:
+        h_start = heuristic(graph.get_node(start_id).coord, goal_coord, heuristic_mode)
+
+    nodes_expanded = 0
+    edges_evaluated = 0
+    max_frontier_size = 1
 
-    cpu_time = (cpu_time_end.user - cpu_time_start.user) + (cpu_time_end.system - cpu_time_start.system)
-    memory_peak_kb = round(mem_peak / 1024, 2)
+    def successors(node_id, g):
+        # Vizinhos em ordem crescente de f_score: o primeiro fora do limite encerra o nó.
+        neighbors = list(graph.get_neighbors(node_id))
+        h_values = neighbor_heuristics(graph, neighbors, goal_coord, heuristic_mode, h_table)
+        children = sorted((g + weight + h, neighbor_id, g + weight) for (neighbor_id, weight), h in zip(neighbors, h_values))
+        return iter(children)
+
+    bound = h_start
+    path_found, cost = ([start_id], 0) if start_id == goal_id else (None, float('inf'))
+    # Tabela de transposição: {id_no: (menor custo conhecido, iteração em que foi alcançado com ele)}.
+    # Ela é mantida entre as iterações: um nó já alcançado por um caminho mais barato, em qualquer
+    # iteração, não precisa ser explorado de novo (o caminho mais barato também cabe no limite atual).
+    best_g = {}
+    iteration = 0
+    while path_found is None:
+        iteration += 1
+        # Pilha explícita (em vez de recursão) com o caminho atual: cada entrada guarda o nó,
+        # o custo até ele e o iterador dos seus vizinhos ainda não explorados.
+        stack = [(start_id, 0, successors(start_id, 0))]
+        on_path = {start_id}  # Evita ciclos no caminho atual
+        nodes_expanded += 1
+        next_bound = float('inf')
+        while stack:
+            node_id, g, children = stack[-1]
+            child = next(children, None)
+            if child is None or child[0] > bound or child[0] >= cost:
+                # Sem vizinhos dentro do limite (ou que barateiem o caminho já encontrado): volta um nível
+                if child is not None and bound < child[0] < cost:
+                    # Guarda o menor f_score excedente para a próxima iteração
+                    next_bound = min(next_bound, child[0])
+                stack.pop()
+                on_path.discard(node_id)
+                continue
+
+            f, neighbor_id, neighbor_g = child
+            edges_evaluated += 1
+            if neighbor_id in on_path:
+                continue  # Ciclo
+            known_g, known_iteration = best_g.get(neighbor_id, (float('inf'), 0))
+            if known_g < neighbor_g or (known_g == neighbor_g and known_iteration == iteration):
+                continue  # Já alcançado por um caminho mais barato (ou por este mesmo, nesta iteração)
+            if neighbor_id in best_g or len(best_g) < table_size:
+                best_g[neighbor_id] = (neighbor_g, iteration)
+            if neighbor_id == goal_id:
+                # Caminho dentro do limite; a iteração continua atrás de um mais barato
+                path_found = [entry[0] for entry in stack] + [goal_id]
+                cost = neighbor_g
+                continue
+            stack.append((neighbor_id, neighbor_g, successors(neighbor_id, neighbor_g)))
+            on_path.add(neighbor_id)
+            nodes_expanded += 1
+            max_frontier_size = max(max_frontier_size, len(stack))
+
+        # Nenhum caminho dentro de qualquer limite: origem e destino não estão conectados
+        if next_bound == float('inf'):
+            break
+        bound = max(next_bound, bound * (1 + bound_growth))
 
     if path_found:
         return {
-            "name": "A* Search", "path": path_found, "cost": round(g_score[goal_id], 2),
+            "name": "IDA*", "path": path_found, "cost": round(cost, 2),
+            "nodes_expanded": nodes_expanded, "edges_evaluated": edges_evaluated,
+            "max_frontier_size": max_frontier_size
+        }
+    return None
+
+
+class _SMANode:
+    """Nó da árvore de busca do SMA*. Um mesmo nó do grafo pode aparecer em mais de um ramo."""
+    __slots__ = ("node_id", "parent", "g", "f", "depth", "cursor", "children", "forgotten", "in_open")
+
+    def __init__(self, node_id, parent, g, f, depth):
+        self.node_id = node_id
+        self.parent = parent
+        self.g = g
+        self.f = f
+        self.depth = depth
+        self.cursor = 0  # Próximo vizinho (na ordem de get_neighbors) ainda nunca gerado
+        # As coleções só são criadas quando necessárias: a maioria dos nós é folha e nunca teve
+        # sucessores descartados, e cada coleção vazia pesaria quase tanto quanto o próprio nó.
+        self.children = None  # Lista dos sucessores em memória
+        self.forgotten = None  # {id_vizinho: f_score} dos sucessores descartados
+        self.in_open = False
+
+    def __lt__(self, other):
+        # Desempate nas filas de prioridade, depois de f_score e profundidade: qualquer ordem serve
+        return False
+
+
+@profiled
+def sma_star(graph, start_id, goal_id, max_nodes: int = 1000, heuristic_mode: str = HEURISTIC_MODE,
+             heuristic_cache=None, max_expansions: int = None):
+    """
+    SMA* (A* Simplificado com Memória Limitada): funciona como o A*, mas mantém no máximo
+    'max_nodes' nós da árvore de busca em memória. Quando a memória enche, o pior nó folha
+    (maior f_score, o mais raso no empate) é descartado e o seu f_score fica guardado no pai,
+    que volta à fronteira para gerá-lo de novo se ele voltar a ser a melhor opção.
+    Encontra o caminho ótimo sempre que ele couber na memória (até max_nodes - 1 arestas);
+    quanto menor o orçamento, mais nós são descartados e gerados novamente.
+    O 'max_frontier_size' do resultado é o maior número de nós da árvore em memória.
+    :param max_nodes: orçamento de nós em memória (no mínimo 2).
+    :param max_expansions: limite de expansões. Com um orçamento pouco acima do tamanho do caminho,
+                           o SMA* passa a descartar e regenerar os mesmos nós sem parar (thrashing) e o
+                           tempo cresce exponencialmente; ao atingir o limite, desiste e retorna None.
+                           Padrão: SMA_STAR_EXPANSIONS_PER_NODE vezes o número de nós do grafo (o A*
+                           expande cada nó no máximo uma vez).
+    Não aceita 'workspace' (workspace.py): os vetores do workspace têm um espaço por nó do grafo,
+    justamente a memória O(V) que o SMA* existe para evitar.
+    """
+    if max_nodes < 2:
+        raise ValueError("O SMA* precisa de pelo menos 2 nós de memória.")
+    if max_expansions is None:
+        num_nodes = graph.num_nodes if hasattr(graph, "num_nodes") else len(graph.nodes)
+        max_expansions = SMA_STAR_EXPANSIONS_PER_NODE * max(num_nodes, 1)
+
+    goal_coord = graph.get_node(goal_id).coord
+    h_table = heuristic_cache.table(goal_id) if heuristic_cache is not None else None
+
+    def h(node_id):
+        if h_table is not None:
+            return h_table[node_id]
+        return heuristic(graph.get_node(node_id).coord, goal_coord, heuristic_mode)
+
+    # Duas filas com remoção preguiçosa: 'best' entrega o menor f_score (o mais profundo no
+    # empate) e 'worst' a folha de maior f_score (a mais rasa no empate). Entradas antigas são
+    # ignoradas ao sair e, quando se acumulam demais, são removidas de uma vez.
+    best, worst = [], []
+    open_count = 0  # Nós na fronteira (in_open)
+
+    def best_is_valid(entry):
+        return entry[2].in_open and entry[2].f == entry[0]
+
+    def worst_is_valid(entry):
+        return entry[2].in_open and not entry[2].children and entry[2].f == -entry[0]
+
+    def push(node):
+        heapq.heappush(best, (node.f, -node.depth, node))
+        if not node.children:
+            heapq.heappush(worst, (-node.f, node.depth, node))
+
+    def add_to_open(node):
+        nonlocal open_count
+        if not node.in_open:
+            node.in_open = True
+            open_count += 1
+            push(node)
+
+    def remove_from_open(node):
+        nonlocal open_count
+        if node.in_open:
+            node.in_open = False
+            open_count -= 1
+
+    def compact():
+        # Evita que as entradas antigas façam as filas crescerem muito além da fronteira
+        if len(best) + len(worst) > 4 * open_count + 64:
+            best[:] = [entry for entry in best if best_is_valid(entry)]
+            worst[:] = [entry for entry in worst if worst_is_valid(entry)]
+            heapq.heapify(best)
+            heapq.heapify(worst)
+
+    def backup(node):
+        # Depois que todos os sucessores de um nó foram gerados, o seu f_score passa a ser o menor
+        # f_score entre eles (inclusive os descartados); a mudança sobe pelos ancestrais.
+        while node is not None and node.cursor is None:
+            values = [child.f for child in node.children] if node.children else []
+            if node.forgotten:
+                values.extend(node.forgotten.values())
+            new_f = min(values, default=float('inf'))
+            if new_f == node.f:
+                break
+            node.f = new_f
+            if node.in_open:
+                push(node)
+            node = node.parent
+
+    def forget(node):
+        # Descarta uma folha: o pai guarda o seu f_score e volta à fronteira para poder regenerá-la
+        nonlocal used
+        if in_memory.get(node.node_id) is node:
+            del in_memory[node.node_id]
+        remove_from_open(node)
+        used -= 1
+        parent = node.parent
+        parent.children.remove(node)
+        if node.f < float('inf'):
+            if parent.forgotten is None:
+                parent.forgotten = {}
+            parent.forgotten[node.node_id] = node.f
+        add_to_open(parent)
+        if not parent.children:
+            parent.children = None
+            push(parent)  # O pai virou folha: passa a poder ser descartado
+        backup(parent)
+
+    root = _SMANode(start_id, None, 0, h(start_id), 0)
+    add_to_open(root)
+    # Cópia mais barata em memória de cada nó do grafo: sem ela, o SMA* seria uma busca em árvore e
+    # geraria o mesmo nó por todos os caminhos possíveis (em número exponencial numa malha com ciclos).
+    in_memory = {start_id: root}
+    used = 1  # Nós da árvore em memória
+
+    nodes_expanded = 0
+    edges_evaluated = 0
+    max_frontier_size = 1
+    goal_node = None
+
+    while open_count:
+        # 1. Melhor nó da fronteira: menor f_score, o mais profundo no empate
+        # O nó continua na fronteira até gerar todos os sucessores, então só é consultado no topo
+        f, _, node = best[0]
+        if not best_is_valid(best[0]):
+            heapq.heappop(best)  # Entrada antiga
+            continue
+        if f == float('inf'):
+            break  # Nenhum caminho cabe na memória disponível
+        if node.node_id == goal_id:
+            goal_node = node
+            break
+        if nodes_expanded >= max_expansions:
+            break
+        nodes_expanded += 1
+
+        # Um nó que já usa toda a profundidade permitida não tem espaço para sucessores
+        if node.depth >= max_nodes - 1:
+            node.f = float('inf')
+            forget(node)
+            continue
+
+        # 2. Abre espaço descartando a pior folha da fronteira (nunca o próprio nó em expansão).
+        # Sempre existe uma folha a descartar: só faltaria se a memória inteira fosse o caminho da
+        # raiz até o nó, caso já tratado pelo limite de profundidade acima.
+        held = []
+        while used >= max_nodes and worst:
+            entry = heapq.heappop(worst)
+            victim = entry[2]
+            if not worst_is_valid(entry):
+                continue  # Entrada antiga
+            if victim is node:
+                held.append(entry)
+                continue
+            forget(victim)
+        for entry in held:
+            heapq.heappush(worst, entry)
+
+        # 3. Próximo sucessor a gerar: primeiro os vizinhos nunca gerados, depois o melhor descartado
+        neighbors = list(graph.get_neighbors(node.node_id))
+        neighbor_id = None
+        if node.cursor is not None and node.cursor < len(neighbors):
+            neighbor_id, weight = neighbors[node.cursor]
+            node.cursor += 1
+            forgotten_f = 0
+        elif node.forgotten:
+            neighbor_id = min(node.forgotten, key=node.forgotten.get)
+            forgotten_f = node.forgotten.pop(neighbor_id)
+            if not node.forgotten:
+                node.forgotten = None
+            weight = graph.get_edge_weight(node.node_id, neighbor_id)
+        if node.cursor is not None and node.cursor >= len(neighbors):
+            node.cursor = None  # Todos os vizinhos já foram gerados ao menos uma vez
+
+        if neighbor_id is not None:
+            edges_evaluated += 1
+            # Duplicatas: o vizinho já está em memória por um caminho tão barato quanto este (o que
+            # inclui os ciclos, já que todo ancestral tem custo menor). Ele não é gerado de novo.
+            g = node.g + weight
+            known = in_memory.get(neighbor_id)
+            ancestor = node
+            while ancestor is not None and ancestor.node_id != neighbor_id:
+                ancestor = ancestor.parent
+            if ancestor is None and (known is None or g < known.g):
+                # O f_score do filho nunca é menor que o do pai quando foi escolhido (nem que o valor já
+                # conhecido, se ele tinha sido descartado): os valores são monotônicos ao longo do ramo.
+                child = _SMANode(neighbor_id, node, g, max(f, g + h(neighbor_id), forgotten_f), node.depth + 1)
+                if node.children is None:
+                    node.children = []
+                node.children.append(child)
+                in_memory[neighbor_id] = child
+                used += 1
+                max_frontier_size = max(max_frontier_size, used)
+                add_to_open(child)
+
+        # 4. Sem sucessores pendentes, o nó sai da fronteira e, sem filhos, deixa a memória
+        if node.cursor is None:
+            if not node.forgotten:
+                remove_from_open(node)
+            if not node.children and not node.forgotten and node.parent is not None:
+                node.f = float('inf')
+                forget(node)
+            else:
+                backup(node)
+        compact()
+
+    if goal_node is not None:
+        cost = goal_node.g
+        path_found = []
+        while goal_node is not None:
+            path_found.append(goal_node.node_id)
+            goal_node = goal_node.parent
+        path_found.reverse()
+        return {
+            "name": "SMA*", "path": path_found, "cost": round(cost, 2),
             "nodes_expanded": nodes_expanded, "edges_evaluated": edges_evaluated,
-            "max_frontier_size": max_frontier_size,
-            "cpu_time": cpu_time, "memory_peak_kb": memory_peak_kb
+            "max_frontier_size": max_frontier_size
         }
     return None
 
-def depth_first_search(graph, start_id, goal_id):
+
+def _bidirectional_search(graph, start_id, goal_id, potential=None, workspace=None):
+    """
+    Núcleo comum das buscas bidirecionais: uma busca "para frente" a partir do início e outra
+    "para trás" a partir do objetivo (o grafo é não direcionado, então os vizinhos são os mesmos).
+
+    Com uma função de potencial p(v), as duas buscas equivalem a um Dijkstra bidirecional sobre os
+    pesos reduzidos w(u, v) - p(u) + p(v): a fila da frente usa d_frente(v) + p(v) e a de trás
+    d_tras(v) - p(v). A busca termina quando a soma dos topos das duas filas alcança o custo
+    do melhor caminho já encontrado (mu). Sem potencial, é o Dijkstra bidirecional clássico.
+    Retorna (caminho, custo, métricas).
+    """
+    if potential is None:
+        potential = lambda node_id: 0.0
+    # sign = +1 para a busca da frente e -1 para a de trás
+    signs = (1, -1)
+    p_start, p_goal = potential(start_id), potential(goal_id)
+    if workspace is not None:
+        workspace.begin()
+        dist = (workspace.distances, workspace.reverse_distances)
+        came_from = (workspace.parents, workspace.reverse_parents)
+        closed = (workspace.closed, workspace.reverse_closed)
+    else:
+        dist, came_from, closed = ({}, {}), ({}, {}), (set(), set())
+    dist[0][start_id] = 0
+    dist[1][goal_id] = 0
+    queues = ([(p_start, start_id)], [(-p_goal, goal_id)])
+
+    best_cost = float('inf')  # mu: custo do melhor caminho completo encontrado até agora
+    meeting_id = None
+
+    nodes_expanded = 0
+    edges_evaluated = 0
+    max_frontier_size = 2
+
+    while queues[0] and queues[1]:
+        max_frontier_size = max(max_frontier_size, len(queues[0]) + len(queues[1]))
+        # Critério de parada: nenhum caminho ainda não visto pode ser mais barato que mu.
+        if queues[0][0][0] + queues[1][0][0] >= best_cost:
+            break
+
+        # Expande o lado com a menor fronteira, equilibrando as duas buscas
+        side = 0 if len(queues[0]) <= len(queues[1]) else 1
+        pq, sign = queues[side], signs[side]
+        _, current_id = heapq.heappop(pq)
+        if current_id in closed[side]:
+            continue  # Entrada antiga (o nó já foi expandido com um custo menor)
+        closed[side].add(current_id)
+        nodes_expanded += 1
+
+        other_dist = dist[1 - side]
+        current_cost = dist[side][current_id]
+        for neighbor_id, weight in graph.get_neighbors(current_id):
+            edges_evaluated += 1
+            new_cost = current_cost + weight
+            if new_cost < dist[side].get(neighbor_id, float('inf')):
+                dist[side][neighbor_id] = new_cost
+                came_from[side][neighbor_id] = current_id
+                heapq.heappush(pq, (new_cost + sign * potential(neighbor_id), neighbor_id))
+                # Se o vizinho já foi alcançado pela outra busca, temos um caminho completo.
+                if neighbor_id in other_dist and new_cost + other_dist[neighbor_id] < best_cost:
+                    best_cost = new_cost + other_dist[neighbor_id]
+                    meeting_id = neighbor_id
+
+    metrics = {
+        "nodes_expanded": nodes_expanded, "edges_evaluated": edges_evaluated,
+        "max_frontier_size": max_frontier_size,
+    }
+    if start_id == goal_id:
+        return [start_id], 0, metrics
+    if meeting_id is None:
+        return None, float('inf'), metrics
+
+    # Início -> encontro (busca da frente) + encontro -> objetivo (busca de trás)
+    path = reconstruct_path(came_from[0], meeting_id)
+    current_id = meeting_id
+    while current_id in came_from[1]:
+        current_id = came_from[1][current_id]
+        path.append(current_id)
+    return path, best_cost, metrics
+
+
+@profiled
+def bidirectional_dijkstra(graph, start_id, goal_id, workspace=None):
+    """
+    Dijkstra Bidirecional: roda um Dijkstra a partir do início e outro a partir do objetivo,
+    ao mesmo tempo, até as duas "bolhas" de busca se encontrarem. Cada bolha tem cerca de
+    metade do raio de uma busca única, o que reduz bastante a região explorada em rotas longas.
+    """
+    path_found, cost, metrics = _bidirectional_search(graph, start_id, goal_id, workspace=workspace)
+
+    if path_found:
+        return {
+            "name": "Bidirectional Dijkstra", "path": path_found, "cost": round(cost, 2),
+            "nodes_expanded": metrics["nodes_expanded"], "edges_evaluated": metrics["edges_evaluated"],
+            "max_frontier_size": metrics["max_frontier_size"]
+        }
+    return None
+
+
+@profiled
+def bidirectional_a_star(graph, start_id, goal_id, heuristic_mode: str = HEURISTIC_MODE, heuristic_cache=None,
+                         workspace=None):
+    """
+    A* Bidirecional: combina as duas buscas do Dijkstra Bidirecional com heurística.
+    Para que as duas direções sejam compatíveis, usa o potencial médio
+        p(v) = (h(v, objetivo) - h(v, início)) / 2
+    que é consistente quando a heurística é consistente (como a distância em linha reta).
+    A busca da frente é guiada para o objetivo e a de trás para o início.
+    """
+    start_coord = graph.get_node(start_id).coord
+    goal_coord = graph.get_node(goal_id).coord
+    if heuristic_cache is not None:
+        to_goal = heuristic_cache.table(goal_id)
+        to_start = heuristic_cache.table(start_id)
+        potential = lambda node_id: (to_goal[node_id] - to_start[node_id]) / 2
+    else:
+        potentials = {}
+
+        def potential(node_id):
+            # Cada nó tem o potencial calculado uma única vez
+            value = potentials.get(node_id)
+            if value is None:
+                coord = graph.get_node(node_id).coord
+                value = (heuristic(coord, goal_coord, heuristic_mode) -
+                         heuristic(coord, start_coord, heuristic_mode)) / 2
+                potentials[node_id] = value
+            return value
+
+    path_found, cost, metrics = _bidirectional_search(graph, start_id, goal_id, potential, workspace)
+
+    if path_found:
+        return {
+            "name": "Bidirectional A*", "path": path_found, "cost": round(cost, 2),
+            "nodes_expanded": metrics["nodes_expanded"], "edges_evaluated": metrics["edges_evaluated"],
+            "max_frontier_size": metrics["max_frontier_size"]
+        }
+    return None
+
+
+@profiled
+def contraction_hierarchy_search(graph, start_id, goal_id, hierarchy):
+    """
+    Consulta em Contraction Hierarchies: usa uma ContractionHierarchy (contraction_hierarchies.py)
+    pré-processada a partir do grafo. A busca é bidirecional e só "sobe" na hierarquia, por isso
+    expande pouquíssimos nós; os atalhos do caminho são desempacotados nas arestas originais.
+    O custo encontrado é o mesmo do Dijkstra.
+    """
+    path_found, cost, metrics = hierarchy.query(start_id, goal_id)
+
+    if path_found:
+        return {
+            "name": "CH", "path": path_found, "cost": round(cost, 2),
+            "nodes_expanded": metrics["nodes_expanded"], "edges_evaluated": metrics["edges_evaluated"],
+            "max_frontier_size": metrics["max_frontier_size"]
+        }
+    return None
+
+
+@profiled
+def partition_search(graph, start_id, goal_id, partition):
+    """
+    Consulta por regiões (CRP): usa uma MultiLevelPartition (partitioning.py) da malha. A busca só
+    abre as células da origem e do destino; no resto, pula entre nós de fronteira pelas cliques
+    pré-calculadas, que são desempacotadas no caminho final. O custo é o mesmo do Dijkstra.
+    """
+    path_found, cost, metrics = partition.query(start_id, goal_id)
+
+    if path_found:
+        return {
+            "name": "CRP", "path": path_found, "cost": round(cost, 2),
+            "nodes_expanded": metrics["nodes_expanded"], "edges_evaluated": metrics["edges_evaluated"],
+            "max_frontier_size": metrics["max_frontier_size"]
+        }
+    return None
+
+
+@profiled
+def depth_first_search(graph, start_id, goal_id, workspace=None):
     """
     Busca em Profundidade (DFS): Explora um caminho até o mais fundo possível antes
     de voltar e tentar outro. Usa uma Pilha (Stack).
     Não é bom para achar caminhos mais curtos, mas é simples e usa pouca memória.
     """
-    # --- Início do Profiling ---
-    process = psutil.Process()
-    tracemalloc.start()
-    cpu_time_start = process.cpu_times()
-
     # Pilha (Stack LIFO - Último a entrar, primeiro a sair).
-    # Armazena (id_do_no, caminho_feito_ate_aqui)
-    stack = [(start_id, [start_id])]
-    visited = {start_id}
+    # Armazena apenas o id do nó; o caminho é refeito no final a partir de 'came_from',
+    # em vez de cada entrada da pilha carregar uma cópia do caminho até ali.
+    # 'came_from' também faz o papel de conjunto de visitados (o início não tem pai).
+    stack = [start_id]
+    came_from = workspace.begin().parents if workspace is not None else {}
+    came_from[start_id] = None
 
     nodes_expanded = 0
     edges_evaluated = 0
@@ -285,52 +882,42 @@ def depth_first_search(graph, start_id, goal_id):
     while stack:
         max_frontier_size = max(max_frontier_size, len(stack))
         # .pop() remove o último item adicionado, o que causa o comportamento de "mergulhar fundo".
-        current_id, path = stack.pop()
+        current_id = stack.pop()
         nodes_expanded += 1
 
         if current_id == goal_id:
-            path_found = path
+            path_found = reconstruct_path(came_from, current_id)
             break
 
-        for neighbor_id in graph.get_neighbors(current_id):
+        for neighbor_id, weight in graph.get_neighbors(current_id):
             edges_evaluated += 1
-            if neighbor_id not in visited:
-                visited.add(neighbor_id)
+            if neighbor_id not in came_from:
+                came_from[neighbor_id] = current_id
                 # Adiciona o vizinho no topo da pilha. Ele será o próximo a ser explorado.
-                stack.append((neighbor_id, path + [neighbor_id]))
-
-    cpu_time_end = process.cpu_times()
-    mem_peak = tracemalloc.get_traced_memory()[1]
-    tracemalloc.stop()
-
-    cpu_time = (cpu_time_end.user - cpu_time_start.user) + (cpu_time_end.system - cpu_time_start.system)
-    memory_peak_kb = round(mem_peak / 1024, 2)
+                stack.append(neighbor_id)
 
     if path_found:
         cost = sum(graph.get_edge_weight(path_found[i], path_found[i+1]) for i in range(len(path_found) - 1))
         return {
             "name": "DFS", "path": path_found, "cost": round(cost, 2),
             "nodes_expanded": nodes_expanded, "edges_evaluated": edges_evaluated,
-            "max_frontier_size": max_frontier_size,
-            "cpu_time": cpu_time, "memory_peak_kb": memory_peak_kb
+            "max_frontier_size": max_frontier_size
         }
     return None
 
 
-def breadth_first_search(graph, start_id, goal_id):
+@profiled
+def breadth_first_search(graph, start_id, goal_id, workspace=None):
     """
     Busca em Largura (BFS): Explora todos os vizinhos de um nó antes de seguir
     para o próximo nível. Usa uma Fila (Queue).
     Garante o caminho com o MENOR NÚMERO DE ARESTAS, mas não necessariamente o menor custo.
     """
-    # --- Início do Profiling ---
-    process = psutil.Process()
-    tracemalloc.start()
-    cpu_time_start = process.cpu_times()
-
     # Fila (Queue FIFO - Primeiro a entrar, primeiro a sair).
-    queue = deque([(start_id, [start_id])])
-    visited = {start_id}
+    # Assim como na DFS, guarda só o id do nó e o "pai" de cada um em 'came_from'.
+    queue = deque([start_id])
+    came_from = workspace.begin().parents if workspace is not None else {}
+    came_from[start_id] = None
 
     nodes_expanded = 0
     edges_evaluated = 0
@@ -340,34 +927,26 @@ def breadth_first_search(graph, start_id, goal_id):
     while queue:
         max_frontier_size = max(max_frontier_size, len(queue))
         # .popleft() remove o item mais antigo, o que causa a exploração "em camadas".
-        current_id, path = queue.popleft()
+        current_id = queue.popleft()
         nodes_expanded += 1
 
         if current_id == goal_id:
-            path_found = path
+            path_found = reconstruct_path(came_from, current_id)
             break
 
-        for neighbor_id in graph.get_neighbors(current_id):
+        for neighbor_id, weight in graph.get_neighbors(current_id):
             edges_evaluated += 1  # Conta a avaliação de uma aresta
-            if neighbor_id not in visited:
-                visited.add(neighbor_id)
+            if neighbor_id not in came_from:
+                came_from[neighbor_id] = current_id
                 # Adiciona o vizinho no final da fila. Ele só será explorado depois de todos
                 # os outros que já estavam lá.
-                queue.append((neighbor_id, path + [neighbor_id]))
-
-    cpu_time_end = process.cpu_times()
-    mem_peak = tracemalloc.get_traced_memory()[1]
-    tracemalloc.stop()
-
-    cpu_time = (cpu_time_end.user - cpu_time_start.user) + (cpu_time_end.system - cpu_time_start.system)
-    memory_peak_kb = round(mem_peak / 1024, 2)
+                queue.append(neighbor_id)
 
     if path_found:
         cost = sum(graph.get_edge_weight(path_found[i], path_found[i + 1]) for i in range(len(path_found) - 1))
         return {
             "name": "BFS", "path": path_found, "cost": round(cost, 2),
             "nodes_expanded": nodes_expanded, "edges_evaluated": edges_evaluated,
-            "max_frontier_size": max_frontier_size,
-            "cpu_time": cpu_time, "memory_peak_kb": memory_peak_kb
+            "max_frontier_size": max_frontier_size
         }
     return None
\ No newline at end of file
@@ -0,0 +1,57 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from algorithms import shortest_path_tree
+
+# Grafo de cada processo do pool, recebido uma única vez na inicialização do worker
+_worker_graph = None
+
+
+def _init_worker(graph):
+    global _worker_graph
+    _worker_graph = graph
+
+
+def _distances_row(graph, source_id, targets):
+    """Distâncias de source_id até cada destino (inf se inalcançável), a partir de uma árvore de caminhos mínimos."""
+    distances, _ = shortest_path_tree(graph, source_id, targets)
+    return [distances.get(target_id, float("inf")) for target_id in targets]
+
+
+def _worker_row(args):
+    source_id, targets = args
+    return _distances_row(_worker_graph, source_id, targets)
+
+
+def many_to_many(graph, sources, targets, workers: int = 1) -> np.ndarray:
+    """
+    Matriz de distâncias de rede (km) entre uma lista de origens e uma lista de destinos.
+    Cada origem distinta gera uma única árvore de caminhos mínimos, reaproveitada para todos
+    os destinos. Como a malha é não direcionada, as árvores são calculadas a partir do menor
+    dos dois conjuntos e a matriz é transposta quando necessário.
+    :param workers: número de processos; com mais de um, as árvores são distribuídas em um
+                    ProcessPoolExecutor (o grafo é enviado uma única vez para cada processo).
+    :return: array (len(sources), len(targets)), com inf para pares sem caminho.
+    """
+    sources, targets = list(sources), list(targets)
+    transpose = len(set(targets)) < len(set(sources))
+    if transpose:
+        sources, targets = targets, sources
+
+    unique_sources = list(dict.fromkeys(sources))
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1 or len(unique_sources) <= 1:
+        rows = [_distances_row(graph, source_id, targets) for source_id in unique_sources]
+    else:
+        tasks = [(source_id, targets) for source_id in unique_sources]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(graph,)) as executor:
+            rows = list(executor.map(_worker_row, tasks, chunksize=max(1, len(tasks) // (4 * workers))))
+
+    row_of = dict(zip(unique_sources, rows))
+    matrix = np.array([row_of[source_id] for source_id in sources], dtype=np.float64).reshape(
+        len(sources), len(targets))
+    return matrix.T if transpose else matrix
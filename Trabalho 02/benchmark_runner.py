@@ -0,0 +1,83 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from instrumentation import instrumentation, MEMORY, OFF
+from timing import measure
+
+# Contexto de benchmark de cada processo: montado uma única vez por worker, na inicialização
+_context = None
+
+
+def _init_worker(setup, setup_args):
+    """Monta o contexto (grafo, pré-processamentos e algoritmos) uma vez por processo."""
+    global _context
+    _context = setup(*setup_args)
+
+
+def _run_task(task):
+    """
+    Mede um algoritmo em um desafio.
+    - Resultado (caminho, custo e contadores): uma execução com a instrumentação desligada (OFF),
+      que é determinística.
+    - Tempo de CPU: timing.measure, também no modo OFF, para que a medição não inclua o custo dos
+      próprios contadores de tempo do decorador.
+    - Memória: execuções separadas no modo MEMORY, cujo tracemalloc deixaria o tempo inválido.
+    """
+    query_index, algorithm_name, memory_runs, timing_options = task
+    algorithm_func, options = _context["algorithms"][algorithm_name]
+    graph = _context["graph"]
+    start_id, goal_id = _context["queries"][query_index]
+
+    with instrumentation(OFF):
+        result = algorithm_func(graph, start_id, goal_id, **options)
+    if not result:
+        return task, None
+
+    with instrumentation(OFF):
+        cpu_stats = measure(lambda: algorithm_func(graph, start_id, goal_id, **options), **timing_options)
+
+    memory_peaks = []
+    for _ in range(memory_runs):
+        with instrumentation(MEMORY):
+            memory_peaks.append(algorithm_func(graph, start_id, goal_id, **options)["memory_peak_kb"])
+
+    return task, {"result": result, "cpu": cpu_stats, "memory_peaks": memory_peaks}
+
+
+def run_benchmark_matrix(setup, setup_args, num_queries: int, algorithm_names: list, workers: int = None,
+                         memory_runs: int = 3, context: dict = None, **timing_options) -> dict:
+    """
+    Executa a matriz (consulta x algoritmo) em paralelo.
+    :param setup: função de nível de módulo que recebe *setup_args e retorna o contexto, um dict com
+                  "graph", "queries" (lista de (início, objetivo)) e "algorithms"
+                  ({nome: (função, opções)}). É chamada uma vez em cada processo.
+    :param workers: número de processos (padrão: número de CPUs). Com 1, roda no próprio processo.
+    :param memory_runs: execuções com tracemalloc para o pico de memória.
+    :param context: contexto já montado por quem chamou. Com 1 worker, é usado no lugar de setup,
+                    que não é chamado; com vários, é ignorado (cada worker monta o seu).
+    :param timing_options: parâmetros repassados para timing.measure (ex.: time_budget).
+    :return: {(indice_consulta, nome_algoritmo): {"result": dict, "cpu": estatísticas do timing.measure,
+             "memory_peaks": [...]}}; pares sem caminho ficam de fora.
+    """
+    global _context
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    tasks = [
+        (query_index, algorithm_name, memory_runs, timing_options)
+        for query_index in range(num_queries)
+        for algorithm_name in algorithm_names
+    ]
+
+    if workers <= 1:
+        if context is not None:
+            _context = context
+        else:
+            _init_worker(setup, setup_args)
+        outputs = [_run_task(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(setup, setup_args)) as executor:
+            outputs = list(executor.map(_run_task, tasks))
+
+    return {(task[0], task[1]): output for task, output in outputs if output is not None}
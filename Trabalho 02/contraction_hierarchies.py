@@ -0,0 +1,262 @@
+import heapq
+import numpy as np
+
+
+class ContractionHierarchy:
+    """
+    Contraction Hierarchies (CH) para consultas ponto a ponto em uma malha estática.
+
+    Pré-processamento: os nós são "contraídos" um a um, do menos para o mais importante.
+    Ao remover um nó v, cada par de vizinhos (u, w) que dependia de v para o menor caminho
+    ganha um atalho (shortcut) u-w com peso w(u, v) + w(v, w), lembrando v como nó do meio.
+    Ao final, cada nó guarda apenas as arestas "para cima" (para nós de ordem maior).
+
+    Consulta: uma busca bidirecional que só sobe na hierarquia, a partir da origem e do
+    destino. Como o grafo é não direcionado, as duas buscas usam o mesmo grafo ascendente.
+    Os atalhos do caminho encontrado são desempacotados recursivamente até as arestas originais.
+    """
+
+    def __init__(self, node_ids, rank, up_edges):
+        self.node_ids = list(node_ids)  # índice denso -> ID externo
+        self.rank = rank  # ordem de contração de cada nó (índice denso)
+        # up_edges[v] = {u: (peso, meio)} para rank[u] > rank[v]; meio = -1 para arestas originais
+        self.up_edges = up_edges
+        self._index = {node_id: i for i, node_id in enumerate(self.node_ids)}
+
+    # --- Pré-processamento ---
+
+    @classmethod
+    def build(cls, graph, witness_settle_limit: int = 50):
+        """
+        Constrói a hierarquia a partir de um Graph ou FrozenGraph.
+        :param witness_settle_limit: número máximo de nós fixados em cada busca de testemunha.
+                                     Limites menores aceleram o pré-processamento ao custo de
+                                     alguns atalhos desnecessários (o resultado continua correto).
+        """
+        node_ids = [node.id for node in graph.nodes]
+        index = {node_id: i for i, node_id in enumerate(node_ids)}
+        n = len(node_ids)
+
+        # Grafo restante (ainda não contraído): adj[v] = {u: (peso, meio)}
+        adj = [dict() for _ in range(n)]
+        for v, node_id in enumerate(node_ids):
+            for neighbor_id, weight in graph.get_neighbors(node_id):
+                u = index[neighbor_id]
+                if u != v and weight < adj[v].get(u, (float("inf"), -1))[0]:
+                    adj[v][u] = (weight, -1)
+
+        builder = _Builder(adj, witness_settle_limit)
+        rank, up_edges = builder.contract_all()
+        return cls(node_ids, rank, up_edges)
+
+    # --- Consulta ---
+
+    def query(self, start_id: int, goal_id: int):
+        """
+        Busca bidirecional ascendente.
+        Retorna (caminho, custo, métricas) ou (None, inf, métricas) se não houver caminho.
+        """
+        s, t = self._index[start_id], self._index[goal_id]
+        dist = ({s: 0.0}, {t: 0.0})
+        parent = ({}, {})
+        queues = ([(0.0, s)], [(0.0, t)])
+        settled = (set(), set())
+        best, meeting = float("inf"), None
+
+        nodes_expanded = 0
+        edges_evaluated = 0
+        max_frontier_size = 2
+
+        # Alterna entre as duas direções; cada uma para quando seu menor custo já não pode melhorar 'best'.
+        while queues[0] or queues[1]:
+            max_frontier_size = max(max_frontier_size, len(queues[0]) + len(queues[1]))
+            for side in (0, 1):
+                pq = queues[side]
+                if not pq:
+                    continue
+                if pq[0][0] >= best:
+                    pq.clear()
+                    continue
+                cost, v = heapq.heappop(pq)
+                if v in settled[side]:
+                    continue
+                settled[side].add(v)
+                nodes_expanded += 1
+
+                # Ponto de encontro: nó alcançado pelas duas buscas
+                other_cost = dist[1 - side].get(v)
+                if other_cost is not None and cost + other_cost < best:
+                    best, meeting = cost + other_cost, v
+
+                for u, (weight, _) in self.up_edges[v].items():
+                    edges_evaluated += 1
+                    new_cost = cost + weight
+                    if new_cost < dist[side].get(u, float("inf")):
+                        dist[side][u] = new_cost
+                        parent[side][u] = v
+                        heapq.heappush(pq, (new_cost, u))
+
+        metrics = {
+            "nodes_expanded": nodes_expanded, "edges_evaluated": edges_evaluated,
+            "max_frontier_size": max_frontier_size,
+        }
+        if meeting is None:
+            return None, float("inf"), metrics
+
+        # Caminho na hierarquia: origem -> encontro (invertido) + encontro -> destino
+        forward = [meeting]
+        while forward[-1] in parent[0]:
+            forward.append(parent[0][forward[-1]])
+        forward.reverse()
+        backward = [meeting]
+        while backward[-1] in parent[1]:
+            backward.append(parent[1][backward[-1]])
+        up_path = forward + backward[1:]
+
+        path = [up_path[0]]
+        for a, b in zip(up_path, up_path[1:]):
+            self._unpack(a, b, path)
+        return [self.node_ids[v] for v in path], best, metrics
+
+    def _unpack(self, a: int, b: int, path: list):
+        """Acrescenta a 'path' os nós da aresta a-b (sem 'a'), desempacotando atalhos."""
+        # O nó do meio de um atalho foi contraído antes das duas pontas, por isso é
+        # substituído por dois pedaços até chegar às arestas originais.
+        stack = [(a, b)]
+        while stack:
+            a, b = stack.pop()
+            low, high = (a, b) if self.rank[a] < self.rank[b] else (b, a)
+            middle = self.up_edges[low][high][1]
+            if middle < 0:
+                path.append(b)
+            else:
+                # Processa (a, meio) antes de (meio, b): empilha na ordem inversa
+                stack.append((middle, b))
+                stack.append((a, middle))
+
+    # --- Serialização ---
+
+    def save(self, filename: str):
+        """Salva a hierarquia em um arquivo .npz (vetores CSR do grafo ascendente)."""
+        offsets = np.zeros(len(self.node_ids) + 1, dtype=np.int64)
+        targets, weights, middles = [], [], []
+        for v, edges in enumerate(self.up_edges):
+            for u, (weight, middle) in edges.items():
+                targets.append(u)
+                weights.append(weight)
+                middles.append(middle)
+            offsets[v + 1] = len(targets)
+        np.savez(
+            filename,
+            node_ids=np.array(self.node_ids, dtype=np.int64),
+            rank=np.asarray(self.rank, dtype=np.int64),
+            offsets=offsets,
+            targets=np.array(targets, dtype=np.int64),
+            weights=np.array(weights, dtype=np.float64),
+            middles=np.array(middles, dtype=np.int64),
+        )
+
+    @classmethod
+    def load(cls, filename: str):
+        """Carrega uma hierarquia salva com save()."""
+        with np.load(filename) as data:
+            offsets = data["offsets"].tolist()
+            targets = data["targets"].tolist()
+            weights = data["weights"].tolist()
+            middles = data["middles"].tolist()
+            up_edges = [
+                {targets[k]: (weights[k], middles[k]) for k in range(offsets[v], offsets[v + 1])}
+                for v in range(len(offsets) - 1)
+            ]
+            return cls(data["node_ids"].tolist(), data["rank"].tolist(), up_edges)
+
+    @property
+    def num_shortcuts(self) -> int:
+        return sum(1 for edges in self.up_edges for _, middle in edges.values() if middle >= 0)
+
+
+class _Builder:
+    """Estado temporário da contração (grafo restante, prioridades e testemunhas)."""
+
+    def __init__(self, adj, witness_settle_limit: int):
+        self.adj = adj
+        self.witness_settle_limit = witness_settle_limit
+        self.contracted = [False] * len(adj)
+        # Quantos vizinhos de cada nó já foram contraídos (espalha a contração pela malha)
+        self.deleted_neighbors = [0] * len(adj)
+
+    def _witness_distances(self, source: int, avoid: int, max_cost: float) -> dict:
+        """Dijkstra local a partir de 'source', sem passar por 'avoid', limitado em custo e tamanho."""
+        dist = {source: 0.0}
+        pq = [(0.0, source)]
+        settled = 0
+        while pq and settled < self.witness_settle_limit:
+            cost, v = heapq.heappop(pq)
+            if cost > dist[v]:
+                continue
+            if cost > max_cost:
+                break
+            settled += 1
+            for u, (weight, _) in self.adj[v].items():
+                if u == avoid:
+                    continue
+                new_cost = cost + weight
+                if new_cost < dist.get(u, float("inf")):
+                    dist[u] = new_cost
+                    heapq.heappush(pq, (new_cost, u))
+        return dist
+
+    def _shortcuts_for(self, v: int) -> list:
+        """Lista os atalhos (u, w, peso) necessários para contrair v."""
+        neighbors = list(self.adj[v].items())
+        shortcuts = []
+        for i, (u, (weight_u, _)) in enumerate(neighbors):
+            targets = neighbors[i + 1:]
+            if not targets:
+                continue
+            max_cost = weight_u + max(weight for _, (weight, _) in targets)
+            witness = self._witness_distances(u, v, max_cost)
+            for w, (weight_w, _) in targets:
+                via_v = weight_u + weight_w
+                if witness.get(w, float("inf")) > via_v:
+                    shortcuts.append((u, w, via_v))
+        return shortcuts
+
+    def _priority(self, v: int) -> int:
+        """Diferença de arestas (atalhos criados - arestas removidas) + vizinhos já contraídos."""
+        return len(self._shortcuts_for(v)) - len(self.adj[v]) + self.deleted_neighbors[v]
+
+    def contract_all(self):
+        n = len(self.adj)
+        pq = [(self._priority(v), v) for v in range(n)]
+        heapq.heapify(pq)
+        rank = [0] * n
+        up_edges = [None] * n
+        order = 0
+
+        while pq:
+            _, v = heapq.heappop(pq)
+            if self.contracted[v]:
+                continue
+            # Atualização preguiçosa: se a prioridade mudou e já não é a menor, devolve à fila
+            priority = self._priority(v)
+            if pq and priority > pq[0][0]:
+                heapq.heappush(pq, (priority, v))
+                continue
+
+            for u, w, weight in self._shortcuts_for(v):
+                if weight < self.adj[u].get(w, (float("inf"), -1))[0]:
+                    self.adj[u][w] = (weight, v)
+                    self.adj[w][u] = (weight, v)
+
+            # As arestas restantes de v apontam todas para nós contraídos depois (ordem maior)
+            up_edges[v] = self.adj[v]
+            for u in self.adj[v]:
+                del self.adj[u][v]
+                self.deleted_neighbors[u] += 1
+            self.adj[v] = {}
+            self.contracted[v] = True
+            rank[v] = order
+            order += 1
+
+        return rank, up_edges
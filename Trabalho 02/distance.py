@@ -0,0 +1,73 @@
+import numpy as np
+from geopy.distance import geodesic
+
+# Raio médio da Terra (IUGG), usado nas aproximações esféricas.
+EARTH_RADIUS_KM = 6371.0088
+# Menor raio de curvatura do elipsoide WGS-84 (meridiano no Equador). Usando este raio,
+# a distância esférica nunca supera a geodésica, o que mantém a heurística admissível.
+EARTH_MIN_RADIUS_KM = 6335.439
+
+# Modos de cálculo disponíveis:
+# - "geodesic": distância exata sobre o elipsoide (geopy), resolvida iterativamente, lenta.
+# - "haversine": distância sobre a esfera (vetorizada com NumPy), rápida.
+# - "equirectangular": projeção plana local (vetorizada), a mais rápida; boa para distâncias
+#   curtas, mas pode superestimar a distância em trechos longos.
+DISTANCE_MODES = ("geodesic", "haversine", "equirectangular")
+
+
+def _split(coords):
+    """Converte coordenadas (lat, lon) em graus para dois vetores em radianos."""
+    coords = np.radians(np.asarray(coords, dtype=np.float64).reshape(-1, 2))
+    return coords[:, 0], coords[:, 1]
+
+
+def haversine_km(lat1, lon1, lat2, lon2, radius: float = EARTH_RADIUS_KM):
+    """
+    Fórmula de haversine, com latitudes e longitudes em radianos.
+    Aceita escalares ou vetores NumPy (com broadcasting).
+    """
+    h = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * radius * np.arcsin(np.sqrt(np.minimum(h, 1.0)))
+
+
+def equirectangular_km(lat1, lon1, lat2, lon2, radius: float = EARTH_RADIUS_KM):
+    """
+    Aproximação equirretangular, com latitudes e longitudes em radianos.
+    Aceita escalares ou vetores NumPy (com broadcasting).
+    """
+    x = (lon2 - lon1) * np.cos((lat1 + lat2) / 2)
+    y = lat2 - lat1
+    return radius * np.sqrt(x * x + y * y)
+
+
+def many_to_many(coords_a, coords_b, mode: str = "haversine", radius: float = EARTH_RADIUS_KM):
+    """
+    Calcula a matriz de distâncias (em km) entre dois conjuntos de coordenadas (lat, lon).
+    Retorna um array de formato (len(coords_a), len(coords_b)).
+    """
+    if mode == "geodesic":
+        coords_b = list(coords_b)
+        return np.array([[geodesic(a, b).km for b in coords_b] for a in coords_a], dtype=np.float64).reshape(
+            -1, len(coords_b))
+
+    lat_a, lon_a = _split(coords_a)
+    lat_b, lon_b = _split(coords_b)
+    if mode == "haversine":
+        kernel = haversine_km
+    elif mode == "equirectangular":
+        kernel = equirectangular_km
+    else:
+        raise ValueError(f"Modo de distância desconhecido: '{mode}'. Use um de {DISTANCE_MODES}.")
+    return kernel(lat_a[:, None], lon_a[:, None], lat_b[None, :], lon_b[None, :], radius)
+
+
+def one_to_many(origin, coords, mode: str = "haversine", radius: float = EARTH_RADIUS_KM):
+    """Calcula as distâncias (em km) de uma coordenada de origem para várias outras."""
+    return many_to_many([origin], coords, mode, radius)[0]
+
+
+def distance(coord1, coord2, mode: str = "geodesic", radius: float = EARTH_RADIUS_KM) -> float:
+    """Calcula a distância (em km) entre duas coordenadas (lat, lon)."""
+    if mode == "geodesic":
+        return geodesic(coord1, coord2).km
+    return float(one_to_many(coord1, [coord2], mode, radius)[0])
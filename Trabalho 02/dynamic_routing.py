@@ -0,0 +1,217 @@
+import heapq
+
+from algorithms import heuristic, HEURISTIC_MODE
+
+
+class DynamicShortestPath:
+    """
+    Caminhos mínimos incrementais (LPA* / D* Lite) sobre um Graph que muda com o tempo.
+    Calcula uma vez a busca a partir de 'source_id' e, depois de alterações nas arestas
+    (Graph.update_edge_weight, remove_edge, add_edge), repara apenas a região afetada em vez
+    de refazer a busca inteira.
+    - Sem 'target_id', mantém a árvore de caminhos mínimos de source_id até todos os nós
+      (como shortest_path_tree, com heurística nula).
+    - Com 'target_id', é um A* incremental (LPA*): só o necessário para o caminho até o alvo.
+      Para um veículo em movimento, use o destino como source_id e a posição do veículo como
+      target_id, chamando move_target a cada avanço (D* Lite): como a malha é não direcionada,
+      a rota do veículo é o caminho encontrado, invertido.
+
+    Cada nó tem dois valores: g (a distância já consolidada) e rhs (a melhor distância segundo os
+    vizinhos). Nós com g != rhs são "inconsistentes" e ficam na fila; uma alteração de aresta só
+    torna inconsistentes as suas pontas, e o reparo se espalha a partir delas.
+    A heurística precisa continuar admissível: pesos alterados não devem ficar abaixo da distância
+    em linha reta entre as pontas da aresta (interdições e aumentos de peso sempre servem).
+    """
+
+    def __init__(self, graph, source_id: int, target_id: int = None, heuristic_mode: str = HEURISTIC_MODE):
+        self.graph = graph
+        self.source_id = source_id
+        self.target_id = target_id
+        self.heuristic_mode = heuristic_mode
+        self._g = {}
+        self._rhs = {source_id: 0}
+        self._queue = []  # Heap com remoção preguiçosa: entradas (chave, id_no)
+        self._queue_keys = {}  # {id_no: chave atual} dos nós na fila
+        self._key_modifier = 0  # km do D* Lite: soma das heurísticas entre as posições do alvo
+        self._h_values = {}  # Heurística já calculada de cada nó até o alvo atual
+        self._push(source_id)
+
+        graph.track_edge_changes()
+        self._version = graph.version
+        # Contadores do último cálculo ou reparo (ver route)
+        self.nodes_expanded = 0
+        self.edges_evaluated = 0
+        self.max_frontier_size = 0
+
+    # --- Estado dos nós ---
+
+    def _h(self, node_id: int) -> float:
+        if self.target_id is None:
+            return 0
+        h = self._h_values.get(node_id)
+        if h is None:
+            h = heuristic(self.graph.get_node(node_id).coord, self.graph.get_node(self.target_id).coord,
+                          self.heuristic_mode)
+            self._h_values[node_id] = h
+        return h
+
+    def _key(self, node_id: int) -> tuple:
+        best = min(self._g.get(node_id, float('inf')), self._rhs.get(node_id, float('inf')))
+        return best + self._h(node_id) + self._key_modifier, best
+
+    def _push(self, node_id: int):
+        key = self._key(node_id)
+        self._queue_keys[node_id] = key
+        heapq.heappush(self._queue, (key, node_id))
+
+    def _top(self):
+        """Entrada válida de menor chave da fila (descartando as antigas), ou None."""
+        while self._queue:
+            key, node_id = self._queue[0]
+            if self._queue_keys.get(node_id) == key:
+                return key, node_id
+            heapq.heappop(self._queue)
+        return None
+
+    def _update_queue(self, node_id: int):
+        """Coloca o nó na fila se estiver inconsistente (g != rhs); caso contrário, tira."""
+        if self._g.get(node_id, float('inf')) != self._rhs.get(node_id, float('inf')):
+            self._push(node_id)
+        else:
+            self._queue_keys.pop(node_id, None)
+
+    def _recompute_rhs(self, node_id: int):
+        """rhs = menor g(vizinho) + peso entre os vizinhos (a origem tem rhs 0)."""
+        if node_id == self.source_id:
+            return
+        best = float('inf')
+        for neighbor_id, weight in self.graph.get_neighbors(node_id):
+            self.edges_evaluated += 1
+            best = min(best, self._g.get(neighbor_id, float('inf')) + weight)
+        self._rhs[node_id] = best
+        self._update_queue(node_id)
+
+    # --- Busca e reparo ---
+
+    def _done(self) -> bool:
+        top = self._top()
+        if top is None:
+            return True
+        if self.target_id is None:
+            return False
+        target = self.target_id
+        return (top[0] >= self._key(target)
+                and self._rhs.get(target, float('inf')) == self._g.get(target, float('inf')))
+
+    def _reset_counters(self):
+        self.nodes_expanded = 0
+        self.edges_evaluated = 0
+        self.max_frontier_size = 0
+
+    def compute(self) -> int:
+        """
+        Processa os nós inconsistentes até que o caminho até o alvo (ou a árvore inteira, sem
+        alvo) esteja correto. Na primeira chamada equivale a um A* (ou Dijkstra) completo; depois
+        de alterações, só os nós afetados são expandidos.
+        :return: número de nós expandidos nesta chamada.
+        """
+        self._reset_counters()
+        return self._process_queue()
+
+    def _process_queue(self) -> int:
+        while not self._done():
+            self.max_frontier_size = max(self.max_frontier_size, len(self._queue_keys))
+            old_key, node_id = heapq.heappop(self._queue)
+            new_key = self._key(node_id)
+            if old_key < new_key:
+                # A chave ficou desatualizada (o alvo se moveu): volta para a fila com a nova
+                self._push(node_id)
+                continue
+            del self._queue_keys[node_id]
+            self.nodes_expanded += 1
+
+            g = self._g.get(node_id, float('inf'))
+            rhs = self._rhs.get(node_id, float('inf'))
+            if g > rhs:
+                # Nó ficou mais barato: consolida e oferece o novo valor aos vizinhos (como no Dijkstra)
+                self._g[node_id] = rhs
+                for neighbor_id, weight in self.graph.get_neighbors(node_id):
+                    self.edges_evaluated += 1
+                    if neighbor_id != self.source_id and rhs + weight < self._rhs.get(neighbor_id, float('inf')):
+                        self._rhs[neighbor_id] = rhs + weight
+                        self._update_queue(neighbor_id)
+            else:
+                # Nó ficou mais caro: invalida o valor e recalcula quem dependia dele
+                self._g[node_id] = float('inf')
+                self._recompute_rhs(node_id)
+                for neighbor_id, weight in self.graph.get_neighbors(node_id):
+                    self.edges_evaluated += 1
+                    if self._rhs.get(neighbor_id) == g + weight:
+                        self._recompute_rhs(neighbor_id)
+        return self.nodes_expanded
+
+    def repair(self) -> int:
+        """
+        Aplica as alterações de arestas feitas no grafo desde o último cálculo e repara a busca.
+        Só as pontas das arestas alteradas são reavaliadas; o reparo parte delas.
+        :return: número de nós expandidos no reparo.
+        """
+        self._reset_counters()
+        changed_nodes = set()
+        for node_id_1, node_id_2 in self.graph.edge_changes_since(self._version):
+            changed_nodes.update((node_id_1, node_id_2))
+        self._version = self.graph.version
+        for node_id in changed_nodes:
+            self._recompute_rhs(node_id)
+        return self._process_queue()
+
+    def move_target(self, target_id: int):
+        """
+        Troca o alvo sem refazer a busca (D* Lite): as chaves já na fila passam a ser corrigidas
+        pelo km, a soma das heurísticas entre as posições sucessivas do alvo.
+        """
+        if self.target_id is not None:
+            self._key_modifier += self._h(target_id)
+        self.target_id = target_id
+        self._h_values.clear()
+
+    # --- Consultas ---
+
+    def distance(self, node_id: int) -> float:
+        """Distância de source_id até o nó (infinito se não alcançado ou sem caminho)."""
+        return self._g.get(node_id, float('inf'))
+
+    def path(self, node_id: int = None) -> list:
+        """
+        Caminho de source_id até o nó (padrão: o alvo), descendo pelos vizinhos de menor g + peso.
+        Com alvo definido, só os nós no caminho até ele têm distância garantida.
+        :return: lista de IDs, ou None se não houver caminho.
+        """
+        node_id = self.target_id if node_id is None else node_id
+        if self.distance(node_id) == float('inf'):
+            return None
+        path = [node_id]
+        while node_id != self.source_id:
+            node_id = min(self.graph.get_neighbors(node_id),
+                          key=lambda neighbor: self._g.get(neighbor[0], float('inf')) + neighbor[1])[0]
+            path.append(node_id)
+        path.reverse()
+        return path
+
+    def route(self, node_id: int = None):
+        """
+        Calcula (ou repara) a busca e retorna a rota até o nó (padrão: o alvo), no mesmo formato dos
+        algoritmos de algorithms.py. Os contadores são os do último cálculo ou reparo.
+        """
+        if self._version != self.graph.version:
+            self.repair()
+        elif not self._done():
+            self.compute()
+        path = self.path(node_id)
+        if path is None:
+            return None
+        return {
+            "name": "LPA*", "path": path, "cost": round(self.distance(path[-1]), 2),
+            "nodes_expanded": self.nodes_expanded, "edges_evaluated": self.edges_evaluated,
+            "max_frontier_size": self.max_frontier_size
+        }
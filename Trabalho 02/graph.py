@@ -1,6 +1,15 @@
+import bisect
+import math
+import os
+
+import numpy as np
 from pyvis.network import Network
 
 
+# Acima deste número de nós visíveis, as visualizações agregam os nós em grupos (nível de detalhe)
+LOD_MAX_NODES = 2000
+
+
 class GraphNode:
     def __init__(self, id: int, name: str, coord: tuple = (0, 0)):
         self.id = id
@@ -18,70 +27,188 @@ class GraphEdge:
 class Graph:
     def __init__(self):
         self.nodes = []
-        self.edges = []
+        # Arestas na ordem de inserção (dict usado como conjunto ordenado, ver a propriedade edges)
+        # e índice {frozenset((id_1, id_2)): [GraphEdge, ...]}, para alterar ou remover em O(1).
+        self._edges = {}
+        self._edge_index = {}
+        # Tupla devolvida pela propriedade edges e a versão em que foi montada
+        self._edges_snapshot = (None, ())
         # Dicionários para acesso rápido, evitando buscas lineares
         self._nodes_map = {}
+        # Lista de adjacência: {id_no: {id_vizinho: peso}}, mantida a cada add_edge.
+        # Permite consultar vizinhos em O(grau) e pesos em O(1), sem varrer self.edges.
+        self._adjacency = {}
+        # Versão da malha: incrementada a cada alteração, para que caches (ex.: route_cache.RouteCache)
+        # saibam quando seus resultados ficaram desatualizados.
+        self.version = 0
+        # Registro das arestas alteradas [(versão, id_1, id_2)], usado pelos reparos incrementais
+        # (dynamic_routing.py). Só é mantido depois de track_edge_changes, para não guardar a
+        # construção inteira da malha.
+        self._edge_log = None
 
     def add_node(self, node_id: int, node_name: str, coord: tuple = (0, 0)):
+        self.version += 1
         node = GraphNode(node_id, node_name, coord)
         self.nodes.append(node)
         self._nodes_map[node_id] = node
+        self._adjacency.setdefault(node_id, {})
 
     def add_edge(self, node_id_1: int, node_id_2: int, edge_weight: float):
-        self.edges.append(GraphEdge(node_id_1, node_id_2, edge_weight))
+        self.version += 1
+        edge = GraphEdge(node_id_1, node_id_2, edge_weight)
+        self._edges[edge] = None
+        self._edge_index.setdefault(frozenset((node_id_1, node_id_2)), []).append(edge)
+        # O grafo é não direcionado: registra a aresta nos dois sentidos.
+        # Em caso de arestas repetidas entre o mesmo par, prevalece a de menor peso.
+        for id_a, id_b in ((node_id_1, node_id_2), (node_id_2, node_id_1)):
+            neighbors = self._adjacency.setdefault(id_a, {})
+            if edge_weight < neighbors.get(id_b, float("inf")):
+                neighbors[id_b] = edge_weight
+        self._log_edge_change(node_id_1, node_id_2)
+
+    def update_edge_weight(self, node_id_1: int, node_id_2: int, edge_weight: float):
+        """
+        Altera o peso da aresta entre dois nós (ex.: obras ou congestionamento), nos dois sentidos.
+        Arestas repetidas entre o mesmo par passam todas a ter o novo peso.
+        """
+        if node_id_2 not in self._adjacency.get(node_id_1, {}):
+            raise KeyError((node_id_1, node_id_2))
+        self.version += 1
+        self._adjacency[node_id_1][node_id_2] = edge_weight
+        self._adjacency[node_id_2][node_id_1] = edge_weight
+        for edge in self._edge_index[frozenset((node_id_1, node_id_2))]:
+            edge.weight = edge_weight
+        self._log_edge_change(node_id_1, node_id_2)
+
+    def remove_edge(self, node_id_1: int, node_id_2: int):
+        """Remove a aresta entre dois nós (ex.: interdição de uma rodovia), nos dois sentidos."""
+        if node_id_2 not in self._adjacency.get(node_id_1, {}):
+            raise KeyError((node_id_1, node_id_2))
+        self.version += 1
+        del self._adjacency[node_id_1][node_id_2]
+        del self._adjacency[node_id_2][node_id_1]
+        for edge in self._edge_index.pop(frozenset((node_id_1, node_id_2))):
+            del self._edges[edge]
+        self._log_edge_change(node_id_1, node_id_2)
+
+    @property
+    def edges(self) -> tuple:
+        """
+        Tupla (somente leitura) de GraphEdge, na ordem de inserção (arestas repetidas entre o mesmo
+        par incluídas). É montada uma vez por versão da malha, e não a cada acesso.
+        """
+        version, edges = self._edges_snapshot
+        if version != self.version:
+            edges = tuple(self._edges)
+            self._edges_snapshot = (self.version, edges)
+        return edges
+
+    def track_edge_changes(self):
+        """Passa a registrar as alterações de arestas, consultadas com edge_changes_since."""
+        if self._edge_log is None:
+            self._edge_log = []
+
+    def _log_edge_change(self, node_id_1: int, node_id_2: int):
+        if self._edge_log is not None:
+            self._edge_log.append((self.version, node_id_1, node_id_2))
+
+    def edge_changes_since(self, version: int) -> list:
+        """
+        Pares (id_1, id_2) das arestas adicionadas, alteradas ou removidas depois da versão informada.
+        Só inclui as alterações feitas depois de track_edge_changes.
+        """
+        if self._edge_log is None:
+            return []
+        # As versões do registro são crescentes: a busca binária acha a primeira posterior a 'version'
+        start = bisect.bisect_right(self._edge_log, (version, float("inf"), float("inf")))
+        return [(id_1, id_2) for _, id_1, id_2 in self._edge_log[start:]]
 
     def get_node(self, node_id: int) -> GraphNode:
         """Retorna o objeto do nó a partir de seu ID."""
         return self._nodes_map.get(node_id)
 
-    def get_neighbors(self, node_id: int) -> list:
-        """Retorna uma lista de IDs dos nós vizinhos."""
-        neighbors = []
-        for edge in self.edges:
-            if edge.id_1 == node_id:
-                neighbors.append(edge.id_2)
-            elif edge.id_2 == node_id:
-                neighbors.append(edge.id_1)
-        return neighbors
+    def get_neighbors(self, node_id: int):
+        """Retorna os pares (id_vizinho, peso) dos nós vizinhos, em O(grau)."""
+        return self._adjacency.get(node_id, {}).items()
 
     def get_edge_weight(self, node_id_1: int, node_id_2: int) -> float:
-        """Retorna o peso da aresta entre dois nós."""
-        for edge in self.edges:
-            if (edge.id_1 == node_id_1 and edge.id_2 == node_id_2) or (
-                edge.id_1 == node_id_2 and edge.id_2 == node_id_1
-            ):
-                return edge.weight
-        return float("inf")  # Retorna infinito se não houver conexão direta
+        """Retorna o peso da aresta entre dois nós, em O(1)."""
+        # Retorna infinito se não houver conexão direta
+        return self._adjacency.get(node_id_1, {}).get(node_id_2, float("inf"))
 
-    def _generate_network(self, path: list = None):
+    def freeze(self) -> "FrozenGraph":
         """
-        Metodo auxiliar para gerar a rede Pyvis com base em um caminho opcional.
-        Este metodo contém a lógica de layout geográfico (posicionamento relativo
-        das coordenadas geográficas em pixels).
+        Gera uma versão imutável do grafo no formato CSR (Compressed Sparse Row).
+        Deve ser chamado depois que a malha estiver completa, já que alterações
+        posteriores no Graph não são refletidas na versão congelada.
         """
-        net = Network(height="1000px", width="100%", bgcolor="#222222", font_color="white", notebook=True,
-                      cdn_resources='in_line')
-
-        # Este bloco de opções desliga a suavização dinâmica das arestas e confirma
-        # que toda a física está desativada, resultando em um grafo estático.
-        options = """
-        var options = {
-          "edges": { "smooth": { "enabled": false } },
-          "physics": { "enabled": false }
-        }
+        node_ids = np.array([node.id for node in self.nodes], dtype=np.int64)
+        index = {node.id: i for i, node in enumerate(self.nodes)}
+
+        # offsets[i]:offsets[i + 1] delimita, nos vetores targets/weights, os vizinhos do nó de índice i.
+        # A ordem dos vizinhos é a mesma da lista de adjacência (ordem de inserção das arestas).
+        offsets = np.zeros(len(self.nodes) + 1, dtype=np.int64)
+        targets = []
+        weights = []
+        for i, node in enumerate(self.nodes):
+            neighbors = self._adjacency.get(node.id, {})
+            for neighbor_id, weight in neighbors.items():
+                targets.append(index[neighbor_id])
+                weights.append(weight)
+            offsets[i + 1] = len(targets)
+
+        return FrozenGraph(
+            node_ids=node_ids,
+            names=[node.name for node in self.nodes],
+            coords=np.array([node.coord for node in self.nodes], dtype=np.float64).reshape(-1, 2),
+            offsets=offsets,
+            targets=np.array(targets, dtype=np.int32),
+            weights=np.array(weights, dtype=np.float64),
+        )
+
+    def save(self, path: str):
         """
-        net.set_options(options)
-
+        Salva o grafo em um snapshot binário (ver FrozenGraph.save), incluindo a lista de arestas
+        original, para que Graph.load reconstrua a malha sem recalcular nenhuma distância.
+        """
+        self.freeze().save(path)
+        np.save(os.path.join(path, "edge_ids.npy"),
+                np.array([(edge.id_1, edge.id_2) for edge in self._edges], dtype=np.int64).reshape(-1, 2))
+        np.save(os.path.join(path, "edge_weights.npy"), np.array([edge.weight for edge in self._edges], dtype=np.float64))
+
+    @classmethod
+    def load(cls, path: str) -> "Graph":
+        """Reconstrói um Graph (mutável) a partir de um snapshot salvo com Graph.save."""
+        frozen = FrozenGraph.load(path, mmap=False)
+        graph = cls()
+        for node in frozen.nodes:
+            graph.add_node(node.id, node.name, node.coord)
+        edge_ids = np.load(os.path.join(path, "edge_ids.npy")).tolist()
+        edge_weights = np.load(os.path.join(path, "edge_weights.npy")).tolist()
+        for (id_1, id_2), weight in zip(edge_ids, edge_weights):
+            graph.add_edge(id_1, id_2, weight)
+        return graph
+
+    def _layout_positions(self, nodes: list = None) -> dict:
+        """
+        Retorna {id_no: (x, y)} com a posição de cada nó na tela (em pixels).
+        :param nodes: nós a posicionar (padrão: todos); a caixa geográfica é a desses nós.
+        """
+        if nodes is None:
+            nodes = self.nodes
         # LÓGICA DE MAPEAMENTO GEOGRÁFICO
         # Para exibir nós com coordenadas geográficas (latitude, longitude) em uma tela 2D (pixels),
         # é necessário converter um sistema de coordenadas para outro. O metodo a seguir é uma
         # projeção linear simples, também conhecida como normalização.
 
         # 1. Encontrar a "caixa" (bounding box) que contém todos os nossos pontos geográficos.
-        latitudes = [node.coord[0] for node in self.nodes]
-        longitudes = [node.coord[1] for node in self.nodes]
+        latitudes = [node.coord[0] for node in nodes]
+        longitudes = [node.coord[1] for node in nodes]
         min_lat, max_lat = min(latitudes), max(latitudes)
         min_lon, max_lon = min(longitudes), max(longitudes)
+        # Evita divisão por zero quando todos os nós têm a mesma latitude (ou longitude)
+        lat_span = (max_lat - min_lat) or 1.0
+        lon_span = (max_lon - min_lon) or 1.0
 
         # 2. Definir o tamanho do nosso "canvas" de destino onde o mapa será desenhado em pixels
         canvas_width = 1200
@@ -95,13 +222,13 @@ class Graph:
             # 3. Normalização: Transforma a longitude em uma porcentagem (0 a 1) de sua posição
             #    dentro da largura geográfica total (max_lon - min_lon).
             #    Fórmula: (valor - mínimo) / (máximo - mínimo)
-            percent_x = (lon - min_lon) / (max_lon - min_lon)
+            percent_x = (lon - min_lon) / lon_span
 
             # 4. Escalonamento: Multiplica a porcentagem pela largura do canvas para obter a posição em pixel.
             x = (percent_x * (canvas_width - 2 * padding)) + padding
 
             # 5. Repete o processo para a latitude (eixo Y).
-            percent_y = (lat - min_lat) / (max_lat - min_lat)
+            percent_y = (lat - min_lat) / lat_span
             y = (percent_y * (canvas_height - 2 * padding)) + padding
 
             # 6. Inversão do Eixo Y: No sistema de coordenadas geográficas, a latitude cresce para o norte (para cima).
@@ -109,24 +236,127 @@ class Graph:
             #    para que o mapa tenha a orientação correta (Norte em cima, Sul embaixo).
             return x, canvas_height - y
 
-        # --- ADIÇÃO DE NÓS E ARESTAS ---
-        path_nodes = set(path) if path else set()
-        path_edges = set()
-        if path:
-            for i in range(len(path) - 1):
-                path_edges.add(tuple(sorted((path[i], path[i + 1]))))
-
-        for node in self.nodes:
-            scaled_x, scaled_y = scale_coords(node.coord[0], node.coord[1])
-            color = "#FFD700" if node.id in path_nodes else "#97C2FC"
-            size = 25 if node.id in path_nodes else 15
-            net.add_node(node.id, node.name, x=scaled_x, y=scaled_y, physics=False, color=color, size=size)
+        return {node.id: scale_coords(node.coord[0], node.coord[1]) for node in nodes}
 
-        for edge in self.edges:
+    def _level_of_detail(self, path: list = None, max_nodes: int = LOD_MAX_NODES, bbox: tuple = None):
+        """
+        Seleciona o que será desenhado, para que malhas grandes continuem utilizáveis no navegador.
+        1. Recorte (tiling): com bbox = (lat_min, lon_min, lat_max, lon_max), só entram os nós da caixa
+           (e os do caminho) e as arestas com as duas pontas visíveis.
+        2. Agregação em grade: se ainda houver mais de max_nodes nós, a tela é dividida em uma grade de
+           ~max_nodes células, e os nós de cada célula viram um único nó-grupo, no centroide.
+        3. Simplificação de arestas: as arestas fora do caminho passam a ligar grupos; as internas a um
+           grupo somem, e as paralelas entre dois grupos viram uma só.
+        Os nós e as arestas do caminho destacado nunca são agregados (detalhe completo).
+        :return: (nos, arestas), listas de dicts com os atributos de desenho do pyvis.
+        """
+        path = path or []
+        path_nodes = set(path)
+        path_edges = {tuple(sorted((path[i], path[i + 1]))) for i in range(len(path) - 1)}
+
+        visible = self.nodes
+        if bbox is not None:
+            lat_min, lon_min, lat_max, lon_max = bbox
+            visible = [node for node in self.nodes
+                       if (lat_min <= node.coord[0] <= lat_max and lon_min <= node.coord[1] <= lon_max)
+                       or node.id in path_nodes]
+        positions = self._layout_positions(visible) if visible else {}
+
+        # Nó desenhado para cada nó visível: ele mesmo, ou o grupo da sua célula da grade
+        draw_id = {node.id: node.id for node in visible}
+        draw_nodes = {}
+        if max_nodes is not None and len(visible) > max_nodes:
+            cells_per_axis = max(1, int(math.sqrt(max_nodes)))
+            xs = [x for x, _ in positions.values()]
+            ys = [y for _, y in positions.values()]
+            min_x, min_y = min(xs), min(ys)
+            cell_w = ((max(xs) - min_x) or 1.0) / cells_per_axis
+            cell_h = ((max(ys) - min_y) or 1.0) / cells_per_axis
+            cells = {}
+            for node in visible:
+                if node.id in path_nodes:
+                    continue
+                x, y = positions[node.id]
+                cell = (min(int((x - min_x) / cell_w), cells_per_axis - 1),
+                        min(int((y - min_y) / cell_h), cells_per_axis - 1))
+                cells.setdefault(cell, []).append(node)
+            for (cx, cy), members in cells.items():
+                if len(members) == 1:
+                    continue
+                group_id = f"grupo_{cx}_{cy}"
+                for node in members:
+                    draw_id[node.id] = group_id
+                names = ", ".join(node.name for node in members[:10]) + (", ..." if len(members) > 10 else "")
+                draw_nodes[group_id] = {
+                    "n_id": group_id, "label": f"{len(members)} nós", "title": names,
+                    "x": sum(positions[node.id][0] for node in members) / len(members),
+                    "y": sum(positions[node.id][1] for node in members) / len(members),
+                    "color": "#6C8EBF", "size": 15 + 3 * math.log2(len(members)),
+                }
+
+        for node in visible:
+            if draw_id[node.id] == node.id:
+                on_path = node.id in path_nodes
+                draw_nodes[node.id] = {
+                    "n_id": node.id, "label": node.name, "title": node.name,
+                    "x": positions[node.id][0], "y": positions[node.id][1],
+                    "color": "#FFD700" if on_path else "#97C2FC", "size": 25 if on_path else 15,
+                }
+
+        # Arestas: as do caminho sempre individuais; as demais, agregadas entre os nós desenhados
+        draw_edges = {}
+        for edge in self._edges:
+            source, target = draw_id.get(edge.id_1), draw_id.get(edge.id_2)
+            if source is None or target is None:
+                continue  # fora do recorte
             edge_tuple = tuple(sorted((edge.id_1, edge.id_2)))
-            color = "#00FF00" if edge_tuple in path_edges else "grey"
-            width = 3 if edge_tuple in path_edges else 1
-            net.add_edge(edge.id_1, edge.id_2, weight=edge.weight, color=color, width=width)
+            if edge_tuple in path_edges:
+                draw_edges[("caminho", edge_tuple)] = {
+                    "source": edge.id_1, "to": edge.id_2, "weight": edge.weight, "color": "#00FF00", "width": 3,
+                    "title": f"{edge.weight} km",
+                }
+                continue
+            if source == target:
+                continue  # aresta interna a um grupo
+            key = tuple(sorted((source, target), key=str))
+            entry = draw_edges.get(key)
+            if entry is None:
+                draw_edges[key] = {"source": source, "to": target, "weight": edge.weight, "color": "grey", "width": 1,
+                                   "title": f"{edge.weight} km", "count": 1}
+            else:
+                entry["count"] += 1
+                entry["weight"] = min(entry["weight"], edge.weight)
+                entry["width"] = min(1 + math.log2(entry["count"]), 5)
+                entry["title"] = f"{entry['count']} arestas (menor: {entry['weight']} km)"
+
+        return list(draw_nodes.values()), list(draw_edges.values())
+
+    def _generate_network(self, path: list = None, max_nodes: int = LOD_MAX_NODES, bbox: tuple = None):
+        """
+        Metodo auxiliar para gerar a rede Pyvis com base em um caminho opcional.
+        As posições dos nós vêm do layout geográfico de _layout_positions, e o nível de detalhe
+        (recorte por bbox e agregação acima de max_nodes nós) de _level_of_detail.
+        """
+        net = Network(height="1000px", width="100%", bgcolor="#222222", font_color="white", notebook=True,
+                      cdn_resources='in_line')
+
+        # Este bloco de opções desliga a suavização dinâmica das arestas e confirma
+        # que toda a física está desativada, resultando em um grafo estático.
+        options = """
+        var options = {
+          "edges": { "smooth": { "enabled": false } },
+          "physics": { "enabled": false }
+        }
+        """
+        net.set_options(options)
+
+        # --- ADIÇÃO DE NÓS E ARESTAS ---
+        nodes, edges = self._level_of_detail(path, max_nodes, bbox)
+        for node in nodes:
+            net.add_node(physics=False, **node)
+        for edge in edges:
+            edge.pop("count", None)
+            net.add_edge(**edge)
 
         return net
 
@@ -145,7 +375,7 @@ class Graph:
             x = node.coord[1]  # longitude
             y = -node.coord[0]  # -latitude (invertido para sul ficar embaixo)
             net.add_node(node.id, node.name, x=x, y=y)
-        for edge in self.edges:
+        for edge in self._edges:
             net.add_edge(
                 edge.id_1,
                 edge.id_2,
@@ -157,13 +387,47 @@ class Graph:
         with open(filename, "w", encoding="utf-8") as f:
             f.write(net.generate_html())
 
-    def show(self, filename: str = "net.html"):
-        net = self._generate_network()  # Gera a rede sem caminho destacado
+    def show(self, filename: str = "net.html", max_nodes: int = LOD_MAX_NODES, bbox: tuple = None):
+        """
+        :param max_nodes: acima deste número de nós, agrega os nós em grupos (None desliga a agregação).
+        :param bbox: (lat_min, lon_min, lat_max, lon_max) para desenhar só um recorte da malha.
+        """
+        net = self._generate_network(max_nodes=max_nodes, bbox=bbox)  # Gera a rede sem caminho destacado
 
         # Solução para o erro de codificação: escrita manual em UTF-8
         with open(filename, "w", encoding="utf-8") as f:
             f.write(net.generate_html())
 
+    def show_tiles(self, output_dir: str, rows: int = 2, cols: int = 2, path: list = None,
+                   max_nodes: int = LOD_MAX_NODES) -> list:
+        """
+        Divide a caixa geográfica da malha em rows x cols recortes e gera um HTML por recorte
+        (tile_<linha>_<coluna>.html), cada um com seu próprio nível de detalhe.
+        Arestas que cruzam a borda de um recorte não aparecem nele (exceto as do caminho).
+        :return: lista com os nomes dos arquivos gerados.
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        latitudes = [node.coord[0] for node in self.nodes]
+        longitudes = [node.coord[1] for node in self.nodes]
+        min_lat, max_lat = min(latitudes), max(latitudes)
+        min_lon, max_lon = min(longitudes), max(longitudes)
+        lat_step = (max_lat - min_lat) / rows
+        lon_step = (max_lon - min_lon) / cols
+
+        filenames = []
+        for row in range(rows):
+            for col in range(cols):
+                # A linha 0 fica ao norte, como na tela. Um nó exatamente sobre a borda entre dois
+                # recortes aparece nos dois.
+                bbox = (max_lat - (row + 1) * lat_step, min_lon + col * lon_step,
+                        max_lat - row * lat_step, min_lon + (col + 1) * lon_step)
+                net = self._generate_network(path=path, max_nodes=max_nodes, bbox=bbox)
+                filename = os.path.join(output_dir, f"tile_{row}_{col}.html")
+                with open(filename, "w", encoding="utf-8") as f:
+                    f.write(net.generate_html())
+                filenames.append(filename)
+        return filenames
+
     def show_path_plain(self, path: list, filename: str):
         """
         Gera uma visualização do grafo, destacando um caminho específico.
@@ -192,7 +456,7 @@ class Graph:
                 net.add_node(node.id, node.name, color="#97C2FC")  # Cor padrão azul claro
 
         # Adiciona as arestas, destacando as que estão no caminho
-        for edge in self.edges:
+        for edge in self._edges:
             edge_tuple = tuple(sorted((edge.id_1, edge.id_2)))
             if edge_tuple in path_edges:
                 net.add_edge(
@@ -209,9 +473,164 @@ class Graph:
         with open(filename, "w", encoding="utf-8") as f:
             f.write(net.generate_html())
 
-    def show_path(self, path: list, filename: str):
-        net = self._generate_network(path=path)  # Gera a rede COM caminho destacado
+    def show_path(self, path: list, filename: str, max_nodes: int = LOD_MAX_NODES, bbox: tuple = None):
+        """Como show, destacando o caminho, que é sempre desenhado com detalhe completo."""
+        net = self._generate_network(path=path, max_nodes=max_nodes, bbox=bbox)  # Gera a rede COM caminho destacado
 
         # Solução definitiva para o erro de codificação
         with open(filename, "w", encoding="utf-8") as f:
-            f.write(net.generate_html())
\ No newline at end of file
+            f.write(net.generate_html())
+
+
+class FrozenGraph:
+    """
+    Representação imutável do grafo em formato CSR (Compressed Sparse Row).
+    Os nós recebem índices densos (0..n-1), mapeados a partir dos IDs externos, e as
+    arestas ficam em vetores contíguos (offsets, targets, weights), sem um objeto
+    Python por aresta. Expõe a mesma interface de consulta usada pelos algoritmos
+    (get_node, get_neighbors, get_edge_weight e nodes), então pode substituir o Graph nas buscas.
+    """
+
+    # Vetores gravados no snapshot binário, um arquivo .npy por vetor (ver save/load)
+    _SNAPSHOT_ARRAYS = ("node_ids", "coords", "name_offsets", "name_bytes", "offsets", "targets", "target_ids",
+                        "weights")
+
+    def __init__(self, node_ids, names, coords, offsets, targets, weights, target_ids=None):
+        self.node_ids = node_ids  # índice denso -> ID externo
+        self.names = names
+        self.coords = coords  # matriz (n, 2) com (latitude, longitude)
+        self.offsets = offsets
+        self.targets = targets  # índices densos dos vizinhos
+        self.weights = weights
+
+        # Mapeamento ID externo -> índice denso
+        self._index = {node_id: i for i, node_id in enumerate(node_ids.tolist())}
+        # IDs externos dos vizinhos, já resolvidos, para evitar a conversão a cada consulta
+        if target_ids is None:
+            target_ids = node_ids[targets] if len(targets) else np.zeros(0, dtype=np.int64)
+        self._target_ids = target_ids
+        self._nodes = None
+        # Caches por nó, preenchidos na primeira consulta de cada nó: as buscas repetidas não pagam de
+        # novo a conversão dos vetores em objetos Python, e a carga por mmap continua sem custo O(V).
+        self._neighbors_cache = {}  # {id_no: ((id_vizinho, peso), ...)}
+        self._node_cache = {}
+        # Permutação que ordena cada linha do CSR pelo ID do vizinho (busca binária em get_edge_weight),
+        # calculada no primeiro uso
+        self._row_order = None
+
+    @property
+    def nodes(self) -> list:
+        """Lista de GraphNode, montada só no primeiro acesso (a carga por mmap não paga esse custo)."""
+        if self._nodes is None:
+            self._nodes = [
+                GraphNode(node_id, name, (float(lat), float(lon)))
+                for node_id, name, (lat, lon) in zip(self.node_ids.tolist(), self.names, self.coords.tolist())
+            ]
+        return self._nodes
+
+    def save(self, path: str):
+        """
+        Salva o grafo em um snapshot binário: uma pasta com um .npy (sem compressão) por vetor.
+        Os nomes ficam em um único vetor de bytes UTF-8, delimitado por name_offsets, como no CSR.
+        Por não ter compressão, os vetores podem ser mapeados direto do disco em FrozenGraph.load.
+        """
+        os.makedirs(path, exist_ok=True)
+        encoded_names = [name.encode("utf-8") for name in self.names]
+        name_offsets = np.zeros(len(encoded_names) + 1, dtype=np.int64)
+        name_offsets[1:] = np.cumsum([len(name) for name in encoded_names])
+        arrays = {
+            "node_ids": np.asarray(self.node_ids, dtype=np.int64),
+            "coords": np.asarray(self.coords, dtype=np.float64).reshape(-1, 2),
+            "name_offsets": name_offsets,
+            "name_bytes": np.frombuffer(b"".join(encoded_names), dtype=np.uint8),
+            "offsets": np.asarray(self.offsets, dtype=np.int64),
+            "targets": np.asarray(self.targets, dtype=np.int32),
+            "target_ids": np.asarray(self._target_ids, dtype=np.int64),
+            "weights": np.asarray(self.weights, dtype=np.float64),
+        }
+        for name in self._SNAPSHOT_ARRAYS:
+            np.save(os.path.join(path, f"{name}.npy"), arrays[name])
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "FrozenGraph":
+        """
+        Carrega um snapshot salvo com save() (ou Graph.save).
+        :param mmap: se True, os vetores são mapeados em memória (somente leitura) em vez de lidos:
+                     a carga é quase instantânea e processos que abrem o mesmo snapshot
+                     compartilham as mesmas páginas do cache de disco do sistema operacional.
+        """
+        mmap_mode = "r" if mmap else None
+        arrays = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode)
+                  for name in cls._SNAPSHOT_ARRAYS}
+        name_bytes = arrays["name_bytes"].tobytes()
+        name_offsets = arrays["name_offsets"].tolist()
+        names = [name_bytes[name_offsets[i]:name_offsets[i + 1]].decode("utf-8")
+                 for i in range(len(name_offsets) - 1)]
+        return cls(
+            node_ids=arrays["node_ids"],
+            names=names,
+            coords=arrays["coords"],
+            offsets=arrays["offsets"],
+            targets=arrays["targets"],
+            weights=arrays["weights"],
+            target_ids=arrays["target_ids"],
+        )
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def num_edges(self) -> int:
+        """Número de arestas não direcionadas (cada uma aparece duas vezes no CSR)."""
+        return len(self.targets) // 2
+
+    def index_of(self, node_id: int) -> int:
+        """Retorna o índice denso de um nó a partir de seu ID externo."""
+        return self._index[node_id]
+
+    def get_node(self, node_id: int) -> GraphNode:
+        """Retorna o objeto do nó a partir de seu ID."""
+        i = self._index.get(node_id)
+        if i is None:
+            return None
+        if self._nodes is not None:
+            return self._nodes[i]
+        # Monta só o nó pedido: montar a lista inteira (propriedade nodes) custaria O(V) na primeira consulta
+        node = self._node_cache.get(i)
+        if node is None:
+            lat, lon = self.coords[i].tolist()
+            node = self._node_cache[i] = GraphNode(node_id, self.names[i], (lat, lon))
+        return node
+
+    def get_neighbors(self, node_id: int):
+        """
+        Retorna os pares (id_vizinho, peso) dos nós vizinhos, em O(grau).
+        É uma tupla (pode ser percorrida mais de uma vez, como a view retornada pelo Graph), montada
+        na primeira consulta do nó e reaproveitada nas seguintes.
+        """
+        neighbors = self._neighbors_cache.get(node_id)
+        if neighbors is None:
+            i = self._index.get(node_id)
+            if i is None:
+                return ()
+            lo, hi = int(self.offsets[i]), int(self.offsets[i + 1])
+            neighbors = self._neighbors_cache[node_id] = tuple(zip(self._target_ids[lo:hi].tolist(),
+                                                             self.weights[lo:hi].tolist()))
+        return neighbors
+
+    def get_edge_weight(self, node_id_1: int, node_id_2: int) -> float:
+        """Retorna o peso da aresta entre dois nós, por busca binária na linha do CSR (O(log grau))."""
+        i = self._index.get(node_id_1)
+        if i is None:
+            return float("inf")
+        if self._row_order is None:
+            # Ordena os arcos por (linha, ID do vizinho); a ordem original das linhas não muda
+            rows = np.repeat(np.arange(len(self.offsets) - 1), np.diff(self.offsets))
+            self._row_order = np.lexsort((self._target_ids, rows))
+        lo, hi = int(self.offsets[i]), int(self.offsets[i + 1])
+        order = self._row_order[lo:hi]
+        position = int(np.searchsorted(self._target_ids[order], node_id_2))
+        if position == hi - lo or self._target_ids[order[position]] != node_id_2:
+            return float("inf")  # Retorna infinito se não houver conexão direta
+        return float(self.weights[order[position]])
@@ -0,0 +1,50 @@
+from collections import OrderedDict
+
+from distance import one_to_many, EARTH_MIN_RADIUS_KM
+
+
+class HeuristicCache:
+    """
+    Cache de tabelas de heurística por destino.
+    Para cada nó objetivo, calcula de uma só vez (vetorizado) a distância de TODOS os nós
+    do grafo até ele, e reaproveita essa tabela em consultas repetidas (várias rodadas e
+    vários algoritmos com o mesmo destino). Guarda no máximo 'max_goals' tabelas, descartando
+    a usada há mais tempo (LRU).
+    """
+
+    def __init__(self, graph, max_goals: int = 8, mode: str = "haversine"):
+        self.graph = graph
+        self.max_goals = max_goals
+        self.mode = mode
+        self._tables = OrderedDict()  # {id_objetivo: {id_no: heurística}}
+        self.hits = 0
+        self.misses = 0
+
+        # As coordenadas não mudam entre consultas, então a lista é montada uma única vez.
+        self._node_ids = [node.id for node in graph.nodes]
+        self._coords = [node.coord for node in graph.nodes]
+
+    def table(self, goal_id: int) -> dict:
+        """Retorna a tabela {id_no: heurística até goal_id}, calculando-a se necessário."""
+        table = self._tables.get(goal_id)
+        if table is not None:
+            self.hits += 1
+            self._tables.move_to_end(goal_id)
+            return table
+
+        self.misses += 1
+        table = dict(zip(self._node_ids, self._compute(goal_id).tolist()))
+
+        self._tables[goal_id] = table
+        if len(self._tables) > self.max_goals:
+            self._tables.popitem(last=False)  # Remove o destino usado há mais tempo
+        return table
+
+    def _compute(self, goal_id: int):
+        """Calcula a heurística de todos os nós até goal_id, na ordem de graph.nodes."""
+        goal_coord = self.graph.get_node(goal_id).coord
+        # Mesmo raio usado em algorithms.heuristic, para manter a heurística admissível.
+        return one_to_many(goal_coord, self._coords, self.mode, radius=EARTH_MIN_RADIUS_KM)
+
+    def clear(self):
+        self._tables.clear()
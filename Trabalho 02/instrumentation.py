@@ -0,0 +1,103 @@
+import functools
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+# Modos de instrumentação, do mais leve ao mais completo:
+# - OFF: nenhuma medição de tempo ou memória (uso em produção). Os contadores do algoritmo (nós
+#   expandidos, arestas avaliadas, fronteira máxima) são calculados na própria busca, a custo
+#   desprezível, e por isso fazem parte do resultado em todos os modos.
+# - TIMING: contadores + tempo de CPU (process_time_ns) e tempo de parede (perf_counter_ns).
+# - MEMORY: contadores + tempos + pico de memória via tracemalloc. O tracemalloc deixa a busca
+#   várias vezes mais lenta, então os tempos deste modo não devem ser usados como referência.
+OFF = "off"
+TIMING = "timing"
+MEMORY = "memory"
+MODES = (OFF, TIMING, MEMORY)
+
+_mode = OFF
+# Profundidade de chamadas instrumentadas em andamento: quando um algoritmo chama outro
+# (ex.: a_star_landmarks -> a_star), só a chamada mais externa é medida.
+_depth = 0
+
+
+def get_mode() -> str:
+    return _mode
+
+
+def set_mode(mode: str):
+    global _mode
+    if mode not in MODES:
+        raise ValueError(f"Modo de instrumentação desconhecido: '{mode}'. Use um de {MODES}.")
+    _mode = mode
+
+
+@contextmanager
+def instrumentation(mode: str):
+    """Ativa um modo de instrumentação dentro de um bloco 'with', restaurando o anterior ao sair."""
+    previous = get_mode()
+    set_mode(mode)
+    try:
+        yield
+    finally:
+        set_mode(previous)
+
+
+def profiled(func):
+    """
+    Decorador que separa a medição de desempenho do algoritmo em si.
+    O algoritmo decorado retorna apenas o resultado puro (nome, caminho, custo e contadores) ou None;
+    as métricas de tempo e memória são acrescentadas aqui, de acordo com o modo ativo.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        global _depth
+        mode = _mode
+        if _depth:
+            return func(*args, **kwargs)
+
+        if mode == OFF:
+            _depth += 1
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                _depth -= 1
+        else:
+            _depth += 1
+            if mode == MEMORY:
+                # Se quem chamou já está rastreando, reaproveita o rastreamento sem zerar o pico, que
+                # ainda é dele; a memória que já estava alocada é descontada do pico desta chamada.
+                was_tracing = tracemalloc.is_tracing()
+                if not was_tracing:
+                    tracemalloc.start()
+                mem_baseline, outer_peak = tracemalloc.get_traced_memory()
+            try:
+                cpu_start = time.process_time_ns()
+                wall_start = time.perf_counter_ns()
+                result = func(*args, **kwargs)
+                wall_end = time.perf_counter_ns()
+                cpu_end = time.process_time_ns()
+                if mode == MEMORY:
+                    mem_current, mem_peak = tracemalloc.get_traced_memory()
+                    if mem_peak > outer_peak:
+                        mem_peak -= mem_baseline  # O pico foi atingido durante esta chamada
+                    else:
+                        # O pico de quem chamou não foi superado: sem zerá-lo, o pico desta chamada
+                        # não pode ser isolado, e a memória que ela deixou alocada é um limite inferior.
+                        mem_peak = max(mem_current - mem_baseline, 0)
+            finally:
+                if mode == MEMORY and not was_tracing:
+                    tracemalloc.stop()
+                _depth -= 1
+
+        if result is None:
+            return None
+        if mode in (TIMING, MEMORY):
+            result["cpu_time"] = (cpu_end - cpu_start) / 1e9
+            result["wall_time"] = (wall_end - wall_start) / 1e9
+        if mode == MEMORY:
+            result["memory_peak_kb"] = round(mem_peak / 1024, 2)
+        return result
+
+    return wrapper
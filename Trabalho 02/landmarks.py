@@ -0,0 +1,72 @@
+import numpy as np
+
+from algorithms import shortest_path_tree
+from heuristic_cache import HeuristicCache
+
+
+def _distances_from(graph, source_id: int, index: dict):
+    """
+    Dijkstra completo (sem objetivo) a partir de source_id.
+    Retorna um vetor com a distância até cada nó, na ordem de 'index' (inf se inalcançável).
+    """
+    dist = np.full(len(index), np.inf)
+    distances, _ = shortest_path_tree(graph, source_id)
+    for node_id, cost in distances.items():
+        dist[index[node_id]] = cost
+    return dist
+
+
+class LandmarkIndex(HeuristicCache):
+    """
+    Pré-processamento ALT (A*, Landmarks e desigualdade Triangular).
+    Escolhe K nós "marco" (landmarks) e guarda a distância real de cada marco até todos os nós.
+    Pela desigualdade triangular, para qualquer marco L:
+        d(v, t) >= |d(L, t) - d(L, v)|
+    então o maior desses valores entre os marcos é um limite inferior do custo restante,
+    normalmente bem mais justo que a distância em linha reta quando a estrada faz desvios.
+    A heurística final é max(limite dos marcos, distância em linha reta), que continua admissível.
+
+    Como estende HeuristicCache, pode ser passado diretamente como 'heuristic_cache' para a_star.
+    """
+
+    def __init__(self, graph, num_landmarks: int = 8, max_goals: int = 8, mode: str = "haversine"):
+        super().__init__(graph, max_goals=max_goals, mode=mode)
+        self._index = {node_id: i for i, node_id in enumerate(self._node_ids)}
+        self.landmarks = []
+        # Matriz (K, n) com a distância de cada marco até cada nó, contígua em memória.
+        self.distances = np.empty((0, len(self._node_ids)))
+        if self._node_ids:
+            self._select_farthest(num_landmarks)
+
+    def _select_farthest(self, num_landmarks: int):
+        """
+        Seleção por ponto mais distante (farthest-point): cada novo marco é o nó mais distante
+        (em distância de rede) dos marcos já escolhidos. O primeiro é o nó mais distante de um
+        nó arbitrário, o que tende a colocar os marcos na "periferia" da malha.
+        """
+        rows = []
+        # Distância mínima de cada nó até o conjunto de marcos já escolhidos
+        min_dist = _distances_from(self.graph, self._node_ids[0], self._index)
+        for _ in range(min(num_landmarks, len(self._node_ids))):
+            # Nós em outros componentes (inf) são priorizados, para que também sejam cobertos.
+            candidate = int(np.argmax(min_dist))
+            if min_dist[candidate] == 0:
+                break  # Todos os nós já são marcos
+            landmark_id = self._node_ids[candidate]
+            dist = _distances_from(self.graph, landmark_id, self._index)
+            self.landmarks.append(landmark_id)
+            rows.append(dist)
+            min_dist = np.minimum(min_dist, dist) if len(rows) > 1 else dist
+        if rows:
+            self.distances = np.vstack(rows)
+
+    def _compute(self, goal_id: int):
+        geo = super()._compute(goal_id)
+        if not self.landmarks:
+            return geo
+        to_goal = self.distances[:, self._index[goal_id]][:, None]
+        with np.errstate(invalid="ignore"):
+            bounds = np.abs(to_goal - self.distances)
+        # inf - inf (nó e objetivo fora do alcance do marco) não fornece informação
+        bounds[np.isnan(bounds)] = 0.0
+        return np.maximum(bounds.max(axis=0), geo)
@@ -1,9 +1,18 @@
-from geopy.distance import geodesic
 import os
+import argparse
 import pandas as pd
 import numpy as np
 from graph import Graph
-from algorithms import dijkstra, greedy_search, a_star, depth_first_search, breadth_first_search
+from heuristic_cache import HeuristicCache
+from landmarks import LandmarkIndex
+from benchmark_runner import run_benchmark_matrix
+from route_viewer import write_route_viewer
+from contraction_hierarchies import ContractionHierarchy
+from partitioning import MultiLevelPartition
+from road_network import build_road_network
+from algorithms import (dijkstra, bidirectional_dijkstra, greedy_search, a_star, bidirectional_a_star,
+                        a_star_landmarks, contraction_hierarchy_search, partition_search, depth_first_search,
+                        breadth_first_search, ida_star, sma_star)
 
 # Malha Logística Nacional - 100 Maiores Cidades do Brasil (Censo 2022)
 coords = {
@@ -143,144 +152,186 @@ strategic_roads = [
     ("Teresina", "Fortaleza"),            # BR-020
 ]
 
-def calculate_distance(coord1, coord2):
-    return round(geodesic(coord1, coord2).km, 2)
+# Lista de desafios logísticos
+CHALLENGES = [
+    {"name": "Norte_Sul", "origin": "Manaus", "destination": "Porto Alegre"},
+    {"name": "Litoral", "origin": "Fortaleza", "destination": "Rio de Janeiro"},
+    {"name": "Leste_Oeste", "origin": "Rio Branco", "destination": "João Pessoa"},
+    {"name": "Centro_Sudeste", "origin": "Campo Grande", "destination": "Vitória"},
+    {"name": "Vale_do_Paraiba", "origin": "São José dos Campos", "destination": "Niterói"},
+]
 
-def build_road_network(graph, coords_dict, strategic_connections, neighbors_count=3):
-    """
-    Constrói a malha rodoviária usando uma abordagem híbrida:
-    1. Adiciona conexões estratégicas manuais.
-    2. Conecta cada cidade às suas N vizinhas mais próximas.
-    """
-    # Usamos um set para evitar adicionar arestas duplicadas (A->B e B->A com o mesmo peso)
-    existing_edges = set()
-
-    # 1. Adiciona as conexões estratégicas primeiro
-    if strategic_connections:
-        for city1_name, city2_name in strategic_connections:
-            id1 = coords_dict[city1_name]["id"]
-            id2 = coords_dict[city2_name]["id"]
-            coord1 = coords_dict[city1_name]["coord"]
-            coord2 = coords_dict[city2_name]["coord"]
-            dist = calculate_distance(coord1, coord2)
-
-            edge_tuple = tuple(sorted((id1, id2)))
-            if edge_tuple not in existing_edges:
-                graph.add_edge(id1, id2, round(dist, 2))
-                existing_edges.add(edge_tuple)
-
-    city_names = list(coords_dict.keys())
-    for city1_name in city_names:
-        distances = []
-        for city2_name in city_names:
-            if city1_name != city2_name:
-                coord1 = coords_dict[city1_name]["coord"]
-                coord2 = coords_dict[city2_name]["coord"]
-                dist = calculate_distance(coord1, coord2)
-                distances.append((dist, city2_name))
-
-        distances.sort()
-
-        for i in range(min(neighbors_count, len(distances))):
-            dist, neighbor_name = distances[i]
-            id1 = coords_dict[city1_name]["id"]
-            id2 = coords_dict[neighbor_name]["id"]
-
-            # Garante que a aresta seja armazenada de forma consistente (menor_id, maior_id)
-            edge_tuple = tuple(sorted((id1, id2)))
-
-            if edge_tuple not in existing_edges:
-                graph.add_edge(id1, id2, round(dist, 2))
-                existing_edges.add(edge_tuple)
-
-def main():
-    # Parâmetros
-    ITERATIONS = 40  # Necessário para conseguir medir o tempo de execução da CPU, através da média dessas execuções. Uma única execução retorno 0.000 para a maioria dos algoritmos
-    output_dir = "outputs"
+ALGORITHMS_TO_RUN = [
+    dijkstra,
+    bidirectional_dijkstra,
+    a_star,
+    bidirectional_a_star,
+    a_star_landmarks,
+    contraction_hierarchy_search,
+    partition_search,
+    ida_star,
+    sma_star,
+    greedy_search,
+    breadth_first_search,
+    depth_first_search
+]
+
+# Orçamento de nós em memória do SMA* nos desafios: abaixo do que o A* chega a guardar na malha
+# nacional, para que os descartes (e o custo extra de CPU) apareçam nas métricas.
+SMA_STAR_MAX_NODES = 50
+# Limite de expansões do SMA* por desafio: com orçamentos apertados ele pode regenerar os mesmos nós
+# indefinidamente; com 50 nós de memória, os desafios atuais terminam com menos de 200 expansões.
+SMA_STAR_MAX_EXPANSIONS = 10_000
+# Tamanho máximo das menores células da partição (CRP): com 100 cidades, 8 células no nível 1 e 4 no nível 2.
+PARTITION_CELL_SIZE = 16
 
-    # Lista de desafios logísticos
-    challenges = [
-        {"name": "Norte_Sul", "origin": "Manaus", "destination": "Porto Alegre"},
-        {"name": "Litoral", "origin": "Fortaleza", "destination": "Rio de Janeiro"},
-        {"name": "Leste_Oeste", "origin": "Rio Branco", "destination": "João Pessoa"},
-        {"name": "Centro_Sudeste", "origin": "Campo Grande", "destination": "Vitória"},
-        {"name": "Vale_do_Paraiba", "origin": "São José dos Campos", "destination": "Niterói"},
-    ]
 
+def build_graph():
+    """Monta a malha logística nacional (cidades + rodovias)."""
     graph = Graph()
-    # Mapeamento reverso de ID para Nome para facilitar a exibição
-    id_to_name = {}
     for city, data in coords.items():
         graph.add_node(data["id"], city, data["coord"])
-        id_to_name[data["id"]] = city
 
     build_road_network(graph, coords, strategic_roads, neighbors_count=3)
     # Versão 100% programática, passando None no lugar das rodovias estratégicas "reais"
     # build_road_network(graph, coords, None, neighbors_count=3)
+    return graph
+
+
+def build_benchmark_context(challenges, graph_snapshot: str = None, hierarchy_file: str = None):
+    """
+    Monta tudo o que as rodadas de benchmark precisam: a malha, os pré-processamentos e os
+    algoritmos com seus parâmetros. É chamada uma vez em cada worker do benchmark_runner, que assim
+    não recebem o grafo a cada tarefa, ou uma única vez no processo principal quando há um só worker.
+    :param graph_snapshot: pasta de um snapshot salvo com Graph.save. Se informada, a malha é
+                           reconstruída a partir dele (Graph.load), sem recalcular as distâncias.
+    :param hierarchy_file: Contraction Hierarchies salvas com ContractionHierarchy.save. Se
+                           informado, a hierarquia é carregada em vez de recalculada.
+    """
+    # As buscas usam o Graph (lista de adjacência): nas consultas, o FrozenGraph ainda é um pouco
+    # mais lento que ele, já que seus vizinhos precisam ser convertidos dos vetores do CSR.
+    if graph_snapshot:
+        search_graph = Graph.load(graph_snapshot)
+    else:
+        search_graph = build_graph()
+
+    # Tabelas de heurística por destino, compartilhadas entre as rodadas e entre A* e Busca Gulosa.
+    # O A* Bidirecional também usa a tabela da origem, por isso o dobro de entradas.
+    heuristic_cache = HeuristicCache(search_graph, max_goals=2 * len(challenges))
+    # Pré-processamento ALT (marcos + desigualdade triangular), feito uma única vez para a malha.
+    landmark_index = LandmarkIndex(search_graph, num_landmarks=8, max_goals=len(challenges))
+    # Pré-processamento das Contraction Hierarchies
+    if hierarchy_file:
+        hierarchy = ContractionHierarchy.load(hierarchy_file)
+    else:
+        hierarchy = ContractionHierarchy.build(search_graph)
+    # Partição em células com as cliques de fronteira (CRP)
+    partition = MultiLevelPartition(search_graph, cell_size=PARTITION_CELL_SIZE)
+
+    # Parâmetros extras por algoritmo
+    algorithm_options = {
+        a_star: {"heuristic_cache": heuristic_cache},
+        greedy_search: {"heuristic_cache": heuristic_cache},
+        bidirectional_a_star: {"heuristic_cache": heuristic_cache},
+        ida_star: {"heuristic_cache": heuristic_cache},
+        sma_star: {"heuristic_cache": heuristic_cache, "max_nodes": SMA_STAR_MAX_NODES,
+                   "max_expansions": SMA_STAR_MAX_EXPANSIONS},
+        a_star_landmarks: {"landmarks": landmark_index},
+        contraction_hierarchy_search: {"hierarchy": hierarchy},
+        partition_search: {"partition": partition},
+    }
+
+    return {
+        "graph": search_graph,
+        "hierarchy": hierarchy,
+        "partition": partition,
+        "queries": [(coords[c["origin"]]["id"], coords[c["destination"]]["id"]) for c in challenges],
+        "algorithms": {func.__name__: (func, algorithm_options.get(func, {})) for func in ALGORITHMS_TO_RUN},
+    }
+
+
+def main(workers: int = None, full_html: bool = False):
+    """
+    :param workers: processos usados nas rodadas de benchmark (padrão: número de CPUs; 1 executa
+                    tudo no processo principal).
+    :param full_html: além do visualizador de rotas, gera também um HTML completo do pyvis por rota.
+    """
+    # Parâmetros
+    # Orçamento de tempo (s) das medições de cada algoritmo em cada desafio. O timing.measure ajusta
+    # sozinho quantas execuções cabem nele, em vez de um número fixo de rodadas.
+    TIME_BUDGET = 0.25
+    output_dir = "outputs"
+    challenges = CHALLENGES
+
+    # Malha usada nas visualizações; as buscas usam a cópia reconstruída do snapshot
+    graph = build_graph()
+    # Mapeamento reverso de ID para Nome para facilitar a exibição
+    id_to_name = {data["id"]: city for city, data in coords.items()}
 
     # Garante que existe a pasta de saída, caso ela não exista
     os.makedirs(output_dir, exist_ok=True)
 
+    # Snapshot binário da malha: o processo principal e os workers do benchmark o mapeiam do disco,
+    # em vez de reconstruir a malha e recalcular as distâncias geodésicas.
+    graph_snapshot = os.path.join(output_dir, "malha_logistica.graph")
+    graph.save(graph_snapshot)
+    print(f"Snapshot binário da malha salvo em '{graph_snapshot}'")
+
+    # Pré-processamento das Contraction Hierarchies, feito uma única vez e salvo em disco:
+    # o contexto de benchmark (no processo principal ou em cada worker) carrega o arquivo.
+    hierarchy = ContractionHierarchy.build(graph)
+    hierarchy_filename = os.path.join(output_dir, "contraction_hierarchy.npz")
+    hierarchy.save(hierarchy_filename)
+    print(f"Contraction Hierarchies: {hierarchy.num_shortcuts} atalhos, salvos em '{hierarchy_filename}'")
+
+    # Com um só worker, o contexto é montado aqui e reaproveitado pelo benchmark_runner; com vários,
+    # cada worker monta o seu e o processo principal não precisa de outro.
+    context_args = (challenges, graph_snapshot, hierarchy_filename)
+    context = None
+    if (workers or os.cpu_count() or 1) <= 1:
+        context = build_benchmark_context(*context_args)
+        partition = context["partition"]
+        print(f"Partição CRP: {partition.num_cells} células por nível, {partition.num_overlay_edges} arestas de clique")
+
     # Visualização do Grafo geral, apenas uma vez
     geral_map_filename = os.path.join(output_dir, "logistica_brasil_malha_completa.html")
     graph.show(geral_map_filename)
     print(f"Grafo da malha logística nacional gerado em '{geral_map_filename}'")
 
+    # Todas as medições (desafio x algoritmo) são distribuídas entre os processos.
+    # Cada medição continua isolada dentro do seu processo.
+    print(f"\nMedindo cada algoritmo em cada desafio (aquecimento, calibração e ~{TIME_BUDGET}s de amostras)...")
+    algorithm_names = [func.__name__ for func in ALGORITHMS_TO_RUN]
+    benchmark_results = run_benchmark_matrix(build_benchmark_context, context_args, len(challenges),
+                                             algorithm_names, workers=workers, context=context,
+                                             time_budget=TIME_BUDGET)
+
     all_challenges_summary = []  # Lista para acumular todos os resultados
+    routes = []  # Rotas encontradas, para o visualizador (malha única + uma sobreposição por rota)
 
     # Loop Principal sobre os Desafios
-    for challenge in challenges:
+    for challenge_index, challenge in enumerate(challenges):
         challenge_name = challenge["name"]
         start_city = challenge["origin"]
         goal_city = challenge["destination"]
 
-        start_id = coords[start_city]["id"]
-        goal_id = coords[goal_city]["id"]
-
-        #print(f"\nBuscando a melhor rota de '{start_city}' para '{goal_city}'...")
         print(f"\n\n=======================================================================================")
-        print(f"--- EXECUTANDO DESAFIO: {challenge_name} ({start_city} -> {goal_city}) ---")
+        print(f"--- DESAFIO: {challenge_name} ({start_city} -> {goal_city}) ---")
         print(f"=======================================================================================")
-        print(f"Cada algoritmo será executado {ITERATIONS} vezes para análise estatística.\n")
-
-        algorithms_to_run = [
-            dijkstra,
-            a_star,
-            greedy_search,
-            breadth_first_search,
-            depth_first_search
-        ]
-
-        # Estrutura para acumular os resultados
-        aggregated_results = {func.__name__: {"cpu_times": [], "memory_peaks": []} for func in algorithms_to_run}
-        # Armazena os resultados determinísticos da primeira execução
-        deterministic_results = {}
-
-        for i in range(ITERATIONS):
-            print(f"   Executando rodada {i + 1}/{ITERATIONS}...")
-            for algorithm_func in algorithms_to_run:
-                result = algorithm_func(graph, start_id, goal_id)
-                if result:
-                    # Acumula as métricas de performance
-                    aggregated_results[algorithm_func.__name__]["cpu_times"].append(result["cpu_time"])
-                    aggregated_results[algorithm_func.__name__]["memory_peaks"].append(result["memory_peak_kb"])
 
-                    # Na primeira rodada, salva os resultados que não mudam
-                    if i == 0:
-                        deterministic_results[algorithm_func.__name__] = result
+        # Resultados determinísticos da primeira rodada de cada algoritmo
+        deterministic_results = {}
 
         # Pós-processamento e Cálculo das Estatísticas
         summary_results = []
-        for func in algorithms_to_run:
-            algo_name = func.__name__
-            if algo_name in deterministic_results:
-                det_res = deterministic_results[algo_name]
-                agg_res = aggregated_results[algo_name]
-
-                # Calcula média e desvio padrão (stdev)
-                mean_cpu = np.mean(agg_res["cpu_times"])
-                stdev_cpu = np.std(agg_res["cpu_times"])
-
+        for algo_name in algorithm_names:
+            agg_res = benchmark_results.get((challenge_index, algo_name))
+            if agg_res:
+                det_res = agg_res["result"]
+                deterministic_results[algo_name] = det_res
+
+                # Estatísticas de tempo (já sem valores discrepantes) e média e desvio padrão da memória
+                cpu_stats = agg_res["cpu"]
                 mean_mem = np.mean(agg_res["memory_peaks"])
                 stdev_mem = np.std(agg_res["memory_peaks"])
 
@@ -291,7 +342,10 @@ def main():
                     "nos_expandidos": det_res["nodes_expanded"],
                     "arestas_avaliadas": det_res["edges_evaluated"],
                     "caminho": det_res["path"],
-                    "cpu_media": mean_cpu, "cpu_desvio_padrao": stdev_cpu,
+                    "cpu_media": cpu_stats["mean"], "cpu_desvio_padrao": cpu_stats["stdev"],
+                    "cpu_mediana": cpu_stats["median"], "cpu_p95": cpu_stats["p95"],
+                    "cpu_ic95_inferior": cpu_stats["ci_low"], "cpu_ic95_superior": cpu_stats["ci_high"],
+                    "cpu_amostras": cpu_stats["samples"],
                     "memoria_media_kib": mean_mem, "memoria_desvio_padrao": stdev_mem,
                 }
                 summary_results.append(summary)
@@ -309,8 +363,8 @@ def main():
         # --- Apresentação dos Resultados ---
         print("\n--- Tabela Comparativa de Resultados ---\n")
         header = (
-            f"{'Algoritmo':<15} | {'Custo (km)':<12} | {'Nós Expandidos':<16} | {'Arestas Avaliadas':<20} | "
-            f"{'Pico Memória (μ ± σ KiB)':<28} | {'Tempo CPU (μ ± σ s)':<25} | {'Caminho Encontrado'}"
+            f"{'Algoritmo':<22} | {'Custo (km)':<12} | {'Nós Expandidos':<16} | {'Arestas Avaliadas':<20} | "
+            f"{'Pico Memória (μ ± σ KiB)':<28} | {'Tempo CPU (mediana / p95 s)':<28} | {'IC 95% média CPU (s)':<24} | {'Caminho Encontrado'}"
         )
         print(header)
         print("-" * (len(header)+10))
@@ -319,19 +373,35 @@ def main():
             path_names = " -> ".join([id_to_name[i] for i in res['caminho']])
 
             mem_stats_str = f"{res['memoria_media_kib']:.2f} ± {res['memoria_desvio_padrao']:.2f}"
-            cpu_stats_str = f"{res['cpu_media']:.6f} ± {res['cpu_desvio_padrao']:.6f}"
+            cpu_stats_str = f"{res['cpu_mediana']:.6f} / {res['cpu_p95']:.6f}"
+            cpu_ci_str = f"[{res['cpu_ic95_inferior']:.6f}, {res['cpu_ic95_superior']:.6f}]"
             # Formatação da linha de resultado
             result_line = (
-                f"{res['algoritmo']:<15} | {res['custo_km']:<12.2f} | {res['nos_expandidos']:<16} | {res['arestas_avaliadas']:<20} | "
-                f"{mem_stats_str:<28} | {cpu_stats_str:<25} | {path_names}"
+                f"{res['algoritmo']:<22} | {res['custo_km']:<12.2f} | {res['nos_expandidos']:<16} | {res['arestas_avaliadas']:<20} | "
+                f"{mem_stats_str:<28} | {cpu_stats_str:<28} | {cpu_ci_str:<24} | {path_names}"
             )
             print(result_line)
 
             # Ajusta o nome do algoritmo para criar um nome de arquivo válido
             algo_filename = res['algoritmo'].replace(' ', '_').replace('*', 'Star')
-            output_filename = os.path.join(output_dir, f"caminho_{challenge_name}_{algo_filename}.html")
-            # Chama o metodo para gerar o arquivo HTML com o caminho destacado
-            graph.show_path(res['caminho'], filename=output_filename)
+            routes.append({
+                "id": f"{challenge_name}_{algo_filename}",
+                "label": f"{challenge_name} ({start_city} -> {goal_city}) - {res['algoritmo']}",
+                "path": res['caminho'],
+                "cost": res['custo_km'],
+            })
+            if full_html:
+                output_filename = os.path.join(output_dir, f"caminho_{challenge_name}_{algo_filename}.html")
+                # Chama o metodo para gerar o arquivo HTML com o caminho destacado
+                graph.show_path(res['caminho'], filename=output_filename)
+
+        # Ganho da heurística ALT sobre a heurística em linha reta
+        if "a_star" in deterministic_results and "a_star_landmarks" in deterministic_results:
+            expanded_plain = deterministic_results["a_star"]["nodes_expanded"]
+            expanded_alt = deterministic_results["a_star_landmarks"]["nodes_expanded"]
+            reduction = 100 * (1 - expanded_alt / expanded_plain)
+            print(f"\nA* ALT expandiu {expanded_alt} nós contra {expanded_plain} do A* "
+                  f"(redução de {reduction:.1f}%)")
 
         # --- Exportação Final para CSV ---
         if all_challenges_summary:
@@ -342,7 +412,8 @@ def main():
             column_order = [
                 'desafio', 'origem', 'destino', 'algoritmo', 'custo_km', 'nos_expandidos',
                 'arestas_avaliadas', 'cpu_media', 'cpu_desvio_padrao', 'memoria_media_kib',
-                'memoria_desvio_padrao', 'caminho_str'
+                'memoria_desvio_padrao', 'cpu_mediana', 'cpu_p95', 'cpu_ic95_inferior', 'cpu_ic95_superior',
+                'cpu_amostras', 'caminho_str'
             ]
             df = df[column_order]
 
@@ -350,6 +421,17 @@ def main():
             df.to_csv(csv_filename, index=False, decimal=',', sep=';')
             print(f"Resultados salvos com sucesso em '{csv_filename}'")
 
+    # --- Visualizador de rotas ---
+    # A malha e as bibliotecas JS são gravadas uma única vez; cada rota vira uma pequena sobreposição.
+    viewer_filename = write_route_viewer(graph, routes, os.path.join(output_dir, "mapa"))
+    print(f"Visualizador com {len(routes)} rotas gerado em '{viewer_filename}'")
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Comparação de algoritmos de busca na malha logística nacional.")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="Número de processos para as rodadas de benchmark (padrão: número de CPUs)")
+    parser.add_argument("--full-html", action="store_true",
+                        help="Gera também um HTML completo do pyvis para cada rota (modo antigo)")
+    args = parser.parse_args()
+    main(workers=args.workers, full_html=args.full_html)
\ No newline at end of file
@@ -0,0 +1,234 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# Vetores que ficam em memória compartilhada: (nome, dtype, tamanho em função de n nós e m arcos).
+# Os três primeiros são o CSR (só leitura nos workers); 'distances' é escrito apenas pelo processo
+# principal entre as fases; 'frontier' e os 'request_*' levam as fases e as relaxações de ida e volta.
+_SHARED_ARRAYS = (
+    ("offsets", np.int64, lambda n, m: n + 1),
+    ("targets", np.int32, lambda n, m: m),
+    ("weights", np.float64, lambda n, m: m),
+    ("distances", np.float64, lambda n, m: n),
+    ("frontier", np.int64, lambda n, m: n),
+    ("request_nodes", np.int64, lambda n, m: m),
+    ("request_costs", np.float64, lambda n, m: m),
+    ("request_parents", np.int64, lambda n, m: m),
+)
+
+# Vetores compartilhados de cada processo do pool, abertos uma única vez na inicialização do worker
+_worker_arrays = None
+_worker_blocks = None
+
+
+def _attach(names: dict, n: int, m: int):
+    """Abre os blocos de memória compartilhada pelos nomes e devolve (blocos, {nome: vetor})."""
+    blocks, arrays = [], {}
+    for name, dtype, size in _SHARED_ARRAYS:
+        block = shared_memory.SharedMemory(name=names[name])
+        blocks.append(block)
+        arrays[name] = np.ndarray((size(n, m),), dtype=dtype, buffer=block.buf)
+    return blocks, arrays
+
+
+def _init_worker(names: dict, n: int, m: int):
+    global _worker_arrays, _worker_blocks
+    _worker_blocks, _worker_arrays = _attach(names, n, m)
+
+
+def _relax(arrays: dict, start: int, end: int, light: bool, delta: float, out_start: int) -> tuple:
+    """
+    Relaxa as arestas leves (peso <= delta) ou pesadas dos nós frontier[start:end], vetorizado.
+    Só os pedidos que melhoram a distância atual são escritos nos vetores request_*, a partir de
+    out_start (a região reservada para este pedaço tem o tamanho da soma dos graus dos seus nós).
+    :return: (out_start, quantidade de pedidos escritos, arestas avaliadas).
+    """
+    offsets, distances = arrays["offsets"], arrays["distances"]
+    nodes = arrays["frontier"][start:end]
+    first_edge = offsets[nodes]
+    degrees = offsets[nodes + 1] - first_edge
+    total = int(degrees.sum())
+    # Índice de cada arco dos nós do pedaço no CSR: início do nó + posição dentro dele
+    edges = np.repeat(first_edge - (np.cumsum(degrees) - degrees), degrees) + np.arange(total)
+    parents = np.repeat(nodes, degrees)
+    weights = arrays["weights"][edges]
+    neighbors = arrays["targets"][edges]
+    costs = distances[parents] + weights
+    mask = (weights <= delta) if light else (weights > delta)
+    mask &= costs < distances[neighbors]
+
+    count = int(mask.sum())
+    arrays["request_nodes"][out_start:out_start + count] = neighbors[mask]
+    arrays["request_costs"][out_start:out_start + count] = costs[mask]
+    arrays["request_parents"][out_start:out_start + count] = parents[mask]
+    return out_start, count, total
+
+
+def _worker_relax(args):
+    return _relax(_worker_arrays, *args)
+
+
+class DeltaSteppingSSSP:
+    """
+    Árvore de caminhos mínimos a partir de uma origem (como shortest_path_tree) por delta-stepping,
+    com as relaxações de cada fase divididas entre processos.
+
+    Os nós são agrupados em baldes de largura 'delta' pela distância provisória. O balde de menor
+    distância é processado em fases: todas as arestas leves (peso <= delta) dos seus nós são relaxadas
+    de uma vez, e os nós que melhoraram sem sair do balde formam a fase seguinte; quando ele esvazia,
+    as arestas pesadas dos nós fixados são relaxadas uma única vez. Dentro de uma fase as relaxações
+    são independentes, então a fronteira é dividida em pedaços (com somas de graus parecidas), um por
+    worker.
+
+    O CSR do FrozenGraph, as distâncias e os buffers de pedidos ficam em multiprocessing.shared_memory,
+    abertos pelos workers uma única vez; por fase, cada worker só recebe os limites do seu pedaço e
+    devolve quantos pedidos escreveu. O processo principal aplica os pedidos (o menor custo por nó).
+
+    Use como gerenciador de contexto (ou chame close) para encerrar o pool e liberar a memória.
+    """
+
+    def __init__(self, graph, workers: int = None, delta: float = None, min_parallel_edges: int = 20_000):
+        """
+        :param graph: FrozenGraph (ou Graph, que é congelado).
+        :param workers: número de processos (padrão: número de CPUs). Com 1, roda no próprio processo.
+        :param delta: largura dos baldes (padrão: 8 vezes o peso médio das arestas). Baldes largos dão
+                      fases maiores (mais paralelismo) e mais relaxações repetidas; estreitos, o contrário.
+        :param min_parallel_edges: fases com menos arcos que isso são relaxadas no próprio processo,
+                                   onde o custo de acionar o pool seria maior que o ganho.
+        """
+        if hasattr(graph, "freeze"):
+            graph = graph.freeze()
+        self.graph = graph
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        n, m = graph.num_nodes, len(graph.targets)
+        self.delta = float(delta) if delta is not None else (8 * float(np.mean(graph.weights)) if m else 1.0)
+        self.min_parallel_edges = min_parallel_edges
+
+        self._blocks = []
+        self._arrays = {}
+        for name, dtype, size in _SHARED_ARRAYS:
+            nbytes = max(1, size(n, m) * np.dtype(dtype).itemsize)
+            block = shared_memory.SharedMemory(create=True, size=nbytes)
+            self._blocks.append(block)
+            self._arrays[name] = np.ndarray((size(n, m),), dtype=dtype, buffer=block.buf)
+        self._arrays["offsets"][:] = graph.offsets
+        self._arrays["targets"][:] = graph.targets
+        self._arrays["weights"][:] = graph.weights
+
+        self._executor = None
+        if self.workers > 1:
+            names = {name: block.name for (name, _, _), block in zip(_SHARED_ARRAYS, self._blocks)}
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                                 initargs=(names, n, m))
+        # Contadores da última busca
+        self.phases = 0
+        self.edges_evaluated = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        self._arrays = {}
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+    # --- Fases ---
+
+    def _relax_frontier(self, frontier: np.ndarray, light: bool) -> tuple:
+        """
+        Relaxa as arestas (leves ou pesadas) da fronteira, dividida entre os workers.
+        :return: (nós, custos, pais) dos pedidos que melhoram a distância atual.
+        """
+        arrays = self._arrays
+        arrays["frontier"][:len(frontier)] = frontier
+        degrees = arrays["offsets"][frontier + 1] - arrays["offsets"][frontier]
+        out_offsets = np.concatenate(([0], np.cumsum(degrees)))
+        total = int(out_offsets[-1])
+
+        if self._executor is None or total < self.min_parallel_edges:
+            chunks = [_relax(arrays, 0, len(frontier), light, self.delta, 0)]
+        else:
+            # Cortes da fronteira em pedaços com somas de graus parecidas
+            cuts = np.searchsorted(out_offsets, np.linspace(0, total, self.workers + 1)[1:-1])
+            bounds = [0, *cuts.tolist(), len(frontier)]
+            tasks = [(start, end, light, self.delta, int(out_offsets[start]))
+                     for start, end in zip(bounds, bounds[1:]) if end > start]
+            chunks = list(self._executor.map(_worker_relax, tasks))
+
+        self.edges_evaluated += sum(evaluated for _, _, evaluated in chunks)
+        parts = [slice(out_start, out_start + count) for out_start, count, _ in chunks]
+        return tuple(np.concatenate([arrays[name][part] for part in parts])
+                     for name in ("request_nodes", "request_costs", "request_parents"))
+
+    def _apply(self, requests: tuple, predecessors: np.ndarray) -> np.ndarray:
+        """Aplica o menor pedido de cada nó que ainda melhora sua distância; retorna os nós atualizados."""
+        nodes, costs, parents = requests
+        if not len(nodes):
+            return nodes
+        order = np.lexsort((costs, nodes))
+        nodes, costs, parents = nodes[order], costs[order], parents[order]
+        first = np.concatenate(([True], nodes[1:] != nodes[:-1]))
+        nodes, costs, parents = nodes[first], costs[first], parents[first]
+        distances = self._arrays["distances"]
+        better = costs < distances[nodes]
+        nodes = nodes[better]
+        distances[nodes] = costs[better]
+        predecessors[nodes] = parents[better]
+        return nodes
+
+    # --- Consulta ---
+
+    def shortest_path_tree(self, source_id: int) -> tuple:
+        """
+        Distâncias e predecessores de todos os nós a partir de source_id.
+        :return: (distancias, predecessores), vetores na ordem dos índices densos do FrozenGraph:
+                 distância inf e predecessor -1 para nós inalcançáveis (a origem também tem -1).
+        """
+        n = self.graph.num_nodes
+        distances = self._arrays["distances"]
+        distances[:] = np.inf
+        predecessors = np.full(n, -1, dtype=np.int64)
+        settled = np.zeros(n, dtype=bool)
+        self.phases = 0
+        self.edges_evaluated = 0
+
+        source = self.graph.index_of(source_id)
+        distances[source] = 0
+        pending = np.array([source], dtype=np.int64)  # nós alcançados e ainda não fixados (com repetições)
+        while True:
+            pending = np.unique(pending[~settled[pending]])
+            if not len(pending):
+                break
+            buckets = np.floor(distances[pending] / self.delta)
+            bucket = buckets.min()
+            frontier, pending = pending[buckets == bucket], pending[buckets != bucket]
+            upper = (bucket + 1) * self.delta
+
+            # Fases leves: repetidas enquanto algum nó melhorar sem sair do balde atual
+            bucket_nodes = []
+            while len(frontier):
+                self.phases += 1
+                bucket_nodes.append(frontier)
+                updated = self._apply(self._relax_frontier(frontier, light=True), predecessors)
+                inside = distances[updated] < upper
+                frontier = updated[inside]
+                pending = np.concatenate((pending, updated[~inside]))
+
+            # Os nós do balde estão fixados: suas arestas pesadas são relaxadas uma única vez
+            bucket_nodes = np.unique(np.concatenate(bucket_nodes))
+            settled[bucket_nodes] = True
+            self.phases += 1
+            updated = self._apply(self._relax_frontier(bucket_nodes, light=False), predecessors)
+            pending = np.concatenate((pending, updated))
+
+        return distances.copy(), predecessors
@@ -0,0 +1,288 @@
+import heapq
+import math
+
+import numpy as np
+
+
+def _coordinate_bisection(coords: np.ndarray, depth: int) -> np.ndarray:
+    """
+    Bissecção recursiva por coordenadas: 'depth' vezes, cada grupo de nós é dividido ao meio na
+    mediana da coordenada (latitude ou longitude) em que ele é mais espalhado.
+    :return: código de cada nó (índice denso) com 'depth' bits; o bit mais significativo é o da
+             primeira divisão, então nós com o mesmo prefixo ficam na mesma região.
+    """
+    codes = np.zeros(len(coords), dtype=np.int64)
+    groups = [np.arange(len(coords))]
+    for level in range(depth):
+        bit = 1 << (depth - 1 - level)
+        next_groups = []
+        for group in groups:
+            if len(group) < 2:
+                next_groups.append(group)
+                continue
+            extent = coords[group].max(axis=0) - coords[group].min(axis=0)
+            order = group[np.argsort(coords[group, int(np.argmax(extent))], kind="stable")]
+            half = len(order) // 2
+            codes[order[half:]] |= bit
+            next_groups.extend((order[:half], order[half:]))
+        groups = next_groups
+    return codes
+
+
+class MultiLevelPartition:
+    """
+    Roteamento por regiões no estilo CRP (Customizable Route Planning).
+
+    Pré-processamento em duas fases:
+    - Partição (só depende da geometria): a malha é dividida em células por bissecção recursiva de
+      coordenadas, em 'num_levels' níveis aninhados; o nível 1 tem as células menores (no máximo
+      'cell_size' nós) e cada célula de um nível é a união de células do nível de baixo. Os nós de
+      fronteira de uma célula são os que têm aresta para fora dela.
+    - Customização (depende dos pesos): cada célula guarda uma "clique" com a distância entre cada
+      par dos seus nós de fronteira, calculada por um Dijkstra restrito à célula. No nível 1 a busca
+      usa as arestas originais; nos níveis acima, as cliques das subcélulas e as arestas entre elas.
+
+    Consulta: um Dijkstra que usa as arestas originais só dentro das células da origem e do destino
+    e, no resto da malha, pula de fronteira em fronteira pelas cliques do nível mais alto possível.
+    As arestas das cliques do caminho são desempacotadas com buscas locais dentro da própria célula.
+
+    Ao contrário das Contraction Hierarchies, a alteração de uma aresta (Graph.update_edge_weight,
+    remove_edge, add_edge) não exige refazer o pré-processamento: update recustomiza só a célula que
+    contém a aresta e as células que a englobam nos níveis acima, uma por nível.
+    """
+
+    def __init__(self, graph, cell_size: int = 64, num_levels: int = 2):
+        """
+        :param graph: Graph ou FrozenGraph. Com Graph, alterações de arestas entre nós já existentes
+                      são aplicadas por update; nós adicionados depois exigem uma nova partição.
+        :param cell_size: número máximo de nós por célula do nível 1.
+        :param num_levels: número de níveis de células (limitado pelo número de bissecções).
+        """
+        self.graph = graph
+        node_ids = [node.id for node in graph.nodes]
+        coords = np.array([node.coord for node in graph.nodes], dtype=float).reshape(-1, 2)
+
+        depth = math.ceil(math.log2(len(node_ids) / cell_size)) if len(node_ids) > cell_size else 0
+        self.num_levels = min(num_levels, depth)
+        codes = _coordinate_bisection(coords, depth).tolist()
+        # cells[nível][id_no] = célula do nó naquele nível (o nível 0, a malha original, não é usado).
+        # Os níveis usam prefixos cada vez mais curtos do código da bissecção.
+        shifts = [0] + [(level - 1) * depth // self.num_levels for level in range(1, self.num_levels + 1)]
+        self.cells = [None] + [dict(zip(node_ids, (code >> shifts[level] for code in codes)))
+                               for level in range(1, self.num_levels + 1)]
+
+        # boundary[nível][célula] = nós de fronteira; overlay[nível][id_no] = {fronteira: distância}
+        self.boundary = [None] + [{} for _ in range(self.num_levels)]
+        self.overlay = [None] + [{} for _ in range(self.num_levels)]
+        for node_id in node_ids:
+            for level in range(1, self.num_levels + 1):
+                if self._is_boundary(node_id, level):
+                    self.boundary[level].setdefault(self.cells[level][node_id], set()).add(node_id)
+
+        if hasattr(graph, "track_edge_changes"):
+            graph.track_edge_changes()
+        self._version = self._graph_version()
+        self.customize()
+
+    def _graph_version(self):
+        # O FrozenGraph é imutável e não tem versão
+        return getattr(self.graph, "version", 0)
+
+    # --- Estrutura das células ---
+
+    def _cut_level(self, node_id_1: int, node_id_2: int) -> int:
+        """Nível mais alto em que os dois nós estão em células diferentes (0 se sempre juntos)."""
+        for level in range(self.num_levels, 0, -1):
+            if self.cells[level][node_id_1] != self.cells[level][node_id_2]:
+                return level
+        return 0
+
+    def _is_boundary(self, node_id: int, level: int) -> bool:
+        cell = self.cells[level][node_id]
+        return any(self.cells[level][neighbor_id] != cell for neighbor_id, _ in self.graph.get_neighbors(node_id))
+
+    def _neighbors(self, node_id: int, level: int):
+        """
+        Arestas de node_id no grafo de busca do nível: no nível 0, as arestas originais; acima, a
+        clique da célula do nó e as arestas originais que saem dela.
+        :return: trios (id_vizinho, peso, nível da aresta), com nível 0 para as arestas originais.
+        """
+        if level == 0:
+            for neighbor_id, weight in self.graph.get_neighbors(node_id):
+                yield neighbor_id, weight, 0
+            return
+        for neighbor_id, weight in self.overlay[level].get(node_id, {}).items():
+            yield neighbor_id, weight, level
+        # Como as células são aninhadas, células diferentes neste nível implicam _cut_level >= level
+        cells = self.cells[level]
+        cell = cells[node_id]
+        for neighbor_id, weight in self.graph.get_neighbors(node_id):
+            if cells[neighbor_id] != cell:
+                yield neighbor_id, weight, 0
+
+    def _cell_search(self, level: int, source_id: int, target_id: int = None):
+        """
+        Dijkstra a partir de source_id restrito à célula do nível 'level' que o contém, sobre o grafo
+        de busca do nível de baixo. Para ao fixar target_id, se informado.
+        :return: (distâncias, predecessores), com predecessores[v] = (u, nível da aresta u-v).
+        """
+        cells = self.cells[level]
+        cell = cells[source_id]
+        distances = {source_id: 0}
+        predecessors = {}
+        pq = [(0, source_id)]
+        settled = set()
+        while pq:
+            cost, node_id = heapq.heappop(pq)
+            if node_id in settled:
+                continue
+            settled.add(node_id)
+            if node_id == target_id:
+                break
+            for neighbor_id, weight, edge_level in self._neighbors(node_id, level - 1):
+                new_cost = cost + weight
+                if cells[neighbor_id] == cell and new_cost < distances.get(neighbor_id, float('inf')):
+                    distances[neighbor_id] = new_cost
+                    predecessors[neighbor_id] = (node_id, edge_level)
+                    heapq.heappush(pq, (new_cost, neighbor_id))
+        return distances, predecessors
+
+    # --- Customização ---
+
+    def _customize_cell(self, level: int, cell: int):
+        """Recalcula a clique de uma célula: um Dijkstra restrito a partir de cada nó de fronteira."""
+        boundary = self.boundary[level].get(cell, set())
+        for node_id in boundary:
+            distances, _ = self._cell_search(level, node_id)
+            self.overlay[level][node_id] = {
+                other_id: distances[other_id] for other_id in boundary
+                if other_id != node_id and other_id in distances
+            }
+
+    def customize(self, dirty_cells: set = None):
+        """
+        Recalcula as cliques, de baixo para cima (cada nível usa as cliques do nível de baixo).
+        :param dirty_cells: pares (nível, célula) a recalcular; padrão: todas as células.
+        """
+        for level in range(1, self.num_levels + 1):
+            if dirty_cells is None:
+                self.overlay[level].clear()
+                cells = list(self.boundary[level])
+            else:
+                cells = [cell for dirty_level, cell in dirty_cells if dirty_level == level]
+            for cell in cells:
+                self._customize_cell(level, cell)
+
+    def update(self) -> int:
+        """
+        Aplica as alterações de arestas feitas no Graph desde a última customização.
+        Uma aresta entre nós que só se separam no nível c (0 se estão sempre na mesma célula) afeta as
+        cliques das células que a contêm nos níveis acima de c; se ela muda a fronteira de uma célula,
+        essa célula e as que a englobam também são recalculadas.
+        :return: número de células recustomizadas.
+        """
+        dirty_cells = set()
+        for node_id_1, node_id_2 in self.graph.edge_changes_since(self._version):
+            cut_level = self._cut_level(node_id_1, node_id_2)
+            for level in range(cut_level + 1, self.num_levels + 1):
+                dirty_cells.add((level, self.cells[level][node_id_1]))
+            for node_id in (node_id_1, node_id_2):
+                for level in range(1, self.num_levels + 1):
+                    cell = self.cells[level][node_id]
+                    boundary = self.boundary[level].setdefault(cell, set())
+                    if self._is_boundary(node_id, level) == (node_id in boundary):
+                        continue
+                    if node_id in boundary:
+                        boundary.remove(node_id)
+                        self.overlay[level].pop(node_id, None)
+                    else:
+                        boundary.add(node_id)
+                    for upper_level in range(level, self.num_levels + 1):
+                        dirty_cells.add((upper_level, self.cells[upper_level][node_id]))
+        self._version = self._graph_version()
+        self.customize(dirty_cells)
+        return len(dirty_cells)
+
+    # --- Consulta ---
+
+    def _query_level(self, node_id: int, start_id: int, goal_id: int) -> int:
+        """Nível mais alto em que o nó não está na célula da origem nem na do destino (0 se está)."""
+        for level in range(self.num_levels, 0, -1):
+            cell = self.cells[level][node_id]
+            if cell != self.cells[level][start_id] and cell != self.cells[level][goal_id]:
+                return level
+        return 0
+
+    def query(self, start_id: int, goal_id: int):
+        """
+        Dijkstra sobre as células da origem e do destino e sobre as cliques das demais.
+        Se o grafo mudou desde a última customização, chama update antes.
+        Retorna (caminho, custo, métricas) ou (None, inf, métricas) se não houver caminho.
+        """
+        if self._graph_version() != self._version:
+            self.update()
+
+        distances = {start_id: 0}
+        predecessors = {}
+        pq = [(0, start_id)]
+        settled = set()
+        nodes_expanded = 0
+        edges_evaluated = 0
+        max_frontier_size = 1
+
+        while pq:
+            max_frontier_size = max(max_frontier_size, len(pq))
+            cost, node_id = heapq.heappop(pq)
+            if node_id in settled:
+                continue
+            settled.add(node_id)
+            nodes_expanded += 1
+            if node_id == goal_id:
+                break
+            level = self._query_level(node_id, start_id, goal_id)
+            for neighbor_id, weight, edge_level in self._neighbors(node_id, level):
+                edges_evaluated += 1
+                new_cost = cost + weight
+                if new_cost < distances.get(neighbor_id, float('inf')):
+                    distances[neighbor_id] = new_cost
+                    predecessors[neighbor_id] = (node_id, edge_level)
+                    heapq.heappush(pq, (new_cost, neighbor_id))
+
+        metrics = {"nodes_expanded": nodes_expanded, "edges_evaluated": edges_evaluated,
+                   "max_frontier_size": max_frontier_size}
+        if goal_id not in settled:
+            return None, float('inf'), metrics
+
+        path = [goal_id]
+        node_id = goal_id
+        while node_id != start_id:
+            previous_id, edge_level = predecessors[node_id]
+            self._unpack(previous_id, node_id, edge_level, path)
+            node_id = previous_id
+        path.reverse()
+        return path, distances[goal_id], metrics
+
+    def _unpack(self, node_id_1: int, node_id_2: int, level: int, path: list):
+        """
+        Acrescenta a 'path' (construído do fim para o começo) os nós da aresta node_id_1 -> node_id_2
+        do nível informado, de node_id_2 (exclusive) até node_id_1 (inclusive). As arestas de clique
+        são refeitas por uma busca na célula, cujas arestas são desempacotadas recursivamente.
+        """
+        if level == 0:
+            path.append(node_id_1)
+            return
+        _, predecessors = self._cell_search(level, node_id_1, node_id_2)
+        node_id = node_id_2
+        while node_id != node_id_1:
+            previous_id, edge_level = predecessors[node_id]
+            self._unpack(previous_id, node_id, edge_level, path)
+            node_id = previous_id
+
+    @property
+    def num_cells(self) -> list:
+        """Número de células de cada nível, do nível 1 para cima."""
+        return [len(set(self.cells[level].values())) for level in range(1, self.num_levels + 1)]
+
+    @property
+    def num_overlay_edges(self) -> int:
+        return sum(len(clique) for level in range(1, self.num_levels + 1) for clique in self.overlay[level].values())
@@ -0,0 +1,235 @@
+import heapq
+
+# Todas as filas de prioridade deste módulo têm a mesma interface:
+#   push(item, prioridade) -> insere o item, ou diminui sua prioridade se ele já estiver na fila
+#   pop()                  -> remove e retorna (prioridade, item) com a menor prioridade
+#   peek()                 -> retorna (prioridade, item) sem remover
+#   len(fila)              -> quantidade de entradas guardadas
+#   bool(fila)             -> se ainda há algum item a remover
+# Empates na prioridade são decididos pelo próprio item, como nas tuplas do heapq.
+
+
+class LazyHeap:
+    """
+    Heap binário do heapq com remoção preguiçosa (lazy deletion).
+    Cada melhoria de prioridade insere uma nova entrada, e as antigas ficam na fila; ao remover,
+    entradas de itens já retirados (conjunto 'closed') são descartadas. É simples e tem operações
+    baratas, mas a fila cresce com as entradas desatualizadas.
+    """
+
+    def __init__(self, closed=None):
+        self._heap = []
+        # O conjunto de fechados pode vir de fora (ex.: de um SearchWorkspace)
+        self.closed = closed if closed is not None else set()
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __bool__(self):
+        # A fila só é considerada "não vazia" se ainda houver alguma entrada válida
+        self._discard_stale()
+        return bool(self._heap)
+
+    def push(self, item, priority):
+        heapq.heappush(self._heap, (priority, item))
+
+    def _discard_stale(self):
+        while self._heap and self._heap[0][1] in self.closed:
+            heapq.heappop(self._heap)
+
+    def peek(self):
+        self._discard_stale()
+        return self._heap[0] if self._heap else None
+
+    def pop(self):
+        self._discard_stale()
+        priority, item = heapq.heappop(self._heap)
+        self.closed.add(item)
+        return priority, item
+
+
+class IndexedDaryHeap:
+    """
+    Heap d-ário indexado: guarda a posição de cada item no vetor do heap, o que permite
+    diminuir a prioridade de um item já presente (decrease-key) em vez de inserir uma cópia.
+    Cada item aparece no máximo uma vez. Com d > 2 a árvore fica mais baixa: o decrease-key
+    (subida) fica mais barato e a remoção (descida, que compara d filhos) mais cara.
+    """
+
+    def __init__(self, d: int = 4):
+        if d < 2:
+            raise ValueError("O heap d-ário precisa de d >= 2.")
+        self.d = d
+        self._heap = []  # vetor com as entradas (prioridade, item)
+        self._position = {}  # item -> posição em self._heap
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __contains__(self, item):
+        return item in self._position
+
+    def push(self, item, priority):
+        position = self._position.get(item)
+        if position is None:
+            self._heap.append((priority, item))
+            self._position[item] = len(self._heap) - 1
+            self._sift_up(len(self._heap) - 1)
+        elif (priority, item) < self._heap[position]:
+            # decrease-key: só pode subir no heap
+            self._heap[position] = (priority, item)
+            self._sift_up(position)
+
+    def peek(self):
+        return self._heap[0] if self._heap else None
+
+    def pop(self):
+        heap = self._heap
+        top = heap[0]
+        last = heap.pop()
+        del self._position[top[1]]
+        if heap:
+            heap[0] = last
+            self._position[last[1]] = 0
+            self._sift_down(0)
+        return top
+
+    def _sift_up(self, i: int):
+        heap, position, d = self._heap, self._position, self.d
+        entry = heap[i]
+        while i > 0:
+            parent = (i - 1) // d
+            if entry < heap[parent]:
+                heap[i] = heap[parent]
+                position[heap[i][1]] = i
+                i = parent
+            else:
+                break
+        heap[i] = entry
+        position[entry[1]] = i
+
+    def _sift_down(self, i: int):
+        heap, position, d = self._heap, self._position, self.d
+        n = len(heap)
+        entry = heap[i]
+        while True:
+            first = d * i + 1
+            if first >= n:
+                break
+            # Menor entre os (até) d filhos
+            best = first
+            for child in range(first + 1, min(first + d, n)):
+                if heap[child] < heap[best]:
+                    best = child
+            if heap[best] < entry:
+                heap[i] = heap[best]
+                position[heap[i][1]] = i
+                i = best
+            else:
+                break
+        heap[i] = entry
+        position[entry[1]] = i
+
+
+class IndexedBinaryHeap(IndexedDaryHeap):
+    """Heap binário indexado com decrease-key (caso d = 2 do heap d-ário)."""
+
+    def __init__(self):
+        super().__init__(d=2)
+
+
+class RadixHeap:
+    """
+    Radix heap com remoção preguiçosa, para buscas monótonas (Dijkstra, A* com heurística consistente),
+    em que nenhuma prioridade inserida é menor que a última removida.
+    As prioridades são convertidas em ponto fixo (chave = int(prioridade * scale); com scale=100, a
+    resolução de 0,01 km dos pesos da malha) e cada entrada vai para o balde do bit mais alto em que
+    sua chave difere da última chave removida. Só o balde 0 (chave igual à última) é ordenado; ao
+    esvaziá-lo, o próximo balde não vazio é redistribuído em torno da sua menor chave, e cada entrada
+    desce de balde no máximo uma vez por bit: O(1) na inserção e O(log C) amortizado na remoção, sem
+    as comparações de tuplas do heap binário a cada operação.
+    Dentro do balde 0 as entradas são ordenadas pela prioridade original, então a ordem de remoção é
+    exatamente a da LazyHeap (inclusive os empates), e as métricas das buscas não mudam. Entradas com
+    chave menor que a última (arredondamentos de uma heurística quase consistente) vão para o balde 0
+    e continuam saindo na ordem certa.
+    """
+
+    def __init__(self, closed=None, scale: float = 100):
+        self.scale = scale
+        self._buckets = [[] for _ in range(65)]  # balde i: chaves que diferem da última no bit i - 1
+        self._last = 0  # última chave removida (as chaves nunca ficam abaixo dela)
+        self._size = 0
+        self.closed = closed if closed is not None else set()
+
+    def __len__(self):
+        return self._size
+
+    def __bool__(self):
+        return self._discard_stale()
+
+    def push(self, item, priority):
+        key = int(priority * self.scale)
+        last = self._last
+        if key <= last:
+            heapq.heappush(self._buckets[0], (priority, item, last))
+        else:
+            self._buckets[(key ^ last).bit_length()].append((priority, item, key))
+        self._size += 1
+
+    def _refill(self) -> bool:
+        """Redistribui o primeiro balde não vazio a partir da sua menor chave; False se não houver."""
+        buckets = self._buckets
+        for index in range(1, len(buckets)):
+            if buckets[index]:
+                break
+        else:
+            return False
+        entries, buckets[index] = buckets[index], []
+        last = self._last = min(entry[2] for entry in entries)
+        for entry in entries:
+            buckets[(entry[2] ^ last).bit_length()].append(entry)
+        heapq.heapify(buckets[0])
+        return True
+
+    def _discard_stale(self) -> bool:
+        """Deixa no topo do balde 0 a menor entrada válida; False se a fila não tiver nenhuma."""
+        bucket, closed = self._buckets[0], self.closed
+        while True:
+            while bucket and bucket[0][1] in closed:
+                heapq.heappop(bucket)
+                self._size -= 1
+            if bucket or not self._refill():
+                return bool(bucket)
+
+    def peek(self):
+        if not self._discard_stale():
+            return None
+        priority, item, _ = self._buckets[0][0]
+        return priority, item
+
+    def pop(self):
+        self._discard_stale()
+        priority, item, _ = heapq.heappop(self._buckets[0])
+        self._size -= 1
+        self.closed.add(item)
+        return priority, item
+
+
+# Tipos de fila aceitos pelo parâmetro 'queue' das buscas
+QUEUE_KINDS = ("lazy", "binary", "dary", "radix")
+
+
+def make_priority_queue(kind: str = "lazy", d: int = 4, closed=None):
+    """
+    Cria uma fila de prioridade vazia do tipo informado (ver QUEUE_KINDS).
+    :param closed: conjunto de fechados a ser usado pelas filas preguiçosas (opcional).
+    """
+    if kind == "lazy":
+        return LazyHeap(closed)
+    if kind == "binary":
+        return IndexedBinaryHeap()
+    if kind == "dary":
+        return IndexedDaryHeap(d)
+    if kind == "radix":
+        return RadixHeap(closed)
+    raise ValueError(f"Tipo de fila desconhecido: '{kind}'. Use um de {QUEUE_KINDS}.")
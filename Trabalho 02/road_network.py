@@ -0,0 +1,62 @@
+from distance import distance, one_to_many
+from spatial_index import SpatialGrid, lat_lon_to_unit_vectors
+
+
+def calculate_distance(coord1, coord2, mode: str = "geodesic"):
+    # O peso das arestas usa, por padrão, a distância geodésica exata (ver distance.DISTANCE_MODES)
+    return round(distance(coord1, coord2, mode), 2)
+
+def build_road_network(graph, coords_dict, strategic_connections, neighbors_count=3, distance_mode="geodesic"):
+    """
+    Constrói a malha rodoviária usando uma abordagem híbrida:
+    1. Adiciona conexões estratégicas manuais.
+    2. Conecta cada cidade às suas N vizinhas mais próximas.
+    :param distance_mode: cálculo do peso das arestas (ver distance.DISTANCE_MODES); malhas sintéticas
+                          grandes usam "haversine", bem mais rápido que a geodésica exata.
+    """
+    # Usamos um set para evitar adicionar arestas duplicadas (A->B e B->A com o mesmo peso)
+    existing_edges = set()
+
+    # 1. Adiciona as conexões estratégicas primeiro
+    if strategic_connections:
+        for city1_name, city2_name in strategic_connections:
+            id1 = coords_dict[city1_name]["id"]
+            id2 = coords_dict[city2_name]["id"]
+            coord1 = coords_dict[city1_name]["coord"]
+            coord2 = coords_dict[city2_name]["coord"]
+            dist = calculate_distance(coord1, coord2, distance_mode)
+
+            edge_tuple = tuple(sorted((id1, id2)))
+            if edge_tuple not in existing_edges:
+                graph.add_edge(id1, id2, round(dist, 2))
+                existing_edges.add(edge_tuple)
+
+    # 2. Conecta cada cidade às N vizinhas mais próximas.
+    # Em vez de calcular a distância geodésica para todas as outras cidades (O(n²)), um índice
+    # espacial sobre a esfera seleciona alguns candidatos e só eles têm a distância exata calculada.
+    # Pegamos uma folga de candidatos porque a ordem na esfera pode diferir levemente da ordem
+    # no elipsoide (geodésica) entre cidades quase equidistantes.
+    city_names = list(coords_dict.keys())
+    spatial_index = SpatialGrid(lat_lon_to_unit_vectors([coords_dict[name]["coord"] for name in city_names]))
+    candidates_count = 2 * neighbors_count + 2
+
+    for i, city1_name in enumerate(city_names):
+        coord1 = coords_dict[city1_name]["coord"]
+        candidates = [city_names[j] for j in spatial_index.nearest(spatial_index.points[i], candidates_count, exclude=i)]
+        # Distâncias de todos os candidatos em uma única chamada (vetorizada nos modos esféricos)
+        candidate_distances = one_to_many(coord1, [coords_dict[name]["coord"] for name in candidates], distance_mode)
+        distances = [(round(float(dist), 2), city2_name)
+                     for dist, city2_name in zip(candidate_distances.tolist(), candidates)]
+
+        distances.sort()
+
+        for dist, neighbor_name in distances[:neighbors_count]:
+            id1 = coords_dict[city1_name]["id"]
+            id2 = coords_dict[neighbor_name]["id"]
+
+            # Garante que a aresta seja armazenada de forma consistente (menor_id, maior_id)
+            edge_tuple = tuple(sorted((id1, id2)))
+
+            if edge_tuple not in existing_edges:
+                graph.add_edge(id1, id2, round(dist, 2))
+                existing_edges.add(edge_tuple)
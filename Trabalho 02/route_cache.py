@@ -0,0 +1,119 @@
+from collections import OrderedDict
+
+from algorithms import shortest_path_tree, reconstruct_path
+
+# Marca, no cache, as consultas já feitas que não têm caminho (o algoritmo retornou None)
+_NO_PATH = object()
+
+
+def _options_key(options: dict) -> tuple:
+    """Chave das opções do algoritmo; objetos não hasheáveis (ex.: caches) entram pela identidade."""
+    key = []
+    for name, value in sorted(options.items()):
+        try:
+            hash(value)
+        except TypeError:
+            value = ("id", id(value))
+        key.append((name, value))
+    return tuple(key)
+
+
+def _copy_result(result):
+    """Cópia rasa do resultado, com o caminho copiado: quem chama pode alterá-lo sem afetar o cache."""
+    if result is None:
+        return None
+    result = dict(result)
+    result["path"] = list(result["path"])
+    return result
+
+
+class RouteCache:
+    """
+    Cache de rotas na frente dos algoritmos de algorithms.py.
+    As rotas são guardadas pela chave (algoritmo, origem, destino, versão do grafo, opções), com no
+    máximo 'max_routes' entradas, descartando a usada há mais tempo (LRU). Toda alteração no Graph
+    (add_node/add_edge) incrementa graph.version: rotas de versões anteriores nunca são reaproveitadas
+    e são descartadas na primeira consulta após a mudança.
+
+    Também guarda até 'max_trees' árvores de caminhos mínimos (shortest_path_route): uma árvore
+    calculada a partir de uma origem responde, sem nova busca, a qualquer destino a partir dela e,
+    como a malha é não direcionada, a qualquer origem rumo a ela.
+    """
+
+    def __init__(self, graph, max_routes: int = 1024, max_trees: int = 8):
+        self.graph = graph
+        self.max_routes = max_routes
+        self.max_trees = max_trees
+        self._routes = OrderedDict()  # {chave: resultado}
+        self._trees = OrderedDict()  # {id_raiz: (distancias, predecessores)}
+        self._version = self._graph_version()
+        self.hits = 0
+        self.misses = 0
+
+    def _graph_version(self):
+        # O FrozenGraph é imutável e não tem versão
+        return getattr(self.graph, "version", 0)
+
+    def _check_version(self):
+        """Descarta tudo o que foi calculado sobre uma versão anterior do grafo."""
+        version = self._graph_version()
+        if version != self._version:
+            self.clear()
+            self._version = version
+        return version
+
+    def route(self, algorithm, start_id: int, goal_id: int, **options):
+        """
+        Retorna o resultado de algorithm(graph, start_id, goal_id, **options), do cache se possível.
+        O resultado é uma cópia; as métricas (contadores, tempos) são as da execução que o calculou.
+        """
+        version = self._check_version()
+        key = (algorithm.__name__, start_id, goal_id, version, _options_key(options))
+        result = self._routes.get(key)
+        if result is not None:
+            self.hits += 1
+            self._routes.move_to_end(key)
+            return None if result is _NO_PATH else _copy_result(result)
+
+        self.misses += 1
+        result = algorithm(self.graph, start_id, goal_id, **options)
+        self._routes[key] = _NO_PATH if result is None else _copy_result(result)
+        if len(self._routes) > self.max_routes:
+            self._routes.popitem(last=False)  # Remove a rota usada há mais tempo
+        return result
+
+    def shortest_path_route(self, start_id: int, goal_id: int):
+        """
+        Caminho mínimo a partir das árvores de caminhos mínimos em cache (reaproveitamento de subcaminhos).
+        Se houver uma árvore enraizada na origem ou no destino, a rota sai dela sem nova busca;
+        caso contrário, a árvore da origem é calculada e guardada.
+        :return: dict com name, path e cost, ou None se não houver caminho.
+        """
+        self._check_version()
+        reverse = False
+        tree = self._trees.get(start_id)
+        if tree is None and goal_id in self._trees:
+            tree, reverse = self._trees[goal_id], True
+
+        if tree is not None:
+            self.hits += 1
+            self._trees.move_to_end(goal_id if reverse else start_id)
+        else:
+            self.misses += 1
+            tree = shortest_path_tree(self.graph, start_id)
+            self._trees[start_id] = tree
+            if len(self._trees) > self.max_trees:
+                self._trees.popitem(last=False)
+
+        distances, predecessors = tree
+        target_id = start_id if reverse else goal_id
+        if target_id not in distances:
+            return None
+        path = reconstruct_path(predecessors, target_id)
+        if reverse:
+            path.reverse()
+        return {"name": "Shortest Path Tree", "path": path, "cost": round(distances[target_id], 2)}
+
+    def clear(self):
+        self._routes.clear()
+        self._trees.clear()
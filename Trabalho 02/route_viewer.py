@@ -0,0 +1,189 @@
+import json
+import os
+import shutil
+
+import pyvis
+
+# Bibliotecas do vis-network distribuídas com o pyvis (as mesmas usadas em Graph.show/show_path)
+_VIS_LIB_DIR = os.path.join(os.path.dirname(pyvis.__file__), "templates", "lib", "vis-9.1.2")
+_VIS_LIB_FILES = ("vis-network.min.js", "vis-network.css")
+
+# Mesmas cores e tamanhos de Graph._generate_network
+_STYLE = {
+    "node_color": "#97C2FC", "node_size": 15,
+    "path_node_color": "#FFD700", "path_node_size": 25,
+    "edge_color": "grey", "edge_width": 1,
+    "path_edge_color": "#00FF00", "path_edge_width": 3,
+}
+
+_INDEX_TEMPLATE = """<!DOCTYPE html>
+<html lang="pt-BR">
+<head>
+<meta charset="utf-8">
+<title>Rotas - malha logística</title>
+<link rel="stylesheet" href="lib/vis-network.css">
+<style>
+  body {{ margin: 0; background: #222222; color: white; font-family: sans-serif; }}
+  #toolbar {{ padding: 8px; }}
+  #network {{ width: 100%; height: 1000px; }}
+</style>
+</head>
+<body>
+<div id="toolbar">
+  <label for="route">Rota: </label><select id="route"><option value="">(somente a malha)</option></select>
+  <span id="info"></span>
+</div>
+<div id="network"></div>
+<script src="lib/vis-network.min.js"></script>
+<script src="rede_base.js"></script>
+<script>
+var STYLE = {style};
+var ROUTES = {routes};
+window.ROUTE_OVERLAYS = window.ROUTE_OVERLAYS || {{}};
+
+var nodes = new vis.DataSet(BASE_NETWORK.nodes.map(function (node) {{
+  return Object.assign({{color: STYLE.node_color, size: STYLE.node_size, physics: false}}, node);
+}}));
+var edges = new vis.DataSet(BASE_NETWORK.edges.map(function (edge) {{
+  return Object.assign({{color: STYLE.edge_color, width: STYLE.edge_width}}, edge);
+}}));
+var network = new vis.Network(document.getElementById("network"), {{nodes: nodes, edges: edges}}, BASE_NETWORK.options);
+
+var select = document.getElementById("route");
+ROUTES.forEach(function (route) {{
+  var option = document.createElement("option");
+  option.value = route.id;
+  option.textContent = route.label;
+  select.appendChild(option);
+}});
+
+// Apenas os elementos da rota anterior são restaurados, sem redesenhar a malha inteira
+var highlighted = {{nodes: [], edges: []}};
+
+function clearHighlight() {{
+  nodes.update(highlighted.nodes.map(function (id) {{ return {{id: id, color: STYLE.node_color, size: STYLE.node_size}}; }}));
+  edges.update(highlighted.edges.map(function (id) {{ return {{id: id, color: STYLE.edge_color, width: STYLE.edge_width}}; }}));
+  highlighted = {{nodes: [], edges: []}};
+  document.getElementById("info").textContent = "";
+}}
+
+function loadOverlay(routeId, callback) {{
+  if (window.ROUTE_OVERLAYS[routeId]) {{ callback(window.ROUTE_OVERLAYS[routeId]); return; }}
+  // As sobreposições são carregadas por <script> (e não por fetch) para funcionar também via file://
+  var script = document.createElement("script");
+  script.src = "rotas/" + routeId + ".js";
+  script.onload = function () {{ callback(window.ROUTE_OVERLAYS[routeId]); }};
+  document.head.appendChild(script);
+}}
+
+function showRoute(routeId) {{
+  clearHighlight();
+  if (!routeId) {{ return; }}
+  loadOverlay(routeId, function (overlay) {{
+    if (select.value !== routeId) {{ return; }}
+    highlighted = {{nodes: overlay.path, edges: overlay.edges}};
+    nodes.update(overlay.path.map(function (id) {{ return {{id: id, color: STYLE.path_node_color, size: STYLE.path_node_size}}; }}));
+    edges.update(overlay.edges.map(function (id) {{ return {{id: id, color: STYLE.path_edge_color, width: STYLE.path_edge_width}}; }}));
+    document.getElementById("info").textContent = overlay.label + " - " + overlay.cost + " km";
+  }});
+}}
+
+select.addEventListener("change", function () {{
+  history.replaceState(null, "", select.value ? "#" + select.value : "#");
+  showRoute(select.value);
+}});
+if (location.hash.length > 1) {{
+  select.value = location.hash.substring(1);
+  showRoute(select.value);
+}}
+</script>
+</body>
+</html>
+"""
+
+
+def _edge_id(id_1, id_2) -> str:
+    """ID da aresta não direcionada, o mesmo nos dois sentidos."""
+    return "{}-{}".format(*sorted((id_1, id_2)))
+
+
+def _write_js_assignment(filename: str, target: str, data):
+    """Grava um .js que apenas atribui o JSON de 'data' a 'target'."""
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write(f"{target} = {json.dumps(data, ensure_ascii=False, separators=(',', ':'))};\n")
+
+
+def write_base_network(graph, output_dir: str):
+    """
+    Grava os arquivos compartilhados por todas as rotas: as bibliotecas do vis-network (copiadas
+    uma única vez) e a malha base (nós posicionados geograficamente e arestas) em rede_base.js.
+    """
+    lib_dir = os.path.join(output_dir, "lib")
+    os.makedirs(lib_dir, exist_ok=True)
+    for lib_file in _VIS_LIB_FILES:
+        target = os.path.join(lib_dir, lib_file)
+        if not os.path.exists(target):
+            shutil.copyfile(os.path.join(_VIS_LIB_DIR, lib_file), target)
+
+    positions = graph._layout_positions()
+    nodes = [
+        {"id": node.id, "label": node.name, "x": round(positions[node.id][0], 1), "y": round(positions[node.id][1], 1)}
+        for node in graph.nodes
+    ]
+    # Uma aresta por par de nós, com o menor peso (como na lista de adjacência)
+    edges = {}
+    for node in graph.nodes:
+        for neighbor_id, weight in graph.get_neighbors(node.id):
+            edge_id = _edge_id(node.id, neighbor_id)
+            if edge_id not in edges:
+                edges[edge_id] = {"id": edge_id, "from": node.id, "to": neighbor_id, "title": f"{weight} km"}
+
+    base = {
+        "nodes": nodes,
+        "edges": list(edges.values()),
+        "options": {"edges": {"smooth": {"enabled": False}}, "physics": {"enabled": False},
+                    "nodes": {"font": {"color": "white"}}},
+    }
+    _write_js_assignment(os.path.join(output_dir, "rede_base.js"), "window.BASE_NETWORK", base)
+
+
+def write_route_overlay(route: dict, output_dir: str):
+    """
+    Grava a sobreposição de uma rota em rotas/<id>.js: apenas o caminho, as arestas a destacar
+    e o custo, em JSON, algumas centenas de bytes por rota.
+    """
+    path = route["path"]
+    overlay = {
+        "label": route["label"],
+        "cost": route.get("cost"),
+        "path": path,
+        "edges": [_edge_id(path[i], path[i + 1]) for i in range(len(path) - 1)],
+    }
+    routes_dir = os.path.join(output_dir, "rotas")
+    os.makedirs(routes_dir, exist_ok=True)
+    _write_js_assignment(os.path.join(routes_dir, f"{route['id']}.js"),
+                         f"window.ROUTE_OVERLAYS[{json.dumps(route['id'])}]", overlay)
+
+
+def write_route_viewer(graph, routes: list, output_dir: str) -> str:
+    """
+    Gera um visualizador de rotas em output_dir, no lugar de um HTML completo do pyvis por rota:
+    - lib/: bibliotecas do vis-network, uma única vez;
+    - rede_base.js: a malha, uma única vez;
+    - rotas/<id>.js: uma sobreposição pequena (JSON) por rota;
+    - index.html: página que desenha a malha uma vez e troca a rota destacada sob demanda.
+    :param routes: lista de dicts com "id" (usado no nome do arquivo), "label", "path" e "cost".
+    :return: caminho do index.html.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    write_base_network(graph, output_dir)
+    for route in routes:
+        write_route_overlay(route, output_dir)
+
+    index_filename = os.path.join(output_dir, "index.html")
+    with open(index_filename, "w", encoding="utf-8") as f:
+        f.write(_INDEX_TEMPLATE.format(
+            style=json.dumps(_STYLE),
+            routes=json.dumps([{"id": route["id"], "label": route["label"]} for route in routes], ensure_ascii=False),
+        ))
+    return index_filename
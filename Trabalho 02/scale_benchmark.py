@@ -0,0 +1,335 @@
+import argparse
+import os
+import sys
+import time
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+from algorithms import (dijkstra, bidirectional_dijkstra, greedy_search, a_star, bidirectional_a_star,
+                        depth_first_search, breadth_first_search, ida_star, sma_star, shortest_path_tree)
+from instrumentation import instrumentation, MEMORY, OFF
+from parallel_sssp import DeltaSteppingSSSP
+from priority_queue import QUEUE_KINDS
+from synthetic_network import generate_road_network, generate_queries
+from timing import measure
+
+# Algoritmos que não dependem de pré-processamento (ALT e CH ficam de fora)
+ALGORITHMS = {
+    func.__name__: func
+    for func in (dijkstra, bidirectional_dijkstra, a_star, bidirectional_a_star, greedy_search,
+                 breadth_first_search, depth_first_search)
+}
+# Dijkstra com as outras filas de prioridade (a padrão é a "lazy"), ex.: dijkstra_radix x dijkstra_binary
+ALGORITHMS.update({f"dijkstra_{kind}": partial(dijkstra, queue=kind) for kind in QUEUE_KINDS if kind != "lazy"})
+DEFAULT_ALGORITHMS = ["dijkstra", "a_star", "greedy_search", "breadth_first_search", "depth_first_search"]
+# Frações do pico de memória do SMA* sem restrição usadas como orçamento no estudo de memória x CPU
+DEFAULT_MEMORY_FRACTIONS = [1.0, 0.75, 0.5, 0.35]
+
+
+def _measure_query(call, time_budget: float):
+    """
+    Executa call() uma vez medindo o pico de memória (tracemalloc) e, se houver caminho, mede a
+    latência em execuções separadas, sem instrumentação.
+    :return: (resultado, mediana do tempo em s), ou (None, None) se não houver caminho.
+    """
+    with instrumentation(MEMORY):
+        result = call()
+    if not result:
+        return None, None
+    with instrumentation(OFF):
+        stats = measure(call, time_budget=time_budget)
+    return result, stats["median"]
+
+
+def benchmark_size(num_nodes: int, algorithm_names: list, num_queries: int = 20, seed: int = 42,
+                   time_budget: float = 0.05) -> list:
+    """
+    Gera uma malha sintética de num_nodes nós e mede cada algoritmo no mesmo conjunto de consultas.
+    Para cada consulta, o tempo é a mediana do timing.measure e a memória o pico do tracemalloc
+    (execução separada); depois, os valores são resumidos entre as consultas.
+    :return: uma linha (dict) por algoritmo.
+    """
+    start = time.perf_counter()
+    graph = generate_road_network(num_nodes, seed=seed).freeze()
+    queries = generate_queries(graph, num_queries, seed=seed)
+    print(f"Malha com {graph.num_nodes} nós e {graph.num_edges} arestas gerada em "
+          f"{time.perf_counter() - start:.1f}s; {len(queries)} consultas")
+
+    rows = []
+    for name in algorithm_names:
+        algorithm_func = ALGORITHMS[name]
+        latencies, memory_peaks, expanded = [], [], []
+        for start_id, goal_id in queries:
+            result, latency = _measure_query(lambda: algorithm_func(graph, start_id, goal_id), time_budget)
+            if not result:
+                continue
+            memory_peaks.append(result["memory_peak_kb"])
+            expanded.append(result["nodes_expanded"])
+            latencies.append(latency)
+
+        if not latencies:
+            continue
+        rows.append({
+            "nos": graph.num_nodes,
+            "arestas": graph.num_edges,
+            "algoritmo": name,
+            "consultas": len(latencies),
+            "latencia_mediana_s": float(np.median(latencies)),
+            "latencia_p95_s": float(np.percentile(latencies, 95)),
+            "memoria_media_kib": float(np.mean(memory_peaks)),
+            "nos_expandidos_medio": float(np.mean(expanded)),
+        })
+        print(f"   {name:<22} latência mediana {rows[-1]['latencia_mediana_s']:.6f}s | "
+              f"memória média {rows[-1]['memoria_media_kib']:.1f} KiB")
+    return rows
+
+
+def benchmark_memory_tradeoff(num_nodes: int, fractions: list, num_queries: int = 20, seed: int = 42,
+                              time_budget: float = 0.05, max_expansions: int = 100_000) -> list:
+    """
+    Estudo de memória x CPU numa malha sintética de num_nodes nós: o A* (referência, sem limite de
+    memória), o IDA* (memória proporcional à profundidade) e o SMA* com orçamentos de nós iguais a
+    frações do pico de nós em memória que o próprio SMA* atinge sem restrição em cada consulta.
+    Consultas em que o SMA* desiste por atingir max_expansions ficam fora das médias, mas são
+    contadas em "consultas" (e não em "resolvidas"). Consultas sem resultado no SMA* sem restrição
+    (usado para os orçamentos) são descartadas antes do estudo.
+    :return: uma linha (dict) por configuração.
+    """
+    start = time.perf_counter()
+    graph = generate_road_network(num_nodes, seed=seed).freeze()
+    queries = generate_queries(graph, num_queries, seed=seed)
+    print(f"Malha com {graph.num_nodes} nós e {graph.num_edges} arestas gerada em "
+          f"{time.perf_counter() - start:.1f}s; {len(queries)} consultas")
+
+    # Pico de nós em memória sem restrição, base dos orçamentos do SMA*. Consultas em que essa
+    # execução de referência não encontra caminho (ou desiste pelo limite de expansões) não têm
+    # orçamento e ficam fora do estudo, para todas as configurações.
+    with instrumentation(OFF):
+        reference_runs = [sma_star(graph, start_id, goal_id, max_nodes=sys.maxsize) for start_id, goal_id in queries]
+    skipped = sum(result is None for result in reference_runs)
+    if skipped:
+        print(f"   {skipped} consulta(s) sem resultado no SMA* sem restrição, ignoradas")
+    peaks = [result["max_frontier_size"] for result in reference_runs if result is not None]
+    queries = [query for query, result in zip(queries, reference_runs) if result is not None]
+
+    references = {"a_star": a_star, "ida_star": ida_star}
+    configurations = [(name, None) for name in references] + [("sma_star", fraction) for fraction in fractions]
+    rows = []
+    for name, fraction in configurations:
+        latencies, memory_peaks, expanded, budgets = [], [], [], []
+        for (start_id, goal_id), peak in zip(queries, peaks):
+            if name == "sma_star":
+                budget = max(2, round(fraction * peak))
+                budgets.append(budget)
+                call = lambda: sma_star(graph, start_id, goal_id, max_nodes=budget, max_expansions=max_expansions)
+            else:
+                call = lambda: references[name](graph, start_id, goal_id)
+            result, latency = _measure_query(call, time_budget)
+            if not result:
+                continue
+            memory_peaks.append(result["memory_peak_kb"])
+            expanded.append(result["nodes_expanded"])
+            latencies.append(latency)
+
+        row = {
+            "nos": graph.num_nodes,
+            "algoritmo": name,
+            "fracao_memoria": fraction,
+            "orcamento_medio_nos": float(np.mean(budgets)) if budgets else None,
+            "consultas": len(queries),
+            "resolvidas": len(latencies),
+            "latencia_mediana_s": float(np.median(latencies)) if latencies else None,
+            "latencia_p95_s": float(np.percentile(latencies, 95)) if latencies else None,
+            "memoria_media_kib": float(np.mean(memory_peaks)) if memory_peaks else None,
+            "nos_expandidos_medio": float(np.mean(expanded)) if expanded else None,
+        }
+        rows.append(row)
+        label = name if fraction is None else f"{name} ({fraction:.0%})"
+        if latencies:
+            print(f"   {label:<22} latência mediana {row['latencia_mediana_s']:.6f}s | "
+                  f"memória média {row['memoria_media_kib']:.1f} KiB | {row['resolvidas']}/{row['consultas']} resolvidas")
+        else:
+            print(f"   {label:<22} nenhuma consulta resolvida")
+    return rows
+
+
+def benchmark_parallel_sssp(num_nodes: int, worker_counts: list, num_sources: int = 3, seed: int = 42,
+                            time_budget: float = 1.0) -> list:
+    """
+    Árvores de caminhos mínimos completas numa malha sintética de num_nodes nós: o shortest_path_tree
+    (Dijkstra de um processo, referência) e o delta-stepping com cada número de workers.
+    Os tempos são de relógio de parede (o tempo de CPU do processo principal não inclui os workers);
+    o speedup é em relação ao delta-stepping com 1 worker, e o speedup_dijkstra em relação à referência.
+    :return: uma linha (dict) por configuração.
+    """
+    start = time.perf_counter()
+    graph = generate_road_network(num_nodes, seed=seed).freeze()
+    sources = [start_id for start_id, _ in generate_queries(graph, num_sources, seed=seed)]
+    print(f"Malha com {graph.num_nodes} nós e {graph.num_edges} arestas gerada em "
+          f"{time.perf_counter() - start:.1f}s; {len(sources)} origens")
+
+    def median_time(call):
+        return float(np.median([measure(lambda: call(source_id), clock="wall", time_budget=time_budget)["median"]
+                                for source_id in sources]))
+
+    reference = median_time(lambda source_id: shortest_path_tree(graph, source_id))
+    rows = [{"nos": graph.num_nodes, "algoritmo": "shortest_path_tree", "workers": 1,
+             "latencia_mediana_s": reference, "speedup": None, "speedup_dijkstra": 1.0}]
+    print(f"   {'shortest_path_tree':<22} latência mediana {reference:.4f}s")
+    base = None
+    for workers in worker_counts:
+        with DeltaSteppingSSSP(graph, workers=workers) as sssp:
+            latency = median_time(sssp.shortest_path_tree)
+        base = base or latency
+        rows.append({"nos": graph.num_nodes, "algoritmo": "delta_stepping", "workers": workers,
+                     "latencia_mediana_s": latency, "speedup": base / latency,
+                     "speedup_dijkstra": reference / latency})
+        print(f"   {'delta_stepping':<15} {workers:>2} proc. latência mediana {latency:.4f}s | "
+              f"speedup {base / latency:.2f}x (x Dijkstra: {reference / latency:.2f}x)")
+    return rows
+
+
+def plot_parallel_speedup(df: pd.DataFrame, output_dir: str):
+    """Speedup do delta-stepping em função do número de workers, uma curva por tamanho de malha."""
+    import matplotlib.pyplot as plt
+
+    df = df[df["algoritmo"] == "delta_stepping"]
+    fig, ax = plt.subplots(figsize=(10, 6))
+    for num_nodes, df_size in df.groupby("nos"):
+        ax.plot(df_size["workers"], df_size["speedup"], marker="o", label=f"{num_nodes} nós")
+    max_workers = int(df["workers"].max())
+    ax.plot([1, max_workers], [1, max_workers], linestyle="--", color="gray", label="ideal")
+    ax.set_xlabel("Número de workers")
+    ax.set_ylabel("Speedup em relação a 1 worker")
+    ax.set_title("Delta-stepping em memória compartilhada")
+    ax.grid(True, alpha=0.3)
+    ax.legend()
+    fig.tight_layout()
+    fig.savefig(os.path.join(output_dir, "grafico_sssp_paralelo.png"))
+    plt.close(fig)
+
+
+def plot_memory_tradeoff(df: pd.DataFrame, output_dir: str):
+    """
+    Um gráfico por tamanho de malha: latência mediana x pico de memória médio. A curva do SMA* liga
+    os orçamentos testados; o A* e o IDA* aparecem como pontos de referência.
+    """
+    import matplotlib.pyplot as plt
+
+    df = df.dropna(subset=["latencia_mediana_s"])
+    for num_nodes, df_size in df.groupby("nos"):
+        fig, ax = plt.subplots(figsize=(10, 6))
+        df_sma = df_size[df_size["algoritmo"] == "sma_star"].sort_values("memoria_media_kib")
+        ax.plot(df_sma["memoria_media_kib"], df_sma["latencia_mediana_s"], marker="o", label="sma_star")
+        for _, row in df_sma.iterrows():
+            ax.annotate(f"{row['fracao_memoria']:.0%}", (row["memoria_media_kib"], row["latencia_mediana_s"]),
+                        textcoords="offset points", xytext=(5, 5))
+        for name, marker in (("a_star", "s"), ("ida_star", "^")):
+            df_reference = df_size[df_size["algoritmo"] == name]
+            ax.scatter(df_reference["memoria_media_kib"], df_reference["latencia_mediana_s"], marker=marker,
+                       s=80, label=name, zorder=3)
+        ax.set_yscale("log")
+        ax.set_xlabel("Pico de memória médio por consulta (KiB)")
+        ax.set_ylabel("Latência mediana por consulta (s)")
+        ax.set_title(f"Memória x CPU - malha com {num_nodes} nós")
+        ax.grid(True, which="both", alpha=0.3)
+        ax.legend()
+        fig.tight_layout()
+        fig.savefig(os.path.join(output_dir, f"grafico_memoria_cpu_{num_nodes}.png"))
+        plt.close(fig)
+
+
+def plot_scaling(df: pd.DataFrame, output_dir: str):
+    """Gráficos (escala log-log) de latência e memória em função do número de nós, por algoritmo."""
+    import matplotlib.pyplot as plt
+
+    charts = [
+        ("latencia_mediana_s", "Latência mediana por consulta (s)", "grafico_escala_latencia.png"),
+        ("memoria_media_kib", "Pico de memória médio por consulta (KiB)", "grafico_escala_memoria.png"),
+    ]
+    for column, ylabel, filename in charts:
+        fig, ax = plt.subplots(figsize=(10, 6))
+        for name, df_algorithm in df.groupby("algoritmo"):
+            df_algorithm = df_algorithm.sort_values("nos")
+            ax.plot(df_algorithm["nos"], df_algorithm[column], marker="o", label=name)
+        ax.set_xscale("log")
+        ax.set_yscale("log")
+        ax.set_xlabel("Número de nós da malha")
+        ax.set_ylabel(ylabel)
+        ax.set_title(f"{ylabel} x tamanho da malha")
+        ax.grid(True, which="both", alpha=0.3)
+        ax.legend()
+        fig.tight_layout()
+        fig.savefig(os.path.join(output_dir, filename))
+        plt.close(fig)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de escala dos algoritmos de busca em malhas sintéticas.")
+    parser.add_argument("-n", "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000],
+                        help="Números de nós das malhas geradas (ex.: 1000 10000 100000 1000000)")
+    parser.add_argument("-q", "--queries", type=int, default=20, help="Consultas (origem, destino) por malha")
+    parser.add_argument("-a", "--algorithms", nargs="+", default=DEFAULT_ALGORITHMS, choices=sorted(ALGORITHMS))
+    parser.add_argument("-s", "--seed", type=int, default=42)
+    parser.add_argument("-p", "--no-plot", action="store_true")
+    parser.add_argument("-o", "--output", default=os.path.join("outputs", "escala"))
+    parser.add_argument("-m", "--memory-fractions", type=float, nargs="*",
+                        help="Em vez do benchmark de escala, faz o estudo de memória x CPU (A*, IDA* e SMA*) "
+                             "com estas frações de memória como orçamento do SMA* (padrão: "
+                             f"{' '.join(map(str, DEFAULT_MEMORY_FRACTIONS))})")
+    parser.add_argument("-w", "--workers", type=int,
+                        help="Em vez do benchmark de escala, mede o delta-stepping paralelo (árvores de caminhos "
+                             "mínimos completas) com 1 a WORKERS processos")
+    args = parser.parse_args()
+
+    os.makedirs(args.output, exist_ok=True)
+    if args.workers is not None:
+        rows = []
+        for num_nodes in args.sizes:
+            print(f"\n--- SSSP paralelo, malha sintética com {num_nodes} nós ---")
+            rows.extend(benchmark_parallel_sssp(num_nodes, list(range(1, args.workers + 1)), seed=args.seed))
+
+        df = pd.DataFrame(rows)
+        csv_filename = os.path.join(args.output, "sssp_paralelo.csv")
+        df.to_csv(csv_filename, index=False, decimal=',', sep=';')
+        print(f"\nResultados salvos em '{csv_filename}'")
+        if not args.no_plot and not df.empty:
+            plot_parallel_speedup(df, args.output)
+            print(f"Gráficos salvos em '{args.output}'")
+        return
+
+    if args.memory_fractions is not None:
+        fractions = args.memory_fractions or DEFAULT_MEMORY_FRACTIONS
+        rows = []
+        for num_nodes in args.sizes:
+            print(f"\n--- Memória x CPU, malha sintética com {num_nodes} nós ---")
+            rows.extend(benchmark_memory_tradeoff(num_nodes, fractions, args.queries, args.seed))
+
+        df = pd.DataFrame(rows)
+        csv_filename = os.path.join(args.output, "memoria_cpu.csv")
+        df.to_csv(csv_filename, index=False, decimal=',', sep=';')
+        print(f"\nResultados salvos em '{csv_filename}'")
+        if not args.no_plot and not df.empty:
+            plot_memory_tradeoff(df, args.output)
+            print(f"Gráficos salvos em '{args.output}'")
+        return
+
+    rows = []
+    for num_nodes in args.sizes:
+        print(f"\n--- Malha sintética com {num_nodes} nós ---")
+        rows.extend(benchmark_size(num_nodes, args.algorithms, args.queries, args.seed))
+
+    df = pd.DataFrame(rows)
+    csv_filename = os.path.join(args.output, "escala_algoritmos.csv")
+    df.to_csv(csv_filename, index=False, decimal=',', sep=';')
+    print(f"\nResultados salvos em '{csv_filename}'")
+
+    if not args.no_plot and not df.empty:
+        plot_scaling(df, args.output)
+        print(f"Gráficos salvos em '{args.output}'")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+import math
+import numpy as np
+
+
+def lat_lon_to_unit_vectors(coords):
+    """
+    Converte coordenadas geográficas (latitude, longitude), em graus, para vetores
+    unitários 3D sobre a esfera. A distância euclidiana (corda) entre dois desses vetores
+    cresce junto com a distância sobre a superfície, então a ordem dos vizinhos mais
+    próximos é preservada, sem problemas na virada da longitude ou perto dos polos.
+    """
+    coords = np.radians(np.asarray(coords, dtype=np.float64).reshape(-1, 2))
+    lat, lon = coords[:, 0], coords[:, 1]
+    cos_lat = np.cos(lat)
+    return np.column_stack((cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)))
+
+
+class SpatialGrid:
+    """
+    Índice espacial em grade uniforme sobre pontos 3D.
+    Cada ponto é colocado em uma célula cúbica; uma consulta de k vizinhos mais próximos
+    percorre as células em "anéis" crescentes ao redor do ponto e para assim que nenhum
+    ponto fora dos anéis já visitados puder estar mais perto que os k encontrados.
+    """
+
+    def __init__(self, points, points_per_cell: int = 2):
+        self.points = np.asarray(points, dtype=np.float64)
+        n = len(self.points)
+
+        # Os pontos estão sobre a superfície da esfera, logo ocupam essencialmente uma
+        # área (2D). O tamanho da célula é escolhido a partir das duas maiores dimensões
+        # da caixa envolvente, para ter em média 'points_per_cell' pontos por célula.
+        extents = np.sort(np.ptp(self.points, axis=0))[::-1] if n else np.zeros(3)
+        area = extents[0] * extents[1]
+        if area > 0:
+            self.cell_size = math.sqrt(area * points_per_cell / n)
+        else:
+            self.cell_size = max(extents[0] / max(n, 1), 1e-9)
+
+        self._origin = self.points.min(axis=0) if n else np.zeros(3)
+        keys = self._cell_of(self.points)
+        self._cells = {}
+        for i, key in enumerate(map(tuple, keys.tolist())):
+            self._cells.setdefault(key, []).append(i)
+
+    def _cell_of(self, points):
+        return np.floor((points - self._origin) / self.cell_size).astype(np.int64)
+
+    def _ring(self, center, r):
+        """Gera as chaves das células a exatamente 'r' células de distância (Chebyshev) do centro."""
+        cx, cy, cz = center
+        if r == 0:
+            yield center
+            return
+        for dx in range(-r, r + 1):
+            for dy in range(-r, r + 1):
+                if abs(dx) == r or abs(dy) == r:
+                    for dz in range(-r, r + 1):
+                        yield (cx + dx, cy + dy, cz + dz)
+                else:
+                    yield (cx + dx, cy + dy, cz - r)
+                    yield (cx + dx, cy + dy, cz + r)
+
+    def nearest(self, point, k: int, exclude: int = None) -> list:
+        """
+        Retorna os índices dos k pontos mais próximos de 'point', do mais perto ao mais longe.
+        :param exclude: índice a ser ignorado (normalmente o próprio ponto consultado).
+        """
+        point = np.asarray(point, dtype=np.float64)
+        available = len(self.points) - (1 if exclude is not None else 0)
+        k = min(k, available)
+        if k <= 0:
+            return []
+
+        center = tuple(self._cell_of(point[None, :])[0].tolist())
+        candidates = []
+        r = 0
+        while True:
+            # Em regiões muito esparsas, os anéis passam a ter mais células do que o índice inteiro;
+            # nesse caso é mais barato comparar diretamente com todos os pontos.
+            if (2 * r + 1) ** 3 > 8 * len(self._cells):
+                dists = np.linalg.norm(self.points - point, axis=1)
+                if exclude is not None:
+                    dists[exclude] = np.inf
+                return np.argsort(dists, kind="stable")[:k].tolist()
+
+            for key in self._ring(center, r):
+                cell = self._cells.get(key)
+                if cell:
+                    candidates.extend(i for i in cell if i != exclude)
+
+            if len(candidates) >= k:
+                idx = np.asarray(candidates)
+                dists = np.linalg.norm(self.points[idx] - point, axis=1)
+                order = np.argsort(dists, kind="stable")[:k]
+                # Qualquer ponto em células ainda não visitadas está a pelo menos r * cell_size de distância.
+                if dists[order[-1]] <= r * self.cell_size or len(candidates) >= available:
+                    return idx[order].tolist()
+            r += 1
@@ -0,0 +1,96 @@
+import math
+import random
+
+from graph import Graph
+from road_network import build_road_network
+from spatial_index import SpatialGrid, lat_lon_to_unit_vectors
+
+# Caixa geográfica aproximada do Brasil (lat_min, lon_min, lat_max, lon_max), usada como padrão
+BRAZIL_BBOX = (-33.7, -73.9, 5.2, -34.8)
+
+
+def generate_coords(num_nodes: int, seed: int = 42, bbox: tuple = BRAZIL_BBOX) -> dict:
+    """
+    Gera num_nodes "cidades" em posições aleatórias (uniformes) dentro da caixa geográfica,
+    no mesmo formato do dicionário coords de main.py: {nome: {"id": id, "coord": (lat, lon)}}.
+    """
+    rng = random.Random(seed)
+    lat_min, lon_min, lat_max, lon_max = bbox
+    return {
+        f"N{i}": {"id": i, "coord": (rng.uniform(lat_min, lat_max), rng.uniform(lon_min, lon_max))}
+        for i in range(1, num_nodes + 1)
+    }
+
+
+def generate_strategic_roads(coords_dict: dict, num_hubs: int = None, hub_neighbors: int = 2, seed: int = 42) -> list:
+    """
+    Sorteia algumas cidades como polos e liga cada polo aos polos mais próximos, imitando as
+    rodovias estratégicas de main.py: ligações longas que atravessam a malha local.
+    :param num_hubs: quantidade de polos (padrão: ~raiz quadrada do número de cidades).
+    :return: lista de pares (cidade, cidade), no formato de main.strategic_roads.
+    """
+    names = list(coords_dict.keys())
+    if num_hubs is None:
+        num_hubs = max(2, int(math.sqrt(len(names))))
+    hubs = random.Random(seed).sample(names, min(num_hubs, len(names)))
+    if len(hubs) < 2:
+        return []
+
+    spatial_index = SpatialGrid(lat_lon_to_unit_vectors([coords_dict[name]["coord"] for name in hubs]))
+    roads = []
+    for i, hub in enumerate(hubs):
+        for j in spatial_index.nearest(spatial_index.points[i], hub_neighbors, exclude=i):
+            roads.append((hub, hubs[j]))
+    return roads
+
+
+def generate_road_network(num_nodes: int, neighbors_count: int = 3, seed: int = 42, bbox: tuple = BRAZIL_BBOX,
+                          distance_mode: str = "haversine") -> Graph:
+    """
+    Gera uma malha rodoviária sintética com num_nodes nós, usando a mesma construção de
+    road_network.build_road_network (ligações estratégicas + N vizinhas mais próximas).
+    Os pesos usam, por padrão, a distância haversine: com centenas de milhares de nós, a
+    geodésica exata do geopy dominaria o tempo de geração.
+    """
+    coords_dict = generate_coords(num_nodes, seed, bbox)
+    graph = Graph()
+    for name, data in coords_dict.items():
+        graph.add_node(data["id"], name, data["coord"])
+    strategic_roads = generate_strategic_roads(coords_dict, seed=seed)
+    build_road_network(graph, coords_dict, strategic_roads, neighbors_count=neighbors_count,
+                       distance_mode=distance_mode)
+    return graph
+
+
+def largest_component(graph) -> list:
+    """IDs dos nós da maior componente conexa (consultas fora dela não teriam caminho)."""
+    component_of = {}
+    best = []
+    for node in graph.nodes:
+        if node.id in component_of:
+            continue
+        component = [node.id]
+        component_of[node.id] = node.id
+        stack = [node.id]
+        while stack:
+            current = stack.pop()
+            for neighbor_id, _ in graph.get_neighbors(current):
+                if neighbor_id not in component_of:
+                    component_of[neighbor_id] = node.id
+                    component.append(neighbor_id)
+                    stack.append(neighbor_id)
+        if len(component) > len(best):
+            best = component
+    return best
+
+
+def generate_queries(graph, num_queries: int, seed: int = 42) -> list:
+    """
+    Sorteia pares (origem, destino) distintos dentro da maior componente conexa da malha.
+    :return: lista de tuplas (id_origem, id_destino).
+    """
+    candidates = largest_component(graph)
+    if len(candidates) < 2:
+        return []
+    rng = random.Random(seed)
+    return [tuple(rng.sample(candidates, 2)) for _ in range(num_queries)]
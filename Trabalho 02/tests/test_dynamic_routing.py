@@ -0,0 +1,78 @@
+import random
+
+import pytest
+
+from algorithms import dijkstra, shortest_path_tree
+from dynamic_routing import DynamicShortestPath
+from synthetic_network import generate_road_network, generate_queries
+
+
+def _random_changes(graph, rng: random.Random, count: int):
+    """Aumenta o peso ou interdita 'count' arestas sorteadas (a heurística continua admissível)."""
+    for edge in rng.sample(graph.edges, count):
+        if graph.get_edge_weight(edge.id_1, edge.id_2) == float("inf"):
+            continue  # Par repetido já interditado nesta rodada
+        if rng.random() < 0.5:
+            graph.update_edge_weight(edge.id_1, edge.id_2, edge.weight * rng.uniform(1, 4))
+        else:
+            graph.remove_edge(edge.id_1, edge.id_2)
+
+
+@pytest.fixture
+def graph():
+    return generate_road_network(400, seed=7)
+
+
+def test_repair_matches_dijkstra(graph):
+    rng = random.Random(1)
+    routes = [(DynamicShortestPath(graph, start_id, goal_id), start_id, goal_id)
+              for start_id, goal_id in generate_queries(graph, 10, seed=3)]
+    for _ in range(5):
+        _random_changes(graph, rng, 15)
+        for route, start_id, goal_id in routes:
+            result, expected = route.route(), dijkstra(graph, start_id, goal_id)
+            assert (result is None) == (expected is None)
+            if expected is not None:
+                assert result["cost"] == expected["cost"]
+
+
+def test_repair_matches_shortest_path_tree(graph):
+    rng = random.Random(2)
+    source_id = graph.nodes[0].id
+    tree = DynamicShortestPath(graph, source_id)
+    tree.compute()
+    for _ in range(5):
+        _random_changes(graph, rng, 15)
+        tree.repair()
+        distances, _ = shortest_path_tree(graph, source_id)
+        for node in graph.nodes:
+            assert tree.distance(node.id) == pytest.approx(distances.get(node.id, float("inf")))
+
+
+def test_moving_target_matches_dijkstra(graph):
+    rng = random.Random(3)
+    goal_id, vehicle_id = generate_queries(graph, 1, seed=5)[0]
+    route = DynamicShortestPath(graph, goal_id, vehicle_id)
+    for _ in range(5):
+        result = route.route()
+        if result is None:
+            break
+        # O veículo avança um trecho pela rota e a malha muda
+        vehicle_id = result["path"][-2] if len(result["path"]) > 1 else vehicle_id
+        route.move_target(vehicle_id)
+        _random_changes(graph, rng, 15)
+        result, expected = route.route(), dijkstra(graph, goal_id, vehicle_id)
+        assert (result is None) == (expected is None)
+        if expected is not None:
+            assert result["cost"] == expected["cost"]
+
+
+def test_edge_updates_keep_edge_list_in_sync(graph):
+    edge = graph.edges[0]
+    graph.update_edge_weight(edge.id_2, edge.id_1, 123.0)
+    assert edge.weight == 123.0 and graph.get_edge_weight(edge.id_1, edge.id_2) == 123.0
+    graph.remove_edge(edge.id_1, edge.id_2)
+    assert edge not in graph.edges
+    assert graph.get_edge_weight(edge.id_1, edge.id_2) == float("inf")
+    with pytest.raises(KeyError):
+        graph.remove_edge(edge.id_1, edge.id_2)
@@ -0,0 +1,85 @@
+import random
+import sys
+
+import pytest
+
+from algorithms import (a_star, contraction_hierarchy_search, dijkstra, ida_star, partition_search,
+                        shortest_path_tree, sma_star)
+from contraction_hierarchies import ContractionHierarchy
+from parallel_sssp import DeltaSteppingSSSP
+from partitioning import MultiLevelPartition
+from synthetic_network import generate_road_network, generate_queries
+
+
+@pytest.fixture
+def graph():
+    return generate_road_network(400, seed=11)
+
+
+@pytest.fixture
+def queries(graph):
+    return generate_queries(graph, 15, seed=5)
+
+
+def _assert_same_costs(graph, queries, search, **options):
+    for start_id, goal_id in queries:
+        result, expected = search(graph, start_id, goal_id, **options), dijkstra(graph, start_id, goal_id)
+        assert (result is None) == (expected is None)
+        if expected is not None:
+            assert result["cost"] == pytest.approx(expected["cost"])
+
+
+def test_contraction_hierarchy_matches_dijkstra(graph, queries):
+    hierarchy = ContractionHierarchy.build(graph)
+    _assert_same_costs(graph, queries, contraction_hierarchy_search, hierarchy=hierarchy)
+
+
+def test_partition_matches_dijkstra(graph, queries):
+    partition = MultiLevelPartition(graph, cell_size=16)
+    _assert_same_costs(graph, queries, partition_search, partition=partition)
+
+
+def test_partition_update_matches_dijkstra(graph, queries):
+    partition = MultiLevelPartition(graph, cell_size=16)
+    rng = random.Random(4)
+    for _ in range(3):
+        # Aumenta o peso ou interdita arestas sorteadas e recustomiza só as células afetadas
+        for edge in rng.sample(graph.edges, 20):
+            if graph.get_edge_weight(edge.id_1, edge.id_2) == float("inf"):
+                continue
+            if rng.random() < 0.5:
+                graph.update_edge_weight(edge.id_1, edge.id_2, edge.weight * rng.uniform(0.5, 3))
+            else:
+                graph.remove_edge(edge.id_1, edge.id_2)
+        assert partition.update() > 0
+        _assert_same_costs(graph, queries, partition_search, partition=partition)
+
+
+@pytest.mark.parametrize("search", [dijkstra, a_star])
+def test_radix_heap_matches_dijkstra(graph, queries, search):
+    _assert_same_costs(graph, queries, search, queue="radix")
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_delta_stepping_matches_shortest_path_tree(graph, queries, workers):
+    frozen = graph.freeze()
+    # min_parallel_edges=0 leva todas as fases ao pool quando há mais de um worker
+    with DeltaSteppingSSSP(frozen, workers=workers, min_parallel_edges=0) as sssp:
+        for source_id, _ in queries[:5]:
+            distances, _ = sssp.shortest_path_tree(source_id)
+            expected, _ = shortest_path_tree(graph, source_id)
+            for i, node_id in enumerate(frozen.node_ids.tolist()):
+                assert distances[i] == pytest.approx(expected.get(node_id, float("inf")))
+
+
+def test_ida_star_matches_dijkstra(graph, queries):
+    _assert_same_costs(graph, queries, ida_star)
+
+
+@pytest.mark.parametrize("max_nodes", [sys.maxsize, 60])
+def test_sma_star_matches_dijkstra(graph, queries, max_nodes):
+    for start_id, goal_id in queries:
+        result = sma_star(graph, start_id, goal_id, max_nodes=max_nodes)
+        # Com orçamento curto, o SMA* pode desistir pelo limite de expansões; se encontra, é ótimo
+        if result is not None or max_nodes == sys.maxsize:
+            assert result["cost"] == pytest.approx(dijkstra(graph, start_id, goal_id)["cost"])
@@ -0,0 +1,40 @@
+import pytest
+
+from algorithms import HEURISTIC_MODE, a_star, dijkstra, heuristic, shortest_path_tree
+from main import build_graph
+from synthetic_network import generate_road_network, generate_queries
+
+
+@pytest.fixture(scope="module")
+def brazil_graph():
+    return build_graph()
+
+
+def test_heuristic_is_admissible_on_brazil_network(brazil_graph):
+    # Com a heurística padrão, nenhuma estimativa pode passar da distância real pela malha, a menos
+    # do arredondamento dos pesos das arestas (0,01 km, ver road_network.calculate_distance)
+    for goal in brazil_graph.nodes:
+        distances, _ = shortest_path_tree(brazil_graph, goal.id)
+        for node in brazil_graph.nodes:
+            if node.id in distances:
+                assert heuristic(node.coord, goal.coord, HEURISTIC_MODE) <= distances[node.id] + 0.005
+
+
+def test_a_star_matches_dijkstra_on_brazil_network(brazil_graph):
+    node_ids = [node.id for node in brazil_graph.nodes]
+    for start_id in node_ids[::7]:
+        for goal_id in node_ids:
+            if start_id == goal_id:
+                continue
+            result, expected = a_star(brazil_graph, start_id, goal_id), dijkstra(brazil_graph, start_id, goal_id)
+            assert (result is None) == (expected is None)
+            if expected is not None:
+                assert result["cost"] == pytest.approx(expected["cost"])
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_a_star_matches_dijkstra_on_synthetic_network(seed):
+    graph = generate_road_network(1000, seed=seed)
+    for start_id, goal_id in generate_queries(graph, 30, seed=seed):
+        result, expected = a_star(graph, start_id, goal_id), dijkstra(graph, start_id, goal_id)
+        assert result["cost"] == pytest.approx(expected["cost"])
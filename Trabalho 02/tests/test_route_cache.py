@@ -0,0 +1,42 @@
+import pytest
+
+from algorithms import dijkstra
+from route_cache import RouteCache
+from synthetic_network import generate_road_network, generate_queries
+
+
+@pytest.fixture
+def graph():
+    return generate_road_network(300, seed=13)
+
+
+def test_route_is_reused_until_graph_changes(graph):
+    cache = RouteCache(graph)
+    start_id, goal_id = generate_queries(graph, 1, seed=1)[0]
+    first = cache.route(dijkstra, start_id, goal_id)
+    assert cache.route(dijkstra, start_id, goal_id)["cost"] == first["cost"]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Encarecer uma aresta do caminho muda a versão do grafo: a rota antiga não pode ser reaproveitada
+    id_1, id_2 = first["path"][0], first["path"][1]
+    graph.update_edge_weight(id_1, id_2, graph.get_edge_weight(id_1, id_2) * 10)
+    result = cache.route(dijkstra, start_id, goal_id)
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert result["cost"] == dijkstra(graph, start_id, goal_id)["cost"]
+    assert result["cost"] > first["cost"]
+
+
+def test_shortest_path_trees_are_dropped_when_graph_changes(graph):
+    cache = RouteCache(graph)
+    (start_id, goal_id), (_, other_goal_id) = generate_queries(graph, 2, seed=2)
+    first = cache.shortest_path_route(start_id, goal_id)
+    cache.shortest_path_route(start_id, other_goal_id)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    graph.remove_edge(first["path"][-2], first["path"][-1])
+    result = cache.shortest_path_route(start_id, goal_id)
+    assert cache.misses == 2
+    expected = dijkstra(graph, start_id, goal_id)
+    assert (result is None) == (expected is None)
+    if expected is not None:
+        assert result["cost"] == pytest.approx(expected["cost"])
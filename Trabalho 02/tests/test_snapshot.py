@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from algorithms import dijkstra
+from graph import Graph, FrozenGraph
+from synthetic_network import generate_road_network, generate_queries
+
+
+@pytest.fixture
+def graph():
+    return generate_road_network(300, seed=17)
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_frozen_graph_round_trip(graph, tmp_path, mmap):
+    frozen = graph.freeze()
+    frozen.save(str(tmp_path / "malha"))
+    loaded = FrozenGraph.load(str(tmp_path / "malha"), mmap=mmap)
+
+    assert loaded.node_ids.tolist() == frozen.node_ids.tolist()
+    assert loaded.names == frozen.names
+    assert np.array_equal(loaded.coords, frozen.coords)
+    for node in graph.nodes:
+        assert sorted(loaded.get_neighbors(node.id)) == sorted(graph.get_neighbors(node.id))
+        assert loaded.get_node(node.id).coord == pytest.approx(node.coord)
+    for start_id, goal_id in generate_queries(graph, 10, seed=3):
+        assert dijkstra(loaded, start_id, goal_id)["cost"] == dijkstra(graph, start_id, goal_id)["cost"]
+
+
+def test_graph_round_trip_keeps_edge_list(graph, tmp_path):
+    graph.save(str(tmp_path / "malha"))
+    loaded = Graph.load(str(tmp_path / "malha"))
+
+    assert [(node.id, node.name, node.coord) for node in loaded.nodes] == \
+           [(node.id, node.name, node.coord) for node in graph.nodes]
+    assert [(edge.id_1, edge.id_2, edge.weight) for edge in loaded.edges] == \
+           [(edge.id_1, edge.id_2, edge.weight) for edge in graph.edges]
@@ -0,0 +1,126 @@
+import math
+import statistics
+import time
+
+# Há uma cópia idêntica deste módulo em Trabalho 01/timing.py: mantenha as duas em sincronia.
+
+# Relógios disponíveis: tempo de CPU do processo ou tempo de parede, ambos em nanossegundos
+CLOCKS = {
+    "cpu": time.process_time_ns,
+    "wall": time.perf_counter_ns,
+}
+
+# Valores críticos da distribuição t de Student (bicaudal, 95%) por graus de liberdade;
+# acima de 30 graus de liberdade usa-se a aproximação normal (1,96).
+_T_CRITICAL_95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306, 9: 2.262,
+    10: 2.228, 11: 2.201, 12: 2.179, 13: 2.160, 14: 2.145, 15: 2.131, 16: 2.120, 17: 2.110,
+    18: 2.101, 19: 2.093, 20: 2.086, 21: 2.080, 22: 2.074, 23: 2.069, 24: 2.064, 25: 2.060,
+    26: 2.056, 27: 2.052, 28: 2.048, 29: 2.045, 30: 2.042,
+}
+
+
+def _run(func, loops: int, clock) -> int:
+    """Tempo (ns) de 'loops' chamadas seguidas de func."""
+    start = clock()
+    for _ in range(loops):
+        func()
+    return clock() - start
+
+
+def _calibrate(func, clock, min_sample_time_ns: int):
+    """
+    Encontra o número de chamadas por amostra para que cada amostra dure pelo menos
+    min_sample_time_ns, seguindo a sequência 1, 2, 5, 10, 20, 50, ... (como o timeit.autorange).
+    Retorna (chamadas_por_amostra, tempo_da_ultima_medicao_ns).
+    """
+    base = 1
+    while True:
+        for multiplier in (1, 2, 5):
+            loops = base * multiplier
+            elapsed = _run(func, loops, clock)
+            if elapsed >= min_sample_time_ns:
+                return loops, elapsed
+        base *= 10
+
+
+def reject_outliers(samples: list) -> tuple:
+    """
+    Remove valores discrepantes pelas cercas de Tukey (fora de [Q1 - 1,5·IQR, Q3 + 1,5·IQR]).
+    Com menos de 4 amostras não há como estimar os quartis, e nada é removido.
+    :return: (amostras mantidas, quantidade removida)
+    """
+    if len(samples) < 4:
+        return list(samples), 0
+    q1, _, q3 = statistics.quantiles(samples, n=4)
+    iqr = q3 - q1
+    low, high = q1 - 1.5 * iqr, q3 + 1.5 * iqr
+    kept = [s for s in samples if low <= s <= high]
+    return kept, len(samples) - len(kept)
+
+
+def summarize(samples: list) -> dict:
+    """
+    Estatísticas de uma lista de tempos (s): média, desvio padrão, mediana, percentil 95 e
+    intervalo de confiança de 95% da média (t de Student).
+    """
+    n = len(samples)
+    mean = statistics.fmean(samples)
+    stdev = statistics.stdev(samples) if n > 1 else 0.0
+    p95 = statistics.quantiles(samples, n=20, method="inclusive")[-1] if n > 1 else samples[0]
+    margin = _T_CRITICAL_95.get(n - 1, 1.96) * stdev / math.sqrt(n) if n > 1 else 0.0
+    return {
+        "mean": mean,
+        "stdev": stdev,
+        "median": statistics.median(samples),
+        "p95": p95,
+        "ci_low": mean - margin,
+        "ci_high": mean + margin,
+        "samples": n,
+    }
+
+
+def _single_sample(elapsed_ns: int) -> dict:
+    """Estatísticas de uma medição única (chamadas longas)."""
+    stats = summarize([elapsed_ns / 1e9])
+    stats.update(outliers=0, loops=1)
+    return stats
+
+
+def measure(func, clock: str = "cpu", min_sample_time: float = 0.005, time_budget: float = 0.25,
+            min_samples: int = 5, max_samples: int = 50, warmup: int = 1) -> dict:
+    """
+    Mede o tempo de execução de func() (sem argumentos) com resolução de nanossegundos.
+    1. Aquecimento: 'warmup' chamadas descartadas (caches, tabelas preguiçosas etc.).
+    2. Calibração: cada amostra repete func até durar pelo menos min_sample_time segundos, para
+       que chamadas curtas não fiquem abaixo da resolução do relógio.
+    3. Amostragem: o número de amostras é ajustado para caber em time_budget segundos, entre
+       min_samples e max_samples; cada amostra é o tempo médio por chamada.
+    4. Valores discrepantes são removidos (cercas de Tukey) antes das estatísticas.
+    Se uma única chamada (inclusive a de aquecimento) já passa de time_budget, ela é a única
+    amostra: chamadas longas já são medidas com boa precisão relativa, e repeti-las só gastaria tempo.
+
+    :param clock: "cpu" (process_time_ns) ou "wall" (perf_counter_ns).
+    :return: dict com mean, stdev, median, p95, ci_low, ci_high (em segundos), samples (amostras
+             mantidas), outliers (amostras removidas) e loops (chamadas por amostra).
+    """
+    if clock not in CLOCKS:
+        raise ValueError(f"Relógio desconhecido: '{clock}'. Use um de {tuple(CLOCKS)}.")
+    read_clock = CLOCKS[clock]
+    budget_ns = time_budget * 1e9
+
+    for _ in range(warmup):
+        elapsed = _run(func, 1, read_clock)
+        if elapsed >= budget_ns:
+            return _single_sample(elapsed)
+
+    loops, elapsed = _calibrate(func, read_clock, int(min_sample_time * 1e9))
+    if loops == 1 and elapsed >= budget_ns:
+        return _single_sample(elapsed)
+
+    num_samples = int(min(max_samples, max(min_samples, budget_ns // max(elapsed, 1))))
+    samples = [_run(func, loops, read_clock) / loops / 1e9 for _ in range(num_samples)]
+    kept, outliers = reject_outliers(samples)
+    stats = summarize(kept)
+    stats.update(outliers=outliers, loops=loops)
+    return stats
@@ -0,0 +1,88 @@
+class _StampedMap:
+    """
+    Mapeamento {id_no: valor} sobre vetores pré-alocados (um por nó do grafo).
+    Cada posição guarda o número da "geração" em que foi escrita; valores de gerações
+    anteriores são tratados como ausentes. Assim, limpar o mapa entre consultas custa O(1)
+    (basta avançar a geração do workspace), em vez de O(V).
+    Implementa a parte da interface de dict usada pelos algoritmos: in, get, [] e []=.
+    """
+
+    __slots__ = ("_workspace", "_values", "_stamps")
+
+    def __init__(self, workspace, size: int):
+        self._workspace = workspace
+        self._values = [None] * size
+        self._stamps = [0] * size
+
+    def __contains__(self, node_id):
+        i = self._workspace.index.get(node_id)
+        return i is not None and self._stamps[i] == self._workspace.generation
+
+    def get(self, node_id, default=None):
+        i = self._workspace.index.get(node_id)
+        if i is None or self._stamps[i] != self._workspace.generation:
+            return default
+        return self._values[i]
+
+    def __getitem__(self, node_id):
+        i = self._workspace.index[node_id]
+        if self._stamps[i] != self._workspace.generation:
+            raise KeyError(node_id)
+        return self._values[i]
+
+    def __setitem__(self, node_id, value):
+        i = self._workspace.index[node_id]
+        self._values[i] = value
+        self._stamps[i] = self._workspace.generation
+
+
+class _StampedSet:
+    """Conjunto de nós com a mesma estratégia de geração do _StampedMap (in, add)."""
+
+    __slots__ = ("_workspace", "_stamps")
+
+    def __init__(self, workspace, size: int):
+        self._workspace = workspace
+        self._stamps = [0] * size
+
+    def __contains__(self, node_id):
+        i = self._workspace.index.get(node_id)
+        return i is not None and self._stamps[i] == self._workspace.generation
+
+    def add(self, node_id):
+        self._stamps[self._workspace.index[node_id]] = self._workspace.generation
+
+
+class SearchWorkspace:
+    """
+    Área de trabalho reutilizável para as buscas de algorithms.py.
+    Ligada a um grafo, usa índices densos (0..n-1) para os nós e mantém vetores pré-alocados
+    de custo, pai e visitados, que são "zerados" de forma preguiçosa por um contador de geração.
+    Útil em cenários com muitas consultas seguidas, onde montar dicionários e conjuntos do zero
+    (ou inicializar um custo para cada nó, O(V)) domina o tempo de consultas curtas.
+
+    Uso: passe workspace=ws para o algoritmo; cada chamada inicia uma nova geração.
+    Os mapas só valem até a próxima consulta que usar o mesmo workspace, e um workspace
+    não deve ser compartilhado entre threads.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+        # Mesma ordem de graph.nodes (no FrozenGraph, coincide com os índices densos do CSR)
+        self.index = {node.id: i for i, node in enumerate(graph.nodes)}
+        size = len(self.index)
+        self.generation = 0
+
+        # Estruturas da busca principal (ou "da frente", nas buscas bidirecionais)
+        self.distances = _StampedMap(self, size)
+        self.parents = _StampedMap(self, size)
+        self.closed = _StampedSet(self, size)
+        # Estruturas da busca "de trás", usadas pelas buscas bidirecionais
+        self.reverse_distances = _StampedMap(self, size)
+        self.reverse_parents = _StampedMap(self, size)
+        self.reverse_closed = _StampedSet(self, size)
+
+    def begin(self):
+        """Inicia uma nova consulta: invalida, em O(1), tudo o que foi escrito antes."""
+        self.generation += 1
+        return self